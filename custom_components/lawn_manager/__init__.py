@@ -1,45 +1,79 @@
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.dispatcher import async_dispatcher_send
-import asyncio
+from datetime import datetime, timedelta
 import logging
-
-from .const import DOMAIN, CHEMICALS, EQUIPMENT_STORAGE_KEY, get_storage_key, PLATFORMS
+import voluptuous as vol
+
+from .const import (
+    DOMAIN, RATE_OVERRIDE_MULTIPLIERS,
+    CONF_EQUIPMENT_SEEDED, CONF_HISTORY_BACKEND, HISTORY_BACKEND_JSON, HISTORY_BACKEND_SQLITE, HISTORY_BACKENDS,
+)
+from .day_rollover import async_stop_day_rollover
+from .due_events import async_get_due_event_engine, async_stop_due_event_engine
+from .equipment_store import async_get_equipment_store
+from .features import async_remove_disabled_platform_entities, zone_platforms
+from .product_catalog import async_get_product_catalog
+from .idempotency import (
+    bind_idempotency_key, duplicate_call_response, is_duplicate_call, release_idempotency_key,
+    release_record_idempotency_key,
+)
+from .signals import ZoneChangeSet, async_send_zone_update
+from .services import async_register_services
+from .records import ApplicationRecord, MowRecord, date_to_ordinal, epoch_now
+from .lazy_import import async_import_helper
+from .migrations import new_zone_data
+from .zone_registry import async_get_zone_entry, get_loaded_zone
+from .zone_storage import ZoneStore, async_get_zone_store
+from .history_helper import (
+    MOWING_HISTORY, APPLICATION_HISTORY, HistoryIndex, DerivedStateMaterializer, new_record_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
-STORAGE_KEY = "lawn_manager_data"
-STORAGE_VERSION = 1
-
-
-def get_zone_store_and_data(hass, entry_id):
-    """Get the shared Store and data dict for a zone from hass.data.
 
-    Returns (store, data) or (None, None) if not initialized yet.
-    """
-    zone_info = hass.data.get(DOMAIN, {}).get(entry_id)
-    if zone_info:
-        return zone_info["store"], zone_info["data"]
-    return None, None
+CONFIG_SCHEMA = vol.Schema(
+    {
+        vol.Optional(DOMAIN): vol.Schema({
+            vol.Optional(CONF_HISTORY_BACKEND, default=HISTORY_BACKEND_JSON): vol.In(HISTORY_BACKENDS),
+        }),
+    },
+    extra=vol.ALLOW_EXTRA,
+)
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    # sqlite3 is only imported when the SQLite backend is configured
+    if config.get(DOMAIN, {}).get(CONF_HISTORY_BACKEND) == HISTORY_BACKEND_SQLITE:
+        await (await async_import_helper(hass, "sqlite_history")).async_setup_sqlite_history(hass)
+    await async_get_product_catalog(hass).async_load()
+
+    # Services belong to the integration, not to a zone: register them once
+    # here and let each handler look up the zone it is called for.
+    _register_services(hass)
+    async_register_services(hass)
     return True
 
 
 async def _store_equipment_from_config(hass: HomeAssistant, entry: ConfigEntry):
-    """Store equipment from config flow into equipment storage."""
-    if "equipment_list" not in entry.data:
+    """Copy the equipment added in a zone's config flow into equipment storage, once.
+
+    The entry is marked as seeded afterwards, so later restarts neither
+    rewrite the store nor bring back equipment deleted since. Items that
+    are already stored keep their original created timestamp.
+    """
+    if not entry.data.get("equipment_list") or entry.data.get(CONF_EQUIPMENT_SEEDED):
         return
 
-    equipment_store = Store(hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
-    equipment_data = await equipment_store.async_load() or {}
+    equipment_store = async_get_equipment_store(hass)
+    equipment_data = await equipment_store.async_get()
 
+    new_equipment = {}
     for equipment in entry.data["equipment_list"]:
         equipment_id = equipment["id"]
-        equipment_data[equipment_id] = {
+        if equipment_id in equipment_data:
+            continue
+        new_equipment[equipment_id] = {
             "type": equipment["type"],
             "brand": equipment["brand"],
             "capacity": equipment["capacity"],
@@ -50,8 +84,8 @@ async def _store_equipment_from_config(hass: HomeAssistant, entry: ConfigEntry):
         }
         _LOGGER.info("Stored equipment from config: %s", equipment["friendly_name"])
 
-    await equipment_store.async_save(equipment_data)
-    async_dispatcher_send(hass, "lawn_manager_equipment_update")
+    await equipment_store.async_add(new_equipment)
+    hass.config_entries.async_update_entry(entry, data={**entry.data, CONF_EQUIPMENT_SEEDED: True})
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -61,65 +95,84 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     hass.data.setdefault(DOMAIN, {})
 
-    storage_key = get_storage_key(entry.entry_id)
-    store = Store(hass, STORAGE_VERSION, storage_key)
-    data = await store.async_load() or {}
-
-    if not data:
-        data = {
-            "last_mow": None,
-            "mowing_history": [],
-            "applications": {},
-            "application_history": [],
-        }
+    store = ZoneStore(hass, entry.entry_id)
+    data = await store.async_load()
+    if data is None:
+        data = new_zone_data()
         await store.async_save(data)
 
+    # Only the platforms the zone's features use; unload must match
+    platforms = zone_platforms(entry)
     hass.data[DOMAIN][entry.entry_id] = {
         "store": store,
         "data": data,
+        "index": HistoryIndex(data),
+        "materializer": DerivedStateMaterializer(data),
+        "platforms": platforms,
     }
 
-    await _register_services(hass)
-
-    from .services import async_register_services
-    await async_register_services(hass)
+    async_remove_disabled_platform_entities(hass, entry, platforms)
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    async_get_due_event_engine(hass).async_track_zone(entry)
+    history_rollup = await async_import_helper(hass, "history_rollup")
+    history_rollup.async_get_history_compactor(hass).async_track_zone(entry)
 
-    await asyncio.sleep(0.2)
-    async_dispatcher_send(hass, f"lawn_manager_update_{entry.entry_id}")
+    # Platform setup has added every entity by now; give them their first state
+    async_send_zone_update(hass, entry.entry_id)
 
     _LOGGER.info("Lawn Manager setup complete for %s", entry.title)
     return True
 
 
-async def _register_services(hass: HomeAssistant):
+@callback
+def _product_defaults(chemical_data: dict | None, method: str):
+    """(interval_days, default lb and oz per 1000 sqft, is liquid) for a catalog product, or fallbacks if unknown."""
+    if chemical_data is None:
+        return 30, 1.0, 16.0, False
+
+    interval = chemical_data.get("interval_days", 30)
+    if method.lower() == "sprayer" and "liquid_oz_per_1000sqft" in chemical_data:
+        default_amount_oz = chemical_data["liquid_oz_per_1000sqft"]
+        return interval, default_amount_oz / 16.0, default_amount_oz, True
+
+    default_amount_lb = chemical_data.get("amount_lb_per_1000sqft", 1.0)
+    return interval, default_amount_lb, round(default_amount_lb * 16, 2), False
+
+
+def _application_product_data(chemical_data: dict | None, method: str, zone_config) -> dict:
+    """Product fields of an applications[chem] summary; the per-application fields come from the newest record."""
+    interval, default_amount_lb, default_amount_oz, _ = _product_defaults(chemical_data, method)
+    return {
+        "interval_days": interval,
+        "default_amount_lb_per_1000sqft": default_amount_lb,
+        "default_amount_oz_per_1000sqft": default_amount_oz,
+        "lawn_size_sqft": zone_config.get("lawn_size_sqft", 1000),
+        "yard_zone": zone_config.get("yard_zone", "Unknown Zone"),
+    }
+
+
+def _register_services(hass: HomeAssistant):
 
     async def handle_log_lawn_activity(call: ServiceCall):
         application_date = call.data.get("application_date")
         cut_type = call.data.get("cut_type", "Regular Maintenance")
         height_of_cut = call.data.get("height_of_cut")
         zone_entry_id = call.data.get("_zone_entry_id") or call.data.get("zone")
+        idempotency_key = call.data.get("idempotency_key")
 
         if not zone_entry_id:
             _LOGGER.error("No zone entry ID provided")
             return
 
-        entries = hass.config_entries.async_entries(DOMAIN)
-        zone_exists = any(entry.entry_id == zone_entry_id for entry in entries)
-        if not zone_exists:
+        zone_entry = async_get_zone_entry(hass, zone_entry_id)
+        if not zone_entry:
             _LOGGER.error("Invalid zone ID: %s", zone_entry_id)
             return
-
-        store, data = get_zone_store_and_data(hass, zone_entry_id)
-        if not store:
-            zone_storage_key = get_storage_key(zone_entry_id)
-            store = Store(hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        zone_entry_id = zone_entry.entry_id
 
         if application_date:
             try:
-                from datetime import datetime, timedelta
                 provided_date = datetime.strptime(application_date, "%Y-%m-%d").date()
                 today = dt_util.now().date()
 
@@ -132,36 +185,44 @@ async def _register_services(hass: HomeAssistant):
                     _LOGGER.error("Cannot log lawn activity for date more than 1 year ago: %s", application_date)
                     return
 
-                mow_date_str = application_date
+                mow_date_str = provided_date.isoformat()
             except ValueError:
                 mow_date_str = dt_util.now().strftime("%Y-%m-%d")
         else:
             mow_date_str = dt_util.now().strftime("%Y-%m-%d")
 
-        data["last_mow"] = mow_date_str
+        if is_duplicate_call(hass, "log_lawn_activity", idempotency_key):
+            return duplicate_call_response("log_lawn_activity", idempotency_key)
 
-        if "mowing_history" not in data:
-            data["mowing_history"] = []
+        store, data = await async_get_zone_store(hass, zone_entry_id)
 
-        mow_record = {
-            "date": mow_date_str,
-            "cut_type": cut_type,
-            "timestamp": dt_util.now().isoformat()
-        }
-
-        if height_of_cut is not None:
-            mow_record["height_of_cut_inches"] = float(height_of_cut)
+        mow_record = MowRecord(
+            id=new_record_id(),
+            date_ordinal=date_to_ordinal(mow_date_str),
+            epoch=epoch_now(),
+            cut_type=cut_type,
+            height_of_cut_inches=float(height_of_cut) if height_of_cut is not None else None,
+        )
 
         data["mowing_history"].append(mow_record)
-        if len(data["mowing_history"]) > 50:
-            data["mowing_history"] = data["mowing_history"][-50:]
-
-        await store.async_save(data)
+        zone_info = get_loaded_zone(hass, zone_entry_id)
+        if zone_info:
+            zone_info["index"].add(MOWING_HISTORY, mow_record)
+
+        # Backdated entries only move last_mow if they are the newest mow
+        materializer = zone_info["materializer"] if zone_info else DerivedStateMaterializer(data)
+        materializer.record_added(MOWING_HISTORY, mow_record)
+
+        try:
+            await store.async_save(data)
+        except Exception:
+            release_idempotency_key(hass, "log_lawn_activity", idempotency_key)
+            raise
+        bind_idempotency_key(hass, "log_lawn_activity", idempotency_key, mow_record.id)
         _LOGGER.info("Lawn Activity logged: %s (%s%s)", mow_date_str, cut_type,
                     f" at {height_of_cut}\"" if height_of_cut else "")
 
-        signal_name = f"lawn_manager_update_{zone_entry_id}"
-        async_dispatcher_send(hass, signal_name)
+        async_send_zone_update(hass, zone_entry_id, ZoneChangeSet.mow_logged())
 
     async def handle_log_application(call: ServiceCall):
         selected = call.data.get("chemical_select")
@@ -172,6 +233,7 @@ async def _register_services(hass: HomeAssistant):
         custom_rate_unit = call.data.get("custom_rate_unit", "Multiplier (1.0x = default rate)")
         application_date = call.data.get("application_date")
         zone_entry_id = call.data.get("_zone_entry_id")
+        idempotency_key = call.data.get("idempotency_key")
 
         chemical = custom.strip() if custom else selected
 
@@ -183,15 +245,8 @@ async def _register_services(hass: HomeAssistant):
             _LOGGER.error("No zone entry ID provided")
             return
 
-        store, data = get_zone_store_and_data(hass, zone_entry_id)
-        if not store:
-            zone_storage_key = get_storage_key(zone_entry_id)
-            store = Store(hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
-
         if application_date:
             try:
-                from datetime import datetime, timedelta
                 provided_date = datetime.strptime(application_date, "%Y-%m-%d").date()
                 today = dt_util.now().date()
 
@@ -204,66 +259,37 @@ async def _register_services(hass: HomeAssistant):
                     _LOGGER.error("Cannot log application for date more than 1 year ago: %s", application_date)
                     return
 
-                application_date_str = application_date
+                application_date_str = provided_date.isoformat()
             except ValueError:
                 application_date_str = dt_util.now().strftime("%Y-%m-%d")
         else:
             application_date_str = dt_util.now().strftime("%Y-%m-%d")
 
-        if "applications" not in data:
-            data["applications"] = {}
-        elif isinstance(data["applications"], list):
-            applications = {app.get("chemical_name", f"Chemical {i}"): app
-                          for i, app in enumerate(data["applications"]) if isinstance(app, dict)}
-            data["applications"] = applications
-
-        entries = hass.config_entries.async_entries(DOMAIN)
-        zone_config = None
-        for entry in entries:
-            if entry.entry_id == zone_entry_id:
-                zone_config = entry.data
-                break
-
-        if not zone_config:
+        zone_entry = async_get_zone_entry(hass, zone_entry_id)
+        if not zone_entry:
             _LOGGER.error("Zone configuration not found for entry ID: %s", zone_entry_id)
             return
+        zone_config = zone_entry.data
+        zone_entry_id = zone_entry.entry_id
+
+        if is_duplicate_call(hass, "log_application", idempotency_key):
+            return duplicate_call_response("log_application", idempotency_key)
+
+        store, data = await async_get_zone_store(hass, zone_entry_id)
 
         lawn_size_sqft = zone_config.get("lawn_size_sqft", 1000)
         yard_zone = zone_config.get("yard_zone", "Unknown Zone")
 
-        if chemical not in CHEMICALS:
-            _LOGGER.warning("'%s' is not in the predefined chemical list. Logging anyway.", chemical)
-            interval = 30
-            default_amount_lb = 1.0
-            default_amount_oz = 16.0
-            is_liquid_application = False
-        else:
-            chemical_data = CHEMICALS[chemical]
-            interval = chemical_data["interval_days"]
-            is_liquid_application = (method.lower() == "sprayer" and "liquid_oz_per_1000sqft" in chemical_data)
-
-            if is_liquid_application:
-                default_amount_oz_per_1000 = chemical_data["liquid_oz_per_1000sqft"]
-                default_amount_lb_per_1000 = default_amount_oz_per_1000 / 16.0
-                default_amount_lb = default_amount_lb_per_1000
-                default_amount_oz = default_amount_oz_per_1000
-            else:
-                default_amount_lb_per_1000 = chemical_data.get("amount_lb_per_1000sqft", 1.0)
-                default_amount_lb = default_amount_lb_per_1000
-                default_amount_oz = round(default_amount_lb * 16, 2)
-
-        if rate_override == "Default":
-            rate_multiplier = 1.0
-            rate_description = "Default"
-        elif rate_override == "Light (50%)":
-            rate_multiplier = 0.5
-            rate_description = "Light (50%)"
-        elif rate_override == "Heavy (150%)":
-            rate_multiplier = 1.5
-            rate_description = "Heavy (150%)"
-        elif rate_override == "Extra Heavy (200%)":
-            rate_multiplier = 2.0
-            rate_description = "Extra Heavy (200%)"
+        catalog = async_get_product_catalog(hass)
+        chemical = catalog.resolve(chemical) or chemical
+        chemical_data = catalog.get(chemical)
+        if chemical_data is None:
+            _LOGGER.warning("'%s' is not in the product catalog. Logging anyway.", chemical)
+        interval, default_amount_lb, default_amount_oz, is_liquid_application = _product_defaults(chemical_data, method)
+
+        if rate_override in RATE_OVERRIDE_MULTIPLIERS:
+            rate_multiplier = RATE_OVERRIDE_MULTIPLIERS[rate_override]
+            rate_description = rate_override
         elif rate_override == "Custom":
             try:
                 if not custom_rate or custom_rate.strip() == "":
@@ -313,77 +339,169 @@ async def _register_services(hass: HomeAssistant):
             total_chemical_needed_lb = (applied_amount_lb_per_1000 * lawn_size_sqft) / 1000
             total_chemical_needed_oz = total_chemical_needed_lb * 16
 
-        application_data = {
-            "last_applied": application_date_str,
-            "interval_days": interval,
-            "default_amount_lb_per_1000sqft": default_amount_lb,
-            "default_amount_oz_per_1000sqft": default_amount_oz,
-            "applied_amount_lb_per_1000sqft": round(applied_amount_lb_per_1000, 4),
-            "applied_amount_oz_per_1000sqft": round(applied_amount_oz_per_1000, 3),
-            "rate_multiplier": rate_multiplier,
-            "rate_description": rate_description,
-            "method": method,
-            "application_type": "liquid" if is_liquid_application else "granular",
-            "lawn_size_sqft": lawn_size_sqft,
-            "total_chemical_needed_oz": round(total_chemical_needed_oz, 3),
-            "total_chemical_needed_lb": round(total_chemical_needed_lb, 4),
-            "yard_zone": yard_zone
-        }
-
-        data["applications"][chemical] = application_data
-
-        if "application_history" not in data:
-            data["application_history"] = []
-        data["application_history"].append({
-            "chemical": chemical,
-            "date": application_date_str,
-            "method": method,
-            "rate_description": rate_description,
-            "detail": f"{rate_description} via {method}",
-            "timestamp": dt_util.now().isoformat(),
-        })
-        if len(data["application_history"]) > 50:
-            data["application_history"] = data["application_history"][-50:]
-
-        await store.async_save(data)
+        # Product data always reflects the latest call; the per-application
+        # fields (last_applied, rate, amounts) come from the newest record.
+        data["applications"].setdefault(chemical, {}).update(
+            _application_product_data(chemical_data, method, zone_config)
+        )
+
+        application_record = ApplicationRecord(
+            id=new_record_id(),
+            date_ordinal=date_to_ordinal(application_date_str),
+            epoch=epoch_now(),
+            chemical=chemical,
+            method=method,
+            rate_description=rate_description,
+            detail=f"{rate_description} via {method}",
+            rate_multiplier=rate_multiplier,
+            application_type="liquid" if is_liquid_application else "granular",
+            applied_amount_lb_per_1000sqft=round(applied_amount_lb_per_1000, 4),
+            applied_amount_oz_per_1000sqft=round(applied_amount_oz_per_1000, 3),
+            total_chemical_needed_oz=round(total_chemical_needed_oz, 3),
+            total_chemical_needed_lb=round(total_chemical_needed_lb, 4),
+        )
+        data["application_history"].append(application_record)
+        zone_info = get_loaded_zone(hass, zone_entry_id)
+        if zone_info:
+            zone_info["index"].add(APPLICATION_HISTORY, application_record)
+
+        materializer = zone_info["materializer"] if zone_info else DerivedStateMaterializer(data)
+        materializer.record_added(APPLICATION_HISTORY, application_record)
+
+        try:
+            await store.async_save(data)
+        except Exception:
+            release_idempotency_key(hass, "log_application", idempotency_key)
+            raise
+        bind_idempotency_key(hass, "log_application", idempotency_key, application_record.id)
 
         _LOGGER.info("Application logged: %s in %s on %s via %s at %s rate (%.1fx) - %.3f oz needed",
                     chemical, yard_zone, application_date_str, method, rate_description, rate_multiplier, total_chemical_needed_oz)
 
-        signal_name = f"lawn_manager_update_{zone_entry_id}"
-        async_dispatcher_send(hass, signal_name)
+        async_send_zone_update(hass, zone_entry_id, ZoneChangeSet.application_logged(chemical))
+
+    def _resolve_history_record(call: ServiceCall):
+        """Look up the zone data, index and record addressed by a service call."""
+        zone_entry_id = call.data.get("zone")
+        record_id = call.data.get("record_id", "").strip()
+
+        zone_entry = async_get_zone_entry(hass, zone_entry_id)
+        zone_info = get_loaded_zone(hass, zone_entry.entry_id) if zone_entry else None
+        if not zone_info:
+            return None, {"error": f"Zone '{zone_entry_id}' is not loaded"}
+
+        found = zone_info["index"].get(record_id)
+        if not found:
+            return None, {"error": f"Record ID '{record_id}' not found"}
+
+        history_key, record = found
+        return (zone_entry.entry_id, zone_info, history_key, record), None
+
+    async def handle_update_activity(call: ServiceCall):
+        """Edit a logged mowing or application record in place."""
+        resolved, error = _resolve_history_record(call)
+        if error:
+            _LOGGER.error(error["error"])
+            return error
+        zone_entry_id, zone_info, history_key, record = resolved
+
+        changes = {}
+        if call.data.get("application_date"):
+            try:
+                new_date = datetime.strptime(str(call.data["application_date"]), "%Y-%m-%d").date()
+            except ValueError:
+                return {"error": f"Invalid date: {call.data['application_date']}"}
+            if new_date > dt_util.now().date():
+                return {"error": f"Cannot move activity to a future date: {new_date}"}
+            changes["date"] = new_date.strftime("%Y-%m-%d")
+
+        if history_key == MOWING_HISTORY:
+            if call.data.get("cut_type"):
+                changes["cut_type"] = call.data["cut_type"]
+            if call.data.get("height_of_cut") is not None:
+                changes["height_of_cut_inches"] = float(call.data["height_of_cut"])
+        else:
+            if call.data.get("chemical"):
+                # Same catalog lookup as log_application, but an edit must name a known product
+                chemical = async_get_product_catalog(hass).resolve(call.data["chemical"].strip())
+                if not chemical:
+                    return {"error": f"Chemical '{call.data['chemical']}' is not in the product catalog"}
+                changes["chemical"] = chemical
+            if call.data.get("method"):
+                changes["method"] = call.data["method"]
+                changes["detail"] = f"{record.get('rate_description', 'Default')} via {changes['method']}"
+
+        updated = record.with_changes(**changes)
+        if updated.get("chemical") != record.get("chemical") and updated.get("chemical") not in zone_info["data"]["applications"]:
+            # First record of this product in the zone: its summary needs the product data too
+            zone_info["data"]["applications"][updated["chemical"]] = _application_product_data(
+                async_get_product_catalog(hass).get(updated["chemical"]), updated.get("method", ""),
+                async_get_zone_entry(hass, zone_entry_id).data,
+            )
+        zone_info["index"].replace(record.id, updated)
+        zone_info["materializer"].record_changed(history_key, record, updated)
+        await zone_info["store"].async_save(zone_info["data"])
+
+        _LOGGER.info("Updated activity %s in zone %s", record.id, zone_entry_id)
+        async_send_zone_update(hass, zone_entry_id, ZoneChangeSet.history_edited(
+            history_key == MOWING_HISTORY, {record.get("chemical"), updated.get("chemical")} - {None}
+        ))
+        return {"record": updated.as_dict()}
+
+    async def handle_delete_activity(call: ServiceCall):
+        """Delete a logged mowing or application record."""
+        resolved, error = _resolve_history_record(call)
+        if error:
+            _LOGGER.error(error["error"])
+            return error
+        zone_entry_id, zone_info, history_key, record = resolved
+
+        zone_info["index"].remove(record.id)
+        zone_info["materializer"].record_changed(history_key, record, None)
+        await zone_info["store"].async_save(zone_info["data"])
+        release_record_idempotency_key(hass, record.id)
+
+        _LOGGER.info("Deleted activity %s from zone %s", record.id, zone_entry_id)
+        async_send_zone_update(hass, zone_entry_id, ZoneChangeSet.history_edited(
+            history_key == MOWING_HISTORY, {record.get("chemical")} - {None}
+        ))
+        return {"deleted": record.as_dict()}
 
     async def handle_reload(call: ServiceCall):
         _LOGGER.info("Reloading Lawn Manager integration...")
-        entry = next((e for e in hass.config_entries.async_entries(DOMAIN)), None)
-        if entry:
+        for entry in hass.config_entries.async_entries(DOMAIN):
             await hass.config_entries.async_reload(entry.entry_id)
 
-    if not hass.services.has_service(DOMAIN, "log_lawn_activity"):
-        hass.services.async_register(DOMAIN, "log_lawn_activity", handle_log_lawn_activity)
-
-    if not hass.services.has_service(DOMAIN, "log_application"):
-        hass.services.async_register(DOMAIN, "log_application", handle_log_application)
-
-    if not hass.services.has_service(DOMAIN, "reload"):
-        hass.services.async_register(DOMAIN, "reload", handle_reload)
+    hass.services.async_register(DOMAIN, "log_lawn_activity", handle_log_lawn_activity)
+    hass.services.async_register(DOMAIN, "log_application", handle_log_application)
+    hass.services.async_register(DOMAIN, "update_activity", handle_update_activity, supports_response=True)
+    hass.services.async_register(DOMAIN, "delete_activity", handle_delete_activity, supports_response=True)
+    hass.services.async_register(DOMAIN, "reload", handle_reload)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    zone_info = get_loaded_zone(hass, entry.entry_id)
+    platforms = zone_info["platforms"] if zone_info else zone_platforms(entry)
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
+        async_get_due_event_engine(hass).async_untrack_zone(entry.entry_id)
+        history_rollup = await async_import_helper(hass, "history_rollup")
+        history_rollup.async_get_history_compactor(hass).async_untrack_zone(entry.entry_id)
         hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)
+        if not any(get_loaded_zone(hass, other.entry_id) for other in hass.config_entries.async_entries(DOMAIN)):
+            # Last zone gone: no timers are needed until a zone is set up again
+            async_stop_day_rollover(hass)
+            async_stop_due_event_engine(hass)
     return unload_ok
 
 
 async def async_remove_entry(hass, entry):
-    zone_storage_key = get_storage_key(entry.entry_id)
-    main_store = Store(hass, STORAGE_VERSION, zone_storage_key)
-    await main_store.async_remove()
-
-    equipment_store = Store(hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
-    equipment_data = await equipment_store.async_load() or {}
-    if equipment_data:
-        await equipment_store.async_remove()
+    await ZoneStore(hass, entry.entry_id).async_remove()
+    history_archive = await async_import_helper(hass, "history_archive")
+    await history_archive.HistoryArchive(hass, entry.entry_id).async_remove()
+
+    # Equipment is shared by every zone, so it only goes with the last one
+    if not any(other.entry_id != entry.entry_id for other in hass.config_entries.async_entries(DOMAIN)):
+        await async_get_equipment_store(hass).async_clear()
 
     _LOGGER.info("Config entry removed - all Lawn Manager data cleaned up.")
@@ -1,14 +1,16 @@
 from datetime import datetime, timedelta
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.helpers.storage import Store
+from homeassistant.core import callback
 from homeassistant.util import dt as dt_util
 import logging
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, DEFAULT_MOW_INTERVAL, get_storage_key
+from .const import DOMAIN, DEFAULT_MOW_INTERVAL
+from .day_rollover import async_track_day_rollover
+from .signals import MOWING_CHANGES, change_affects, zone_update_signal
+from .zone_storage import async_load_zone_data
 
 _LOGGER = logging.getLogger(__name__)
-STORAGE_VERSION = 1
 
 
 async def async_setup_entry(hass, entry, async_add_entities):
@@ -26,43 +28,63 @@ class LawnDueSensor(BinarySensorEntity):
         self._attr_name = f"{yard_zone} Needs Mowing"
         self._mow_interval = mow_interval
         self._last_mow = None
-        zone_storage_key = get_storage_key(entry.entry_id)
-        self._store = Store(hass, STORAGE_VERSION, zone_storage_key)
+        self._is_due = False
         self._unsub_dispatcher = None
+        self._unsub_rollover = None
+        # Only changes when a mow is logged or the date changes
+        self._attr_should_poll = False
 
     async def async_added_to_hass(self):
-        signal_name = f"lawn_manager_update_{self._entry.entry_id}"
+        signal_name = zone_update_signal(self._entry.entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
+        self._unsub_rollover = async_track_day_rollover(self.hass, self._handle_day_rollover)
 
     async def async_will_remove_from_hass(self):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
+        if self._unsub_rollover:
+            self._unsub_rollover()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, *MOWING_CHANGES):
+            return
+        before = (self._last_mow, self._is_due)
         await self.async_update()
-        self.async_write_ha_state()
+        if (self._last_mow, self._is_due) != before:
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_day_rollover(self):
+        is_due = self._compute_is_due()
+        if is_due != self._is_due:
+            self._is_due = is_due
+            self.async_write_ha_state()
 
     async def async_update(self):
-        data = await self._store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self._entry.entry_id)
         try:
-            if data.get("last_mow"):
+            if data["last_mow"]:
                 self._last_mow = dt_util.as_local(
-                    datetime.strptime(data.get("last_mow"), "%Y-%m-%d")
+                    datetime.strptime(data["last_mow"], "%Y-%m-%d")
                 )
             else:
                 self._last_mow = None
         except Exception:
             self._last_mow = dt_util.now() - timedelta(days=self._mow_interval + 1)
+        self._is_due = self._compute_is_due()
 
-    @property
-    def is_on(self):
+    def _compute_is_due(self):
         if not self._last_mow:
             return False
         due_date = self._last_mow + timedelta(days=self._mow_interval)
         return dt_util.now().date() >= due_date.date()
 
+    @property
+    def is_on(self):
+        return self._is_due
+
     @property
     def extra_state_attributes(self):
         if not self._last_mow:
@@ -1,60 +1,96 @@
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.storage import Store
-from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.util import dt as dt_util
 import logging
+import time
 
-from .const import DOMAIN, CHEMICALS, EQUIPMENT_STORAGE_KEY, STORAGE_VERSION, get_storage_key
-from . import get_zone_store_and_data
+from .const import DOMAIN, BUTTON_PRESS_DEDUPE_SECONDS, CHEMICALS, EQUIPMENT_STORAGE_KEY, RATE_OVERRIDE_MULTIPLIERS, CONF_FEATURE_CHEMICALS, CONF_FEATURE_RATE_CALCULATOR
+from .rate_engine import async_get_rate_engine
+from .control_panel import (
+    ControlScope, async_add_shared_entities, async_add_zone_controls, async_remove_zone_controls, find_control_entity,
+    shared_control_zones, uses_shared_controls,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+CONTROL_SUFFIXES = ("log_mow", "log_chemical", "calculate_rate")
 
-def _find_zone_entity(hass, entry_id, domain_prefix, suffix):
-    for state in hass.states.async_all():
-        eid = state.entity_id
-        if eid.startswith(domain_prefix) and entry_id in eid and suffix in eid:
-            return eid
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+    if uses_shared_controls(entry):
+        async_remove_zone_controls(hass, entry, "button", CONTROL_SUFFIXES)
+        async_add_shared_entities(
+            hass, entry, "control_panel_button", async_add_entities,
+            lambda: _control_entities(hass, ControlScope.control_panel()),
+        )
+        return
+
+    async_add_zone_controls(
+        hass, entry, "button", CONTROL_SUFFIXES, async_add_entities, _control_entities(hass, ControlScope.for_zone(entry))
+    )
+
+
+def _control_entities(hass, scope):
+    entities = [LogMowButton(hass, scope)]
+    if scope.has_feature(CONF_FEATURE_CHEMICALS):
+        entities.append(LogChemicalButton(hass, scope))
+    if scope.has_feature(CONF_FEATURE_RATE_CALCULATOR):
+        entities.append(CalculateRateButton(hass, scope))
+    return entities
+
+
+def _control_state(hass, scope, platform, suffix):
+    """Current state of one of the scope's input controls, or None."""
+    entity_id = find_control_entity(hass, scope, platform, suffix)
+    return hass.states.get(entity_id) if entity_id else None
+
+
+def _target_entry(hass, scope):
+    """Zone a button press applies to: the button's own zone, or the panel's selection."""
+    if not scope.is_control_panel:
+        return scope.entry
+    zone_select = _control_state(hass, scope, "select", "zone_select")
+    zones = shared_control_zones(hass)
+    if zone_select and zone_select.state in zones:
+        return zones[zone_select.state]
+    _LOGGER.error("No zone selected on the control panel")
     return None
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
-    entities = [
-        LogMowButton(hass, entry),
-        LogChemicalButton(hass, entry),
-        CalculateRateButton(hass, entry),
-    ]
-    async_add_entities(entities)
+def _is_repeat_press(button, signature) -> bool:
+    """Whether a press repeats the button's previous one within BUTTON_PRESS_DEDUPE_SECONDS.
+
+    Only back-to-back presses collapse; pressing again later with the same
+    inputs logs another record, as the user meant it to.
+    """
+    now = time.monotonic()
+    previous = button._last_press
+    button._last_press = (signature, now)
+    return previous is not None and previous[0] == signature and now - previous[1] < BUTTON_PRESS_DEDUPE_SECONDS
 
 
 class LogMowButton(ButtonEntity):
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
+        self._last_press = None
         self._attr_name = "Log Lawn Activity"
-        self._attr_unique_id = f"{entry.entry_id}_log_mow"
+        self._attr_unique_id = scope.unique_id("log_mow")
         self._attr_icon = "mdi:grass"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Mowing",
-        }
+        return self._scope.device_info("Mowing")
 
     async def async_press(self):
-        eid = self._entry.entry_id
-        activity_type_entity = _find_zone_entity(self._hass, eid, "select.", "activity_type_selection")
-        height_of_cut_entity = _find_zone_entity(self._hass, eid, "number.", "height_of_cut")
-        application_date_entity = _find_zone_entity(self._hass, eid, "date.", "application_date")
-
-        activity_type = self._hass.states.get(activity_type_entity) if activity_type_entity else None
-        height_of_cut = self._hass.states.get(height_of_cut_entity) if height_of_cut_entity else None
-        application_date = self._hass.states.get(application_date_entity) if application_date_entity else None
+        entry = _target_entry(self._hass, self._scope)
+        if not entry:
+            return
+        eid = entry.entry_id
+        activity_type = _control_state(self._hass, self._scope, "select", "activity_type_selection")
+        height_of_cut = _control_state(self._hass, self._scope, "number", "height_of_cut")
+        application_date = _control_state(self._hass, self._scope, "date", "application_date")
 
         activity_type_value = activity_type.state if activity_type else "Regular Maintenance"
         height_of_cut_value = None
@@ -71,49 +107,39 @@ class LogMowButton(ButtonEntity):
             service_data["application_date"] = application_date_value
         if height_of_cut_value is not None:
             service_data["height_of_cut"] = height_of_cut_value
+        if _is_repeat_press(self, (eid, application_date_value, activity_type_value, height_of_cut_value)):
+            _LOGGER.debug("Ignoring repeated Log Lawn Activity press")
+            return
 
         await self._hass.services.async_call(DOMAIN, "log_lawn_activity", service_data, blocking=True)
 
-        # Force update all zone sensors
-        await _force_update_zone_sensors(self._hass, eid)
-
 
 class LogChemicalButton(ButtonEntity):
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
+        self._last_press = None
         self._attr_name = "Log Chemical Application"
-        self._attr_unique_id = f"{entry.entry_id}_log_chemical"
+        self._attr_unique_id = scope.unique_id("log_chemical")
         self._attr_icon = "mdi:flask-outline"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_press(self):
-        eid = self._entry.entry_id
-        chemical_select_entity = _find_zone_entity(self._hass, eid, "select.", "chemical_selection")
-        custom_chemical_entity = _find_zone_entity(self._hass, eid, "text.", "custom_chemical_name")
-        method_select_entity = _find_zone_entity(self._hass, eid, "select.", "application_method")
-        equipment_select_entity = _find_zone_entity(self._hass, eid, "select.", "equipment_select")
-        rate_override_entity = _find_zone_entity(self._hass, eid, "select.", "application_rate")
-        custom_rate_entity = _find_zone_entity(self._hass, eid, "text.", "custom_rate_multiplier")
-        custom_rate_unit_entity = _find_zone_entity(self._hass, eid, "select.", "custom_rate_unit")
-        application_date_entity = _find_zone_entity(self._hass, eid, "date.", "application_date")
-
-        chemical_select = self._hass.states.get(chemical_select_entity) if chemical_select_entity else None
-        custom_chemical = self._hass.states.get(custom_chemical_entity) if custom_chemical_entity else None
-        method_select = self._hass.states.get(method_select_entity) if method_select_entity else None
-        equipment_select = self._hass.states.get(equipment_select_entity) if equipment_select_entity else None
-        rate_override = self._hass.states.get(rate_override_entity) if rate_override_entity else None
-        custom_rate = self._hass.states.get(custom_rate_entity) if custom_rate_entity else None
-        custom_rate_unit = self._hass.states.get(custom_rate_unit_entity) if custom_rate_unit_entity else None
-        application_date = self._hass.states.get(application_date_entity) if application_date_entity else None
+        entry = _target_entry(self._hass, self._scope)
+        if not entry:
+            return
+        eid = entry.entry_id
+        chemical_select = _control_state(self._hass, self._scope, "select", "chemical_selection")
+        custom_chemical = _control_state(self._hass, self._scope, "text", "custom_chemical_name")
+        method_select = _control_state(self._hass, self._scope, "select", "method_select")
+        equipment_select = _control_state(self._hass, self._scope, "select", "equipment_select")
+        rate_override = _control_state(self._hass, self._scope, "select", "application_rate")
+        custom_rate = _control_state(self._hass, self._scope, "text", "custom_rate_multiplier")
+        custom_rate_unit = _control_state(self._hass, self._scope, "select", "custom_rate_unit")
+        application_date = _control_state(self._hass, self._scope, "date", "application_date")
 
         if equipment_select and equipment_select.state != "None":
             method = equipment_select.attributes.get("equipment_type", "sprayer").title()
@@ -143,39 +169,33 @@ class LogChemicalButton(ButtonEntity):
             "application_date": application_date.state if application_date else None,
             "_zone_entry_id": eid,
         }
+        if _is_repeat_press(self, tuple(service_data.values())):
+            _LOGGER.debug("Ignoring repeated Log Chemical Application press")
+            return
 
         await self._hass.services.async_call(DOMAIN, "log_application", service_data, blocking=True)
 
-        # Force update all zone sensors
-        await _force_update_zone_sensors(self._hass, eid)
-
 
 class CalculateRateButton(ButtonEntity):
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Calculate Application Rate"
-        self._attr_unique_id = f"{entry.entry_id}_calculate_rate"
+        self._attr_unique_id = scope.unique_id("calculate_rate")
         self._attr_icon = "mdi:calculator-variant"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_press(self):
-        eid = self._entry.entry_id
-        chemical_select_entity = _find_zone_entity(self._hass, eid, "select.", "chemical_selection")
-        custom_chemical_entity = _find_zone_entity(self._hass, eid, "text.", "custom_chemical_name")
-        equipment_select_entity = _find_zone_entity(self._hass, eid, "select.", "equipment_select")
-
-        chemical_select = self._hass.states.get(chemical_select_entity) if chemical_select_entity else None
-        custom_chemical = self._hass.states.get(custom_chemical_entity) if custom_chemical_entity else None
-        equipment_select = self._hass.states.get(equipment_select_entity) if equipment_select_entity else None
+        entry = _target_entry(self._hass, self._scope)
+        if not entry:
+            return
+        eid = entry.entry_id
+        chemical_select = _control_state(self._hass, self._scope, "select", "chemical_selection")
+        custom_chemical = _control_state(self._hass, self._scope, "text", "custom_chemical_name")
+        equipment_select = _control_state(self._hass, self._scope, "select", "equipment_select")
 
         selected_chemical = chemical_select.state if chemical_select else None
         custom_chemical_value = custom_chemical.state if custom_chemical else ""
@@ -195,26 +215,16 @@ class CalculateRateButton(ButtonEntity):
             _LOGGER.error("No equipment selected for rate calculation")
             return
 
-        zone = self._entry.data.get("yard_zone", "Unknown")
+        rate_select = _control_state(self._hass, self._scope, "select", "application_rate")
+        rate_override = rate_select.state if rate_select else "Default"
+        if rate_override not in RATE_OVERRIDE_MULTIPLIERS:
+            # Custom rates are entered per application; plan with the label rate
+            rate_override = "Default"
 
-        from .services import _calculate_rate_direct
-        result = await _calculate_rate_direct(self._hass, chemical, equipment_name, zone)
+        rate_engine = async_get_rate_engine(self._hass)
+        result = await rate_engine.async_calculate(chemical, equipment_name, entry.data, rate_override)
 
-        if result:
-            store, data = get_zone_store_and_data(self._hass, eid)
-            if not store:
-                zone_storage_key = get_storage_key(eid)
-                store = Store(self._hass, STORAGE_VERSION, zone_storage_key)
-                data = await store.async_load() or {}
-            data["last_rate_calculation"] = result
-            await store.async_save(data)
+        if await rate_engine.async_save_calculation(eid, result):
             _LOGGER.info("Rate calculation saved to storage for zone %s", eid)
-
-            async_dispatcher_send(self._hass, f"lawn_manager_update_{eid}")
         else:
-            _LOGGER.error("Rate calculation failed for %s / %s / %s", chemical, equipment_name, zone)
-
-
-async def _force_update_zone_sensors(hass, entry_id):
-    """Force update all lawn manager sensor entities for a zone via dispatcher signal."""
-    async_dispatcher_send(hass, f"lawn_manager_update_{entry_id}")
+            _LOGGER.error("Rate calculation failed for %s / %s: %s", chemical, equipment_name, result["error"])
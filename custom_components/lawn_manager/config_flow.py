@@ -1,10 +1,14 @@
 from homeassistant import config_entries
 import voluptuous as vol
 from homeassistant.data_entry_flow import FlowResult
-from homeassistant.helpers.storage import Store
 import uuid
 
-from .const import DOMAIN, GRASS_TYPE_LIST, EQUIPMENT_TYPES, EQUIPMENT_BRANDS, CAPACITY_UNITS, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY
+from .const import (
+    DOMAIN, GRASS_TYPE_LIST, EQUIPMENT_TYPES, EQUIPMENT_BRANDS, CAPACITY_UNITS,
+    CONF_SHARED_CONTROLS, CONF_MAX_CHEMICAL_SENSORS, CONF_CHEMICAL_RETENTION_DAYS, DEFAULT_MAX_CHEMICAL_SENSORS, DEFAULT_CHEMICAL_RETENTION_DAYS,
+    CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS, ZONE_FEATURES,
+)
+from .equipment_store import async_get_equipment_store
 
 
 MOW_INTERVAL_OPTIONS = {
@@ -163,8 +167,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_equipment(self, user_input=None) -> FlowResult:
         errors = {}
-        equipment_store = Store(self.hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
-        existing_equipment = await equipment_store.async_load() or {}
+        existing_equipment = await async_get_equipment_store(self.hass).async_get()
         has_existing = bool(existing_equipment)
 
         if user_input is not None:
@@ -302,6 +305,12 @@ class OptionsFlow(config_entries.OptionsFlow):
             new_data["grass_type"] = user_input.get("grass_type", new_data.get("grass_type", "Bermuda"))
             new_data["weather_entity"] = user_input.get("weather_entity", new_data.get("weather_entity", ""))
             new_data["rain_sensor"] = user_input.get("rain_sensor", new_data.get("rain_sensor", ""))
+            new_data[CONF_SHARED_CONTROLS] = user_input.get(CONF_SHARED_CONTROLS, False)
+            new_data[CONF_MAX_CHEMICAL_SENSORS] = user_input.get(CONF_MAX_CHEMICAL_SENSORS, DEFAULT_MAX_CHEMICAL_SENSORS)
+            new_data[CONF_CHEMICAL_RETENTION_DAYS] = user_input.get(CONF_CHEMICAL_RETENTION_DAYS, DEFAULT_CHEMICAL_RETENTION_DAYS)
+            new_data[CONF_HISTORY_RETENTION_DAYS] = user_input.get(CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS)
+            for feature in ZONE_FEATURES:
+                new_data[feature] = user_input.get(feature, True)
 
             self.hass.config_entries.async_update_entry(entry, data=new_data)
             await self.hass.config_entries.async_reload(entry.entry_id)
@@ -359,6 +368,19 @@ class OptionsFlow(config_entries.OptionsFlow):
                 rain_options_dict
             )
 
+        schema_dict[vol.Optional(CONF_SHARED_CONTROLS, default=current.get(CONF_SHARED_CONTROLS, False))] = bool
+        schema_dict[vol.Optional(
+            CONF_MAX_CHEMICAL_SENSORS, default=current.get(CONF_MAX_CHEMICAL_SENSORS, DEFAULT_MAX_CHEMICAL_SENSORS)
+        )] = vol.All(vol.Coerce(int), vol.Range(min=1, max=200))
+        schema_dict[vol.Optional(
+            CONF_CHEMICAL_RETENTION_DAYS, default=current.get(CONF_CHEMICAL_RETENTION_DAYS, DEFAULT_CHEMICAL_RETENTION_DAYS)
+        )] = vol.All(vol.Coerce(int), vol.Range(min=7, max=3650))
+        schema_dict[vol.Optional(
+            CONF_HISTORY_RETENTION_DAYS, default=current.get(CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS)
+        )] = vol.All(vol.Coerce(int), vol.Range(min=90, max=3650))
+        for feature in ZONE_FEATURES:
+            schema_dict[vol.Optional(feature, default=current.get(feature, True))] = bool
+
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(schema_dict),
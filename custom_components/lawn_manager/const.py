@@ -11,17 +11,84 @@ CONF_MOW_INTERVAL = "mow_interval"
 DEFAULT_NAME = "Lawn Manager"
 DEFAULT_MOW_INTERVAL = 7
 
-# STORAGE_KEY = "lawn_manager_data" # OLD - shared across all zones
-# Now we need zone-specific storage - use get_storage_key(entry_id) function instead
+# Shared across all zones in early versions; adopted by the first zone loaded
+# without data (see ZoneStore). Zones now use get_storage_key(entry_id)
+LEGACY_STORAGE_KEY = "lawn_manager_data"
 EQUIPMENT_STORAGE_KEY = "lawn_manager_equipment"
 CUSTOM_PRODUCTS_STORAGE_KEY = "lawn_manager_custom_products"
 MAINTENANCE_LOG_STORAGE_KEY = "lawn_manager_maintenance_log"
+MAINTENANCE_LOG_MAX_ENTRIES = 200
 STORAGE_VERSION = 1
+# Zone state and history files; bumped with a step in migrations.py
+ZONE_STORAGE_VERSION = 2
+
+# configuration.yaml option choosing where history is kept. "sqlite" puts
+# every zone's history and the maintenance log in one database under .storage
+CONF_HISTORY_BACKEND = "history_backend"
+HISTORY_BACKEND_JSON = "json"
+HISTORY_BACKEND_SQLITE = "sqlite"
+HISTORY_BACKENDS = [HISTORY_BACKEND_JSON, HISTORY_BACKEND_SQLITE]
+SQLITE_HISTORY_FILENAME = "lawn_manager_history.db"
+
+# Keys for integration-level objects kept in hass.data[DOMAIN] next to the zones
+DATA_IDEMPOTENCY = "idempotency"
+DATA_DAY_ROLLOVER = "day_rollover"
+DATA_DUE_EVENTS = "due_events"
+DATA_SHARED_ENTITIES = "shared_entities"
+DATA_RATE_ENGINE = "rate_engine"
+DATA_PRODUCT_CATALOG = "product_catalog"
+DATA_HISTORY_COMPACTOR = "history_compactor"
+DATA_EQUIPMENT_STORE = "equipment_store"
+DATA_SQLITE_HISTORY = "sqlite_history"
+
+# Set on a zone's entry once its config flow equipment is in the equipment store
+CONF_EQUIPMENT_SEEDED = "equipment_seeded"
+
+# Zone option: use the integration-wide control panel instead of per-zone controls
+CONF_SHARED_CONTROLS = "shared_controls"
+
+# Zone options bounding the per-chemical sensors: at most this many, and only
+# for products applied within the retention window
+CONF_MAX_CHEMICAL_SENSORS = "max_chemical_sensors"
+CONF_CHEMICAL_RETENTION_DAYS = "chemical_retention_days"
+DEFAULT_MAX_CHEMICAL_SENSORS = 20
+DEFAULT_CHEMICAL_RETENTION_DAYS = 365
+
+# Zone options switching feature groups on or off (all on unless set). Platforms
+# and entities of a disabled feature are not set up at all; see features.py
+CONF_FEATURE_CHEMICALS = "feature_chemicals"
+CONF_FEATURE_RATE_CALCULATOR = "feature_rate_calculator"
+CONF_FEATURE_CONTROLS = "feature_controls"
+ZONE_FEATURES = [CONF_FEATURE_CHEMICALS, CONF_FEATURE_RATE_CALCULATOR, CONF_FEATURE_CONTROLS]
+
+# Zone option: mow and application records older than this are rolled up
+# into monthly summaries by the background compaction
+CONF_HISTORY_RETENTION_DAYS = "history_retention_days"
+DEFAULT_HISTORY_RETENTION_DAYS = 730
+
+# Periods get_activity_history can count mows and applications by
+GROUP_BY_PERIODS = ("week", "month")
+
+# Events fired when a mow, chemical re-application or seasonal window comes due
+EVENT_DUE = f"{DOMAIN}_due"
+EVENT_OVERDUE = f"{DOMAIN}_overdue"
+
+# Duplicate suppression for the logging services
+IDEMPOTENCY_TTL_SECONDS = 3600
+IDEMPOTENCY_MAX_KEYS = 1024
+# Identical log button presses this close together are one press (double taps, flaky dashboards)
+BUTTON_PRESS_DEDUPE_SECONDS = 5
 
 # Equipment management constants
 EQUIPMENT_TYPES = ["sprayer", "spreader"]
 EQUIPMENT_BRANDS = ["Chapin", "Solo", "Echo", "Husqvarna", "Craftsman", "Ryobi", "Scott's", "Earthway", "Agri-Fab", "Other"]
 CAPACITY_UNITS = ["gallons", "liters", "pounds", "kg"]
+LITERS_PER_GALLON = 3.78541
+POUNDS_PER_KG = 2.20462
+
+# Application rate overrides and the rate engine's result cache
+RATE_OVERRIDE_MULTIPLIERS = {"Default": 1.0, "Light (50%)": 0.5, "Heavy (150%)": 1.5, "Extra Heavy (200%)": 2.0}
+RATE_CACHE_MAX_ENTRIES = 256
 
 GRASS_TYPES = {
     "Bermuda": {"season": "warm", "peak_months": [5, 6, 7, 8, 9], "dormant_months": [11, 12, 1, 2]},
@@ -35,6 +102,25 @@ GRASS_TYPES = {
     "Custom": {"season": "unknown", "peak_months": [], "dormant_months": []},  # Placeholder for custom grass
 }
 
+
+def grass_info_for(grass_type: str) -> dict:
+    """Growth profile for a grass type, including 'Custom: name (season)' types."""
+    if grass_type.startswith("Custom:"):
+        if "warm" in grass_type.lower():
+            return {"season": "warm", "peak_months": [5, 6, 7, 8, 9], "dormant_months": [11, 12, 1, 2]}
+        elif "cool" in grass_type.lower():
+            return {"season": "cool", "peak_months": [3, 4, 5, 9, 10, 11], "dormant_months": [7, 8]}
+        else:
+            return {"season": "transition", "peak_months": [4, 5, 6, 9, 10], "dormant_months": [1, 2, 7, 8]}
+    return GRASS_TYPES.get(grass_type, GRASS_TYPES["Bermuda"])
+
+
+# First month of each pre-emergent window by grass season
+PRE_EMERGENT_WINDOW_START_MONTHS = {
+    "warm": (1, 8),
+    "cool": (2, 9),
+}
+
 # For backward compatibility
 GRASS_TYPE_LIST = list(GRASS_TYPES.keys())
 
@@ -42,6 +128,10 @@ def get_storage_key(entry_id: str) -> str:
     """Get zone-specific storage key to ensure proper zone isolation."""
     return f"lawn_manager_data_{entry_id}"
 
+def get_history_storage_key(entry_id: str) -> str:
+    """Storage key for a zone's mowing and application history."""
+    return f"lawn_manager_history_{entry_id}"
+
 CHEMICALS = {
     "Fertilizer 10-10-10": {
         "interval_days": 30,
@@ -0,0 +1,143 @@
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DOMAIN, DATA_SHARED_ENTITIES, CONF_SHARED_CONTROLS, CONF_FEATURE_CONTROLS
+from .features import zone_has_feature, zone_uses_chemical_inputs
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTROL_PANEL_SCOPE_ID = "control_panel"
+CONTROL_PANEL_NAME = "Lawn Control Panel"
+SIGNAL_CONTROL_PANEL_UPDATE = "lawn_manager_control_panel_update"
+
+
+def uses_shared_controls(entry: ConfigEntry) -> bool:
+    return bool(entry.data.get(CONF_SHARED_CONTROLS, False))
+
+
+class ControlScope:
+    """Where a set of input controls and log buttons lives.
+
+    Either one zone (the default, one set of controls per zone device) or
+    the shared control panel, whose controls act on the zone picked in its
+    zone selector.
+    """
+
+    def __init__(self, scope_id: str, name: str, entry: ConfigEntry | None = None):
+        self.scope_id = scope_id
+        self.name = name
+        self.entry = entry
+
+    @classmethod
+    def for_zone(cls, entry: ConfigEntry) -> "ControlScope":
+        return cls(entry.entry_id, entry.data.get("yard_zone", "Lawn Manager"), entry)
+
+    @classmethod
+    def control_panel(cls) -> "ControlScope":
+        return cls(CONTROL_PANEL_SCOPE_ID, CONTROL_PANEL_NAME)
+
+    @property
+    def is_control_panel(self) -> bool:
+        return self.entry is None
+
+    def has_feature(self, feature: str) -> bool:
+        """The control panel serves every zone, so it always has the full set of controls."""
+        return self.is_control_panel or zone_has_feature(self.entry, feature)
+
+    @property
+    def uses_chemical_inputs(self) -> bool:
+        return self.is_control_panel or zone_uses_chemical_inputs(self.entry)
+
+    def unique_id(self, suffix: str) -> str:
+        return f"{self.scope_id}_{suffix}"
+
+    def device_info(self, model: str | None = None) -> dict:
+        info = {
+            "identifiers": {(DOMAIN, self.scope_id)},
+            "name": self.name,
+            "manufacturer": "Lawn Manager",
+        }
+        if model:
+            info["model"] = model
+        return info
+
+
+def find_control_entity(hass: HomeAssistant, scope: ControlScope, platform: str, suffix: str) -> str | None:
+    """Entity ID of one of a scope's controls, looked up by unique ID."""
+    return er.async_get(hass).async_get_entity_id(platform, DOMAIN, scope.unique_id(suffix))
+
+
+def shared_control_zones(hass: HomeAssistant) -> dict:
+    """Zone name -> config entry for every zone using the shared control panel."""
+    return {
+        entry.data.get("yard_zone", entry.title): entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if uses_shared_controls(entry) and zone_has_feature(entry, CONF_FEATURE_CONTROLS)
+    }
+
+
+def _shared_entity_owners(hass: HomeAssistant, key: str) -> dict:
+    shared = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SHARED_ENTITIES, {})
+    return shared.setdefault(key, {"owner": None, "adders": {}, "factory": None})
+
+
+@callback
+def async_add_shared_entities(hass: HomeAssistant, entry: ConfigEntry, key: str, async_add_entities, factory) -> None:
+    """Add integration-wide entities once, from whichever zone loads first.
+
+    Entities have to belong to some config entry's platform. The first zone
+    to set up owns them; when the owner unloads, the next loaded zone that
+    registered for the same key adopts them by calling factory() again.
+    """
+    owners = _shared_entity_owners(hass, key)
+    owners["adders"][entry.entry_id] = async_add_entities
+    owners["factory"] = factory
+    entry.async_on_unload(lambda: _async_release_shared_entities(hass, entry.entry_id, key))
+
+    if owners["owner"] is None:
+        owners["owner"] = entry.entry_id
+        async_add_entities(factory(), update_before_add=True)
+    async_dispatcher_send(hass, SIGNAL_CONTROL_PANEL_UPDATE)
+
+
+@callback
+def _async_release_shared_entities(hass: HomeAssistant, entry_id: str, key: str) -> None:
+    owners = _shared_entity_owners(hass, key)
+    owners["adders"].pop(entry_id, None)
+    if owners["owner"] == entry_id:
+        owners["owner"] = None
+        for next_entry_id, async_add_entities in owners["adders"].items():
+            _LOGGER.debug("Shared %s entities moving to zone %s", key, next_entry_id)
+            owners["owner"] = next_entry_id
+            async_add_entities(owners["factory"](), update_before_add=True)
+            break
+    async_dispatcher_send(hass, SIGNAL_CONTROL_PANEL_UPDATE)
+
+
+@callback
+def async_remove_zone_controls(hass: HomeAssistant, entry: ConfigEntry, platform: str, suffixes) -> None:
+    """Drop a zone's own controls from the entity registry.
+
+    Used when a zone switches to the shared control panel, so the per-zone
+    entities do not linger as unavailable.
+    """
+    registry = er.async_get(hass)
+    scope = ControlScope.for_zone(entry)
+    for suffix in suffixes:
+        entity_id = registry.async_get_entity_id(platform, DOMAIN, scope.unique_id(suffix))
+        if entity_id:
+            registry.async_remove(entity_id)
+
+
+@callback
+def async_add_zone_controls(hass: HomeAssistant, entry: ConfigEntry, platform: str, suffixes, async_add_entities, entities) -> None:
+    """Add a zone's own controls and drop the registry entries of those its features leave out."""
+    scope = ControlScope.for_zone(entry)
+    added = {entity.unique_id for entity in entities}
+    async_remove_zone_controls(hass, entry, platform, [s for s in suffixes if scope.unique_id(s) not in added])
+    if entities:
+        async_add_entities(entities)
@@ -4,36 +4,44 @@ from homeassistant.config_entries import ConfigEntry
 import logging
 from datetime import date
 
-from .const import DOMAIN
+from .control_panel import ControlScope, async_add_shared_entities, async_remove_zone_controls, uses_shared_controls
 
 _LOGGER = logging.getLogger(__name__)
 
+CONTROL_SUFFIXES = ("application_date",)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up date entities for Lawn Manager."""
-    entities = [
-        ApplicationDateEntity(hass, entry),
-    ]
-    async_add_entities(entities)
+    if uses_shared_controls(entry):
+        async_remove_zone_controls(hass, entry, "date", CONTROL_SUFFIXES)
+        async_add_shared_entities(
+            hass, entry, "control_panel_date", async_add_entities,
+            lambda: _control_entities(hass, ControlScope.control_panel()),
+        )
+        return
+
+    async_add_entities(_control_entities(hass, ControlScope.for_zone(entry)))
+
+
+def _control_entities(hass, scope):
+    return [ApplicationDateEntity(hass, scope)]
 
 
 class ApplicationDateEntity(DateEntity):
     """Date entity for application date - set to today or a past date to back-log activities."""
 
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Activity Date"
-        self._attr_unique_id = f"{entry.entry_id}_application_date"
+        self._attr_unique_id = scope.unique_id("application_date")
         self._attr_native_value = date.today()
         self._attr_icon = "mdi:calendar"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-        }
+        return self._scope.device_info()
 
     async def async_set_value(self, value: date) -> None:
         self._attr_native_value = value
@@ -0,0 +1,76 @@
+import logging
+from typing import Callable
+
+from homeassistant.core import HomeAssistant, callback, CALLBACK_TYPE
+from homeassistant.helpers.event import async_track_time_change
+
+from .const import DOMAIN, DATA_DAY_ROLLOVER
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class DayRolloverScheduler:
+    """Single midnight timer shared by every zone.
+
+    Entities whose state only changes with the date (days since applied,
+    days until due, needs mowing) register a callback here instead of
+    polling. At local midnight every callback runs once, and each one
+    writes its state only if the new day actually changed it.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._listeners = set()
+        self._unsub_timer = None
+
+    @callback
+    def async_start(self) -> None:
+        if self._unsub_timer is None:
+            self._unsub_timer = async_track_time_change(
+                self.hass, self._async_handle_midnight, hour=0, minute=0, second=0
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+    @callback
+    def async_add_listener(self, action: Callable[[], None]) -> CALLBACK_TYPE:
+        """Run action at every local midnight. Returns a function that removes it."""
+        self._listeners.add(action)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.discard(action)
+
+        return remove_listener
+
+    @callback
+    def _async_handle_midnight(self, now) -> None:
+        _LOGGER.debug("Day rollover at %s for %d listeners", now, len(self._listeners))
+        for action in list(self._listeners):
+            try:
+                action()
+            except Exception:
+                _LOGGER.exception("Error in Lawn Manager day rollover listener")
+
+
+@callback
+def async_track_day_rollover(hass: HomeAssistant, action: Callable[[], None]) -> CALLBACK_TYPE:
+    """Register action with the integration's midnight scheduler."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_DAY_ROLLOVER not in domain_data:
+        domain_data[DATA_DAY_ROLLOVER] = DayRolloverScheduler(hass)
+    scheduler = domain_data[DATA_DAY_ROLLOVER]
+    scheduler.async_start()
+    return scheduler.async_add_listener(action)
+
+
+@callback
+def async_stop_day_rollover(hass: HomeAssistant) -> None:
+    """Stop the midnight scheduler and drop it; the next listener creates a new one."""
+    scheduler = hass.data.get(DOMAIN, {}).pop(DATA_DAY_ROLLOVER, None)
+    if scheduler:
+        scheduler.async_stop()
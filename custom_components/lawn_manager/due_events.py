@@ -0,0 +1,215 @@
+import heapq
+import itertools
+import logging
+from datetime import date, datetime, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN, DATA_DUE_EVENTS, DEFAULT_MOW_INTERVAL, EVENT_DUE, EVENT_OVERDUE, PRE_EMERGENT_WINDOW_START_MONTHS,
+    grass_info_for,
+)
+from .signals import HISTORY_CHANGES, change_affects, zone_update_signal
+from .zone_registry import get_loaded_zone
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stale heap entries are dropped lazily; compact once they outnumber live ones
+_COMPACT_MIN_SIZE = 64
+
+
+class DueEventEngine:
+    """Fires lawn_manager_due / lawn_manager_overdue events at due transitions.
+
+    Upcoming deadlines for every zone (mowing, each chemical's next_due and
+    pre-emergent window openings) live in one min-heap ordered by time, and a
+    single timer is armed for the earliest one. When a zone's data changes its
+    generation is bumped and its deadlines are pushed again; entries from an
+    older generation are skipped when they reach the top of the heap. A zone
+    is also refreshed after one of its deadlines fires, which queues the
+    deadlines that only come into view as time passes, such as the next
+    pre-emergent window opening.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._heap = []
+        self._sequence = itertools.count()
+        self._generations = {}
+        self._live_counts = {}
+        self._zone_unsubs = {}
+        self._unsub_timer = None
+        self._armed_for = None
+
+    @callback
+    def async_track_zone(self, entry: ConfigEntry) -> None:
+        """Start tracking a zone's deadlines and refresh them on every update."""
+        self.async_untrack_zone(entry.entry_id)
+
+        @callback
+        def _handle_update(change=None):
+            if change_affects(change, *HISTORY_CHANGES):
+                self.async_refresh_zone(entry)
+
+        self._zone_unsubs[entry.entry_id] = async_dispatcher_connect(
+            self.hass, zone_update_signal(entry.entry_id), _handle_update
+        )
+        self.async_refresh_zone(entry)
+
+    @callback
+    def async_untrack_zone(self, entry_id: str) -> None:
+        """Stop tracking a zone; its queued deadlines become stale."""
+        unsub = self._zone_unsubs.pop(entry_id, None)
+        if unsub:
+            unsub()
+        self._generations[entry_id] = self._generations.get(entry_id, 0) + 1
+        self._live_counts.pop(entry_id, None)
+
+    @callback
+    def async_refresh_zone(self, entry: ConfigEntry) -> None:
+        """Replace a zone's queued deadlines with ones computed from its current data."""
+        entry_id = entry.entry_id
+        generation = self._generations.get(entry_id, 0) + 1
+        self._generations[entry_id] = generation
+
+        now = dt_util.now()
+        count = 0
+        for when, event_type, event_data in self._zone_deadlines(entry):
+            if when > now:
+                heapq.heappush(self._heap, (when, next(self._sequence), entry_id, generation, event_type, event_data))
+                count += 1
+        self._live_counts[entry_id] = count
+
+        if len(self._heap) > max(_COMPACT_MIN_SIZE, 2 * sum(self._live_counts.values())):
+            self._compact()
+        self._arm_timer()
+
+    def _zone_deadlines(self, entry: ConfigEntry):
+        """Yield (when, event_type, event_data) for each upcoming deadline of a zone."""
+        zone_info = get_loaded_zone(self.hass, entry.entry_id)
+        if not zone_info:
+            return
+        data = zone_info["data"]
+        zone = entry.data.get("yard_zone", "Lawn")
+        base = {"entry_id": entry.entry_id, "zone": zone}
+
+        last_mow = _parse_date(data["last_mow"])
+        if last_mow:
+            due = last_mow + timedelta(days=entry.data.get("mow_interval", DEFAULT_MOW_INTERVAL))
+            yield from _due_and_overdue(due, {**base, "type": "mow"})
+
+        for chemical, summary in data["applications"].items():
+            last_applied = _parse_date(summary.get("last_applied"))
+            if not last_applied:
+                continue
+            due = last_applied + timedelta(days=summary.get("interval_days", 30))
+            yield from _due_and_overdue(due, {**base, "type": "chemical", "chemical": chemical})
+
+        opening = _next_pre_emergent_opening(entry.data.get("grass_type", "Bermuda"), dt_util.now().date())
+        last_pre_emergent = _parse_date(data["applications"].get("Weed Preventer", {}).get("last_applied"))
+        if last_pre_emergent and opening and (opening - last_pre_emergent).days <= 90:
+            # Same 90-day rule the seasonal pre-emergent recommendation uses
+            opening = None
+        if opening:
+            yield (
+                dt_util.start_of_local_day(opening),
+                EVENT_DUE,
+                {**base, "type": "pre_emergent_window", "due_date": opening.isoformat()},
+            )
+
+    def _compact(self) -> None:
+        self._heap = [item for item in self._heap if self._generations.get(item[2]) == item[3]]
+        heapq.heapify(self._heap)
+
+    @callback
+    def _arm_timer(self) -> None:
+        """Keep exactly one timer armed for the earliest live deadline."""
+        while self._heap and self._generations.get(self._heap[0][2]) != self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+        next_when = self._heap[0][0] if self._heap else None
+        if next_when == self._armed_for:
+            return
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_for = next_when
+        if next_when is not None:
+            self._unsub_timer = async_track_point_in_time(self.hass, self._async_handle_timer, next_when)
+
+    @callback
+    def _async_handle_timer(self, now: datetime) -> None:
+        self._unsub_timer = None
+        self._armed_for = None
+        fired_zones = set()
+        while self._heap and self._heap[0][0] <= now:
+            when, _, entry_id, generation, event_type, event_data = heapq.heappop(self._heap)
+            if self._generations.get(entry_id) != generation:
+                continue
+            self._live_counts[entry_id] = self._live_counts.get(entry_id, 1) - 1
+            fired_zones.add(entry_id)
+            _LOGGER.debug("Firing %s for %s", event_type, event_data)
+            self.hass.bus.async_fire(event_type, event_data)
+
+        # Deadlines already fired are in the past and are not pushed again
+        for entry_id in fired_zones:
+            entry = self.hass.config_entries.async_get_entry(entry_id)
+            if entry is not None and entry_id in self._zone_unsubs:
+                self.async_refresh_zone(entry)
+        self._arm_timer()
+
+    @callback
+    def async_stop(self) -> None:
+        for entry_id in list(self._zone_unsubs):
+            self.async_untrack_zone(entry_id)
+        if self._unsub_timer:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._armed_for = None
+        self._heap = []
+
+
+def _parse_date(value) -> date | None:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
+def _due_and_overdue(due: date, event_data: dict):
+    """A deadline is due at the start of its due date and overdue the day after."""
+    due_data = {**event_data, "due_date": due.isoformat()}
+    yield dt_util.start_of_local_day(due), EVENT_DUE, due_data
+    yield dt_util.start_of_local_day(due + timedelta(days=1)), EVENT_OVERDUE, due_data
+
+
+def _next_pre_emergent_opening(grass_type: str, today: date) -> date | None:
+    """First day of the next pre-emergent window for the grass type's season."""
+    season_type = grass_info_for(grass_type)["season"]
+    months = PRE_EMERGENT_WINDOW_START_MONTHS.get(season_type, PRE_EMERGENT_WINDOW_START_MONTHS["cool"])
+    candidates = [date(today.year + offset, month, 1) for offset in (0, 1) for month in months]
+    upcoming = [d for d in candidates if d > today]
+    return min(upcoming) if upcoming else None
+
+
+@callback
+def async_get_due_event_engine(hass: HomeAssistant) -> DueEventEngine:
+    """Get the integration-wide due-event engine, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_DUE_EVENTS not in domain_data:
+        domain_data[DATA_DUE_EVENTS] = DueEventEngine(hass)
+    return domain_data[DATA_DUE_EVENTS]
+
+
+@callback
+def async_stop_due_event_engine(hass: HomeAssistant) -> None:
+    """Stop the due-event engine and drop it; the next zone set up creates a new one."""
+    engine = hass.data.get(DOMAIN, {}).pop(DATA_DUE_EVENTS, None)
+    if engine:
+        engine.async_stop()
@@ -0,0 +1,77 @@
+import asyncio
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, DATA_EQUIPMENT_STORE, EQUIPMENT_STORAGE_KEY, STORAGE_VERSION
+
+SIGNAL_EQUIPMENT_UPDATE = "lawn_manager_equipment_update"
+
+
+class EquipmentStore:
+    """The equipment inventory every zone shares, one Store for the whole integration.
+
+    The store is loaded by a single task the first time anything asks for
+    it, so zones starting up together share one read, and it is kept in
+    memory afterwards. Every change goes through this class, which saves
+    the store and sends lawn_manager_equipment_update.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
+        self._equipment = None
+        self._load_task = None
+
+    async def async_get(self) -> dict:
+        """Stored equipment by ID. Callers must not modify it."""
+        if self._equipment is None:
+            if self._load_task is None:
+                self._load_task = self.hass.async_create_task(self._store.async_load())
+            try:
+                loaded = await asyncio.shield(self._load_task)
+            except Exception:
+                self._load_task = None
+                raise
+            if self._equipment is None:
+                self._equipment = loaded or {}
+        return self._equipment
+
+    async def async_add(self, items: dict) -> None:
+        """Store new or replaced equipment, given by ID."""
+        if not items:
+            return
+        equipment = {**await self.async_get(), **items}
+        await self._async_save(equipment)
+
+    async def async_delete(self, equipment_ids) -> dict:
+        """Delete equipment by ID; returns the items that were stored."""
+        equipment = dict(await self.async_get())
+        deleted = {equipment_id: equipment.pop(equipment_id) for equipment_id in equipment_ids if equipment_id in equipment}
+        if deleted:
+            await self._async_save(equipment)
+        return deleted
+
+    async def async_clear(self) -> int:
+        """Delete all equipment and the store file; returns how many items there were."""
+        count = len(await self.async_get())
+        self._equipment = {}
+        await self._store.async_remove()
+        async_dispatcher_send(self.hass, SIGNAL_EQUIPMENT_UPDATE)
+        return count
+
+    async def _async_save(self, equipment: dict) -> None:
+        # Replaced, not modified, so dicts already handed out stay as they were
+        self._equipment = equipment
+        await self._store.async_save(equipment)
+        async_dispatcher_send(self.hass, SIGNAL_EQUIPMENT_UPDATE)
+
+
+@callback
+def async_get_equipment_store(hass: HomeAssistant) -> EquipmentStore:
+    """Get the integration-wide equipment store, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_EQUIPMENT_STORE not in domain_data:
+        domain_data[DATA_EQUIPMENT_STORE] = EquipmentStore(hass)
+    return domain_data[DATA_EQUIPMENT_STORE]
@@ -0,0 +1,52 @@
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import CONF_FEATURE_CHEMICALS, CONF_FEATURE_CONTROLS, CONF_FEATURE_RATE_CALCULATOR, PLATFORMS
+
+# Every zone has its mow, due, seasonal and weather sensors
+CORE_PLATFORMS = ["sensor", "binary_sensor"]
+# Input controls and log buttons, set up only with the controls feature
+CONTROL_PLATFORMS = ["button", "select", "date", "number"]
+# Custom chemical name and rate; only useful to zones that pick chemicals
+CHEMICAL_INPUT_PLATFORMS = ["text"]
+
+
+def zone_has_feature(entry: ConfigEntry, feature: str) -> bool:
+    """Whether a zone has a feature switched on; zones set up before the options existed have all of them."""
+    return bool(entry.data.get(feature, True))
+
+
+def zone_uses_chemical_inputs(entry: ConfigEntry) -> bool:
+    """Chemical, rate and equipment inputs serve both logging applications and the rate calculator."""
+    return zone_has_feature(entry, CONF_FEATURE_CHEMICALS) or zone_has_feature(entry, CONF_FEATURE_RATE_CALCULATOR)
+
+
+def zone_platforms(entry: ConfigEntry) -> list:
+    """The platforms a zone's features need, in PLATFORMS order.
+
+    Platforms left out are never forwarded, so their modules are not
+    imported and none of their entities are created. Turning a feature on
+    in the options flow reloads the zone, which sets the platform up then.
+    """
+    platforms = set(CORE_PLATFORMS)
+    if zone_has_feature(entry, CONF_FEATURE_CONTROLS):
+        platforms.update(CONTROL_PLATFORMS)
+        if zone_uses_chemical_inputs(entry):
+            platforms.update(CHEMICAL_INPUT_PLATFORMS)
+    return [platform for platform in PLATFORMS if platform in platforms]
+
+
+@callback
+def async_remove_disabled_platform_entities(hass: HomeAssistant, entry: ConfigEntry, platforms: list) -> None:
+    """Drop a zone's own controls on platforms it no longer sets up, so they do not linger as unavailable.
+
+    Only the zone-scoped controls ("<entry_id>_<suffix>") are removed;
+    shared control panel entities this zone may have owned are adopted
+    by another zone instead.
+    """
+    registry = er.async_get(hass)
+    prefix = f"{entry.entry_id}_"
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if registry_entry.domain not in platforms and registry_entry.unique_id.startswith(prefix):
+            registry.async_remove(registry_entry.entity_id)
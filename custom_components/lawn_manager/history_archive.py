@@ -0,0 +1,373 @@
+import bisect
+import json
+import logging
+import math
+import os
+import struct
+import sys
+from array import array
+from collections import Counter
+from datetime import date
+
+from homeassistant.core import HomeAssistant
+
+from .history_helper import MOWING_HISTORY, APPLICATION_HISTORY
+from .records import ApplicationRecord, MowRecord, epoch_to_timestamp, ordinal_to_date
+
+_LOGGER = logging.getLogger(__name__)
+
+ARCHIVE_DIRECTORY = "lawn_manager_archive"
+ARCHIVE_SUFFIX = ".lmca"
+ARCHIVE_MAGIC = b"LMCA"
+ARCHIVE_FORMAT_VERSION = 1
+
+KIND_MOW = 0
+KIND_APPLICATION = 1
+
+# Column name -> array typecode. String columns ("I") hold indexes into the
+# file's string table, 0 meaning unset: "code" is the cut type (mows) or
+# the chemical (applications) and "extra" the JSON of any keys a record
+# carries beyond its known fields. NaN marks a missing number.
+COLUMNS = (
+    ("date_ordinal", "i"),
+    ("epoch", "q"),
+    ("kind", "b"),
+    ("id", "I"),
+    ("code", "I"),
+    ("detail", "I"),
+    ("method", "I"),
+    ("rate_description", "I"),
+    ("application_type", "I"),
+    ("rate_multiplier", "d"),
+    ("height_of_cut", "d"),
+    ("applied_amount_lb_per_1000sqft", "d"),
+    ("applied_amount_oz_per_1000sqft", "d"),
+    ("total_chemical_needed_oz", "d"),
+    ("total_chemical_needed_lb", "d"),
+    ("extra", "I"),
+)
+_TYPECODES = dict(COLUMNS)
+
+# Record field -> column, for the fields stored as they are
+_MOW_STRINGS = {"cut_type": "code"}
+_MOW_NUMBERS = {"height_of_cut_inches": "height_of_cut"}
+_APPLICATION_STRINGS = {
+    "chemical": "code", "detail": "detail", "method": "method",
+    "rate_description": "rate_description", "application_type": "application_type",
+}
+_APPLICATION_NUMBERS = {
+    "rate_multiplier": "rate_multiplier",
+    "applied_amount_lb_per_1000sqft": "applied_amount_lb_per_1000sqft",
+    "applied_amount_oz_per_1000sqft": "applied_amount_oz_per_1000sqft",
+    "total_chemical_needed_oz": "total_chemical_needed_oz",
+    "total_chemical_needed_lb": "total_chemical_needed_lb",
+}
+
+
+def _period(ordinal: int, group_by: str) -> str:
+    day = date.fromordinal(ordinal)
+    if group_by == "week":
+        year, week, _ = day.isocalendar()
+        return f"{year}-W{week:02d}"
+    return f"{day.year}-{day.month:02d}"
+
+
+def _number_or_none(value: float):
+    return None if math.isnan(value) else value
+
+
+class ColumnarHistory:
+    """History records of one zone stored column by column.
+
+    Each column is a packed array, and strings (IDs, cut types, chemicals,
+    details) are interned into one table. Rows stay sorted by activity
+    date, so a date range is two bisects, and analytics walk the columns
+    instead of building a dict per record. Every stored field survives
+    the round trip, so archived records come back as they were logged.
+    Used for archived seasons on disk and, for queries that span both, to
+    hold live records the same way.
+    """
+
+    def __init__(self, strings=None):
+        self.strings = list(strings or [""])
+        self._string_ids = {value: index for index, value in enumerate(self.strings)}
+        self.columns = {name: array(typecode) for name, typecode in COLUMNS}
+
+    def __len__(self) -> int:
+        return len(self.columns["date_ordinal"])
+
+    @classmethod
+    def from_records(cls, records) -> "ColumnarHistory":
+        history = cls()
+        for record in sorted(records, key=lambda record: record.sort_key):
+            history.append(record)
+        return history
+
+    def _string_id(self, value) -> int:
+        if not value:
+            return 0
+        string_id = self._string_ids.get(value)
+        if string_id is None:
+            string_id = len(self.strings)
+            self.strings.append(value)
+            self._string_ids[value] = string_id
+        return string_id
+
+    def append(self, record) -> None:
+        """Append a record; callers keep rows in sort_key order."""
+        columns = self.columns
+        is_mow = isinstance(record, MowRecord)
+        strings, numbers = (_MOW_STRINGS, _MOW_NUMBERS) if is_mow else (_APPLICATION_STRINGS, _APPLICATION_NUMBERS)
+
+        columns["date_ordinal"].append(record.date_ordinal)
+        columns["epoch"].append(record.epoch or 0)
+        columns["kind"].append(KIND_MOW if is_mow else KIND_APPLICATION)
+        columns["id"].append(self._string_id(record.id))
+        columns["extra"].append(self._string_id(json.dumps(record.extra, sort_keys=True) if record.extra else None))
+        for name, _ in COLUMNS[4:-1]:
+            columns[name].append(0 if _TYPECODES[name] == "I" else math.nan)
+        for field, name in strings.items():
+            columns[name][-1] = self._string_id(getattr(record, field))
+        for field, name in numbers.items():
+            value = getattr(record, field)
+            if value is not None:
+                columns[name][-1] = value
+
+    def merged(self, records) -> "ColumnarHistory":
+        """A new history holding these rows plus the given records, in order.
+
+        Records whose ID is already stored are skipped, so archiving the
+        same records again after an interrupted move adds nothing.
+        """
+        stored = self.records()
+        stored_ids = {self.strings[index] for index in self.columns["id"]} - {None}
+        added = [record for record in records if record.id is None or record.id not in stored_ids]
+        merged = ColumnarHistory(self.strings)
+        for record in sorted([*stored, *added], key=lambda record: record.sort_key):
+            merged.append(record)
+        return merged
+
+    def row_range(self, start_ordinal: int | None = None, end_ordinal: int | None = None) -> range:
+        dates = self.columns["date_ordinal"]
+        low = bisect.bisect_left(dates, start_ordinal) if start_ordinal else 0
+        high = bisect.bisect_right(dates, end_ordinal) if end_ordinal else len(dates)
+        return range(low, high)
+
+    def records(self, rows: range | None = None):
+        """Rebuild MowRecord/ApplicationRecord objects for a range of rows."""
+        columns = self.columns
+        strings = self.strings
+        for row in rows if rows is not None else range(len(self)):
+            is_mow = columns["kind"][row] == KIND_MOW
+            record_type, string_fields, number_fields = (
+                (MowRecord, _MOW_STRINGS, _MOW_NUMBERS) if is_mow
+                else (ApplicationRecord, _APPLICATION_STRINGS, _APPLICATION_NUMBERS)
+            )
+            extra = strings[columns["extra"][row]]
+            yield record_type(
+                id=strings[columns["id"][row]] or None,
+                date_ordinal=columns["date_ordinal"][row],
+                epoch=columns["epoch"][row] or None,
+                extra=json.loads(extra) if extra else None,
+                **{field: strings[columns[name][row]] or None for field, name in string_fields.items()},
+                **{field: _number_or_none(columns[name][row]) for field, name in number_fields.items()},
+            )
+
+    def activities(self, zone: str, rows: range):
+        """Rows in the get_activity_history response format."""
+        columns = self.columns
+        strings = self.strings
+        for row in rows:
+            day = ordinal_to_date(columns["date_ordinal"][row])
+            epoch = columns["epoch"][row]
+            activity = {
+                "id": strings[columns["id"][row]] or None,
+                "zone": zone,
+                "date": day,
+                "timestamp": epoch_to_timestamp(epoch) if epoch else day,
+                "archived": True,
+            }
+            if columns["kind"][row] == KIND_MOW:
+                height = columns["height_of_cut"][row]
+                activity.update({
+                    "category": "mowing",
+                    "activity": strings[columns["code"][row]] or "Mow",
+                    "details": "" if math.isnan(height) else f"HOC: {height} in",
+                })
+            else:
+                activity.update({
+                    "category": "chemical",
+                    "activity": strings[columns["code"][row]] or "Unknown",
+                    "details": strings[columns["detail"][row]],
+                })
+            yield activity
+
+    def count_by_period(self, rows: range, group_by: str, mows: Counter, applications: dict) -> None:
+        """Add mows per period and applications per chemical per period to the counters."""
+        dates = self.columns["date_ordinal"]
+        kinds = self.columns["kind"]
+        codes = self.columns["code"]
+        periods = {}
+        for row in rows:
+            ordinal = dates[row]
+            period = periods.get(ordinal)
+            if period is None:
+                period = periods[ordinal] = _period(ordinal, group_by)
+            if kinds[row] == KIND_MOW:
+                mows[period] += 1
+            else:
+                applications.setdefault(self.strings[codes[row]] or "Unknown", Counter())[period] += 1
+
+    def to_bytes(self) -> bytes:
+        header = json.dumps({
+            "version": ARCHIVE_FORMAT_VERSION,
+            "byteorder": sys.byteorder,
+            "rows": len(self),
+            "strings": self.strings,
+            "columns": [list(column) for column in COLUMNS],
+        }).encode()
+        parts = [ARCHIVE_MAGIC, struct.pack("<I", len(header)), header]
+        parts.extend(self.columns[name].tobytes() for name, _ in COLUMNS)
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, payload: bytes) -> "ColumnarHistory":
+        if payload[:4] != ARCHIVE_MAGIC:
+            raise ValueError("Not a Lawn Manager archive file")
+        (header_length,) = struct.unpack_from("<I", payload, 4)
+        offset = 8 + header_length
+        header = json.loads(payload[8:offset])
+        if header.get("version") != ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive version {header.get('version')}")
+
+        rows = header["rows"]
+        history = cls(header["strings"])
+        for name, typecode in header["columns"]:
+            column = array(typecode)
+            size = column.itemsize * rows
+            column.frombytes(payload[offset:offset + size])
+            if header["byteorder"] != sys.byteorder:
+                column.byteswap()
+            history.columns[name] = column
+            offset += size
+        return history
+
+
+class HistoryArchive:
+    """A zone's archived seasons: one columnar file per calendar year.
+
+    Files live under .storage/lawn_manager_archive and are only read or
+    written in the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self.hass = hass
+        self.entry_id = entry_id
+        self._directory = hass.config.path(".storage", ARCHIVE_DIRECTORY)
+
+    def _path(self, year: int) -> str:
+        return os.path.join(self._directory, f"{self.entry_id}_{year}{ARCHIVE_SUFFIX}")
+
+    def _years(self) -> list:
+        prefix = f"{self.entry_id}_"
+        try:
+            names = os.listdir(self._directory)
+        except FileNotFoundError:
+            return []
+        return sorted(
+            int(name[len(prefix):-len(ARCHIVE_SUFFIX)])
+            for name in names
+            if name.startswith(prefix) and name.endswith(ARCHIVE_SUFFIX) and name[len(prefix):-len(ARCHIVE_SUFFIX)].isdigit()
+        )
+
+    def _read(self, year: int) -> ColumnarHistory | None:
+        try:
+            with open(self._path(year), "rb") as file:
+                return ColumnarHistory.from_bytes(file.read())
+        except FileNotFoundError:
+            return None
+
+    def _write(self, year: int, history: ColumnarHistory) -> None:
+        os.makedirs(self._directory, exist_ok=True)
+        path = self._path(year)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(history.to_bytes())
+        os.replace(temp_path, path)
+
+    def _append(self, year: int, records: list) -> None:
+        existing = self._read(year) or ColumnarHistory()
+        self._write(year, existing.merged(records))
+
+    def _load_range(self, start_ordinal: int | None, end_ordinal: int | None) -> list:
+        first_year = date.fromordinal(start_ordinal).year if start_ordinal else None
+        last_year = date.fromordinal(end_ordinal).year if end_ordinal else None
+        blocks = []
+        for year in self._years():
+            if (first_year is None or year >= first_year) and (last_year is None or year <= last_year):
+                history = self._read(year)
+                if history is not None:
+                    blocks.append(history)
+        return blocks
+
+    def iter_records(self):
+        """Every archived record, oldest year first. Executor only.
+
+        Year files are read one at a time, so streaming a large archive
+        holds at most one year in memory.
+        """
+        for year in self._years():
+            history = self._read(year)
+            if history is not None:
+                yield from history.records()
+
+    def _remove(self) -> None:
+        for year in self._years():
+            os.remove(self._path(year))
+
+    async def async_years(self) -> list:
+        return await self.hass.async_add_executor_job(self._years)
+
+    async def async_append(self, year: int, records: list) -> None:
+        """Add records dated in a year to that year's file."""
+        await self.hass.async_add_executor_job(self._append, year, records)
+
+    async def async_load_range(self, start_ordinal: int | None = None, end_ordinal: int | None = None) -> list:
+        """ColumnarHistory blocks for the archived years overlapping a date range."""
+        return await self.hass.async_add_executor_job(self._load_range, start_ordinal, end_ordinal)
+
+    async def async_remove(self) -> None:
+        await self.hass.async_add_executor_job(self._remove)
+
+
+async def async_archive_zone_history(hass: HomeAssistant, entry_id: str, data: dict, before_ordinal: int) -> tuple:
+    """Move a zone's history records dated before a day into its archive.
+
+    Each year's records are written to its archive file before they are
+    taken out of the live lists, so a failed write leaves that year and
+    the ones after it live, and moving them again later is safe. The
+    caller saves the zone afterwards. Returns (records moved, the OSError
+    that stopped the move or None).
+    """
+    records_by_year = {}
+    for history_key in (MOWING_HISTORY, APPLICATION_HISTORY):
+        for record in data[history_key]:
+            # Records without a usable date are never archived, so they stay live
+            if 0 < record.date_ordinal < before_ordinal:
+                records_by_year.setdefault(date.fromordinal(record.date_ordinal).year, []).append(record)
+
+    archive = HistoryArchive(hass, entry_id)
+    moved = set()
+    error = None
+    for year, records in sorted(records_by_year.items()):
+        try:
+            await archive.async_append(year, records)
+        except OSError as err:
+            error = err
+            break
+        moved.update(id(record) for record in records)
+
+    if moved:
+        for history_key in (MOWING_HISTORY, APPLICATION_HISTORY):
+            data[history_key] = [record for record in data[history_key] if id(record) not in moved]
+    return len(moved), error
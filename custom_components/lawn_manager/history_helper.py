@@ -0,0 +1,189 @@
+import logging
+import uuid
+
+_LOGGER = logging.getLogger(__name__)
+
+MOWING_HISTORY = "mowing_history"
+APPLICATION_HISTORY = "application_history"
+HISTORY_KEYS = (MOWING_HISTORY, APPLICATION_HISTORY)
+# Monthly summaries of records past the retention window (see history_rollup)
+MONTHLY_ROLLUPS = "monthly_rollups"
+
+
+def new_record_id() -> str:
+    """Generate a short record ID, same format as equipment and maintenance IDs."""
+    return str(uuid.uuid4())[:8]
+
+
+class HistoryIndex:
+    """ID -> (history key, position) index over a zone's history lists.
+
+    Lookups and in-place replacements are O(1). Removing a record only
+    re-numbers the records stored after it in the same list.
+    """
+
+    def __init__(self, data: dict):
+        self._data = data
+        self._positions = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Re-index every record, e.g. after a history list was truncated."""
+        self._positions = {}
+        for history_key in HISTORY_KEYS:
+            for position, record in enumerate(self._data[history_key]):
+                if record.id:
+                    self._positions[record.id] = (history_key, position)
+
+    def add(self, history_key: str, record: dict) -> None:
+        """Index a record that was just appended to a history list."""
+        self._positions[record.id] = (history_key, len(self._data[history_key]) - 1)
+
+    def get(self, record_id: str):
+        """Return (history_key, record) for an ID, or None if unknown."""
+        location = self._positions.get(record_id)
+        if location is None:
+            return None
+        history_key, position = location
+        return history_key, self._data[history_key][position]
+
+    def replace(self, record_id: str, record: dict) -> None:
+        """Swap in a new record object at the same position."""
+        history_key, position = self._positions[record_id]
+        self._data[history_key][position] = record
+
+    def remove(self, record_id: str) -> dict:
+        """Remove a record and return it."""
+        history_key, position = self._positions.pop(record_id)
+        history = self._data[history_key]
+        record = history.pop(position)
+        for later_position in range(position, len(history)):
+            later_id = history[later_position].id
+            if later_id:
+                self._positions[later_id] = (history_key, later_position)
+        return record
+
+
+# Application record field -> applications[chem] summary field. These are the
+# per-application values; static product data (interval, default rates) is
+# kept on the summary as logged.
+APPLICATION_SUMMARY_FIELDS = {
+    "date": "last_applied",
+    "method": "method",
+    "rate_description": "rate_description",
+    "rate_multiplier": "rate_multiplier",
+    "application_type": "application_type",
+    "applied_amount_lb_per_1000sqft": "applied_amount_lb_per_1000sqft",
+    "applied_amount_oz_per_1000sqft": "applied_amount_oz_per_1000sqft",
+    "total_chemical_needed_oz": "total_chemical_needed_oz",
+    "total_chemical_needed_lb": "total_chemical_needed_lb",
+}
+
+
+def _record_key(record):
+    """Ordering key for history records: activity date, then time logged."""
+    return record.sort_key
+
+
+class DerivedStateMaterializer:
+    """Derives last_mow and applications[chem] from a zone's history.
+
+    The summary fields always reflect the newest record by activity date, no
+    matter in which order records were logged. New records are folded in
+    incrementally by comparing against the current per-key maximum; a full
+    rescan only happens when the record a summary came from is edited away.
+    """
+
+    def __init__(self, data: dict):
+        self._data = data
+        # Ordering key of the record each summary was derived from
+        self._mow_key = None
+        self._application_keys = {}
+        self.rebuild()
+
+    def rebuild(self) -> None:
+        """Recompute every summary in one pass over the history.
+
+        Runs when a zone is loaded and after migrations or imports, so stored
+        summaries never depend on the order records were logged in.
+        """
+        newest_mow = None
+        for record in self._data[MOWING_HISTORY]:
+            if newest_mow is None or _record_key(record) >= _record_key(newest_mow):
+                newest_mow = record
+
+        newest_applications = {}
+        for record in self._data[APPLICATION_HISTORY]:
+            chemical = record.get("chemical")
+            current = newest_applications.get(chemical)
+            if current is None or _record_key(record) >= _record_key(current):
+                newest_applications[chemical] = record
+
+        self._mow_key = None
+        if newest_mow is not None:
+            self._apply_mow(newest_mow)
+
+        self._application_keys = {}
+        for record in newest_applications.values():
+            self._apply_application(record)
+
+    def record_added(self, history_key: str, record: dict) -> None:
+        """Fold a newly logged record into the summaries."""
+        if history_key == MOWING_HISTORY:
+            if self._mow_key is None or _record_key(record) >= self._mow_key:
+                self._apply_mow(record)
+            return
+
+        current = self._application_keys.get(record.get("chemical"))
+        if current is None or _record_key(record) >= current:
+            self._apply_application(record)
+
+    def record_changed(self, history_key: str, old_record: dict | None, new_record: dict | None) -> None:
+        """Update the summaries after a record was edited (both set) or deleted (new_record None)."""
+        if history_key == MOWING_HISTORY:
+            if old_record is not None and _record_key(old_record) == self._mow_key:
+                self._rescan_mowing()
+            elif new_record is not None:
+                self.record_added(history_key, new_record)
+            return
+
+        if old_record is not None:
+            chemical = old_record.get("chemical")
+            if _record_key(old_record) == self._application_keys.get(chemical):
+                self._rescan_application(chemical)
+        if new_record is not None:
+            self.record_added(history_key, new_record)
+
+    def _apply_mow(self, record: dict) -> None:
+        self._mow_key = _record_key(record)
+        self._data["last_mow"] = record.get("date")
+
+    def _apply_application(self, record: dict) -> None:
+        chemical = record.get("chemical")
+        self._application_keys[chemical] = _record_key(record)
+        summary = self._data.setdefault("applications", {}).setdefault(chemical, {})
+        for record_field, summary_field in APPLICATION_SUMMARY_FIELDS.items():
+            if record_field in record:
+                summary[summary_field] = record[record_field]
+
+    def _rescan_mowing(self) -> None:
+        newest = None
+        for record in self._data[MOWING_HISTORY]:
+            if newest is None or _record_key(record) >= _record_key(newest):
+                newest = record
+        self._mow_key = None
+        if newest is None:
+            self._data["last_mow"] = None
+        else:
+            self._apply_mow(newest)
+
+    def _rescan_application(self, chemical: str) -> None:
+        newest = None
+        for record in self._data[APPLICATION_HISTORY]:
+            if record.get("chemical") == chemical and (newest is None or _record_key(record) >= _record_key(newest)):
+                newest = record
+        self._application_keys.pop(chemical, None)
+        if newest is not None:
+            self._apply_application(newest)
+        elif chemical in self._data["applications"]:
+            self._data["applications"][chemical]["last_applied"] = None
@@ -0,0 +1,143 @@
+import logging
+from datetime import date, timedelta
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, DATA_HISTORY_COMPACTOR, CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS
+from .day_rollover import async_track_day_rollover
+from .history_helper import MOWING_HISTORY, APPLICATION_HISTORY, MONTHLY_ROLLUPS
+from .signals import ZoneChangeSet, async_send_zone_update
+from .zone_registry import get_loaded_zone
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _month_key(ordinal: int) -> str:
+    day = date.fromordinal(ordinal)
+    return f"{day.year}-{day.month:02d}"
+
+
+def _add_mow(bucket: dict, record) -> None:
+    mows = bucket.setdefault("mows", {"count": 0, "height_of_cut_sum": 0.0, "height_of_cut_samples": 0})
+    mows["count"] += 1
+    if record.height_of_cut_inches is not None:
+        mows["height_of_cut_sum"] = round(mows["height_of_cut_sum"] + record.height_of_cut_inches, 4)
+        mows["height_of_cut_samples"] += 1
+    if mows["height_of_cut_samples"]:
+        mows["mean_height_of_cut_inches"] = round(mows["height_of_cut_sum"] / mows["height_of_cut_samples"], 3)
+
+
+def _add_application(bucket: dict, record) -> None:
+    totals = bucket.setdefault("applications", {}).setdefault(
+        record.chemical or "Unknown", {"count": 0, "total_chemical_needed_oz": 0.0, "total_chemical_needed_lb": 0.0}
+    )
+    totals["count"] += 1
+    totals["total_chemical_needed_oz"] = round(totals["total_chemical_needed_oz"] + (record.total_chemical_needed_oz or 0), 3)
+    totals["total_chemical_needed_lb"] = round(totals["total_chemical_needed_lb"] + (record.total_chemical_needed_lb or 0), 4)
+
+
+def rollup_zone_history(data: dict, cutoff_ordinal: int) -> tuple:
+    """Fold mow and application records dated before a day into monthly rollups.
+
+    data[monthly_rollups] maps "YYYY-MM" to the month's mow count and
+    height-of-cut sum/mean, and per chemical the application count and
+    product totals. Sums are kept next to the means so later runs can
+    keep adding to a month. Records without a date are left alone.
+    Returns (records rolled up, chemicals affected).
+    """
+    rollups = data.setdefault(MONTHLY_ROLLUPS, {})
+    rolled_up = 0
+    chemicals = set()
+
+    for history_key, add in ((MOWING_HISTORY, _add_mow), (APPLICATION_HISTORY, _add_application)):
+        kept = []
+        for record in data[history_key]:
+            if not record.date_ordinal or record.date_ordinal >= cutoff_ordinal:
+                kept.append(record)
+                continue
+            add(rollups.setdefault(_month_key(record.date_ordinal), {}), record)
+            if history_key == APPLICATION_HISTORY:
+                chemicals.add(record.chemical)
+            rolled_up += 1
+        if len(kept) != len(data[history_key]):
+            data[history_key] = kept
+
+    if not rollups:
+        data.pop(MONTHLY_ROLLUPS)
+    return rolled_up, chemicals
+
+
+def rollup_overlaps(month: str, start_ordinal: int, end_ordinal: int) -> bool:
+    """True if a "YYYY-MM" rollup month overlaps a date range (0 = open end)."""
+    year, month_number = (int(part) for part in month.split("-"))
+    first = date(year, month_number, 1)
+    last = (first.replace(day=28) + timedelta(days=4)).replace(day=1) - timedelta(days=1)
+    return (not start_ordinal or last.toordinal() >= start_ordinal) and (not end_ordinal or first.toordinal() <= end_ordinal)
+
+
+class HistoryCompactor:
+    """Rolls old history up into monthly summaries in the background.
+
+    Each loaded zone is compacted once when it is set up and again at
+    every local midnight. Records older than the zone's retention window
+    (history_retention_days) leave the live history lists and only their
+    monthly rollup remains, so history grows by at most one small entry
+    per month instead of per activity.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._entries = {}
+        self._unsub_rollover = None
+
+    @callback
+    def async_track_zone(self, entry: ConfigEntry) -> None:
+        self._entries[entry.entry_id] = entry
+        if self._unsub_rollover is None:
+            self._unsub_rollover = async_track_day_rollover(self.hass, self._async_handle_rollover)
+        self.hass.async_create_task(self.async_compact_zone(entry))
+
+    @callback
+    def async_untrack_zone(self, entry_id: str) -> None:
+        self._entries.pop(entry_id, None)
+        if not self._entries and self._unsub_rollover:
+            self._unsub_rollover()
+            self._unsub_rollover = None
+
+    @callback
+    def _async_handle_rollover(self) -> None:
+        for entry in list(self._entries.values()):
+            self.hass.async_create_task(self.async_compact_zone(entry))
+
+    async def async_compact_zone(self, entry: ConfigEntry) -> int:
+        """Roll up a loaded zone's records older than its retention window."""
+        zone_info = get_loaded_zone(self.hass, entry.entry_id)
+        if not zone_info:
+            return 0
+
+        retention_days = int(entry.data.get(CONF_HISTORY_RETENTION_DAYS, DEFAULT_HISTORY_RETENTION_DAYS))
+        cutoff_ordinal = (dt_util.now().date() - timedelta(days=retention_days)).toordinal()
+        data = zone_info["data"]
+        rolled_up, chemicals = rollup_zone_history(data, cutoff_ordinal)
+        if not rolled_up:
+            return 0
+
+        zone_info["index"].rebuild()
+        await zone_info["store"].async_save(data)
+        _LOGGER.info(
+            "Rolled %d history records older than %d days into monthly summaries for %s",
+            rolled_up, retention_days, entry.title,
+        )
+        async_send_zone_update(self.hass, entry.entry_id, ZoneChangeSet.history_compacted(chemicals))
+        return rolled_up
+
+
+@callback
+def async_get_history_compactor(hass: HomeAssistant) -> HistoryCompactor:
+    """Get the integration-wide history compactor, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_HISTORY_COMPACTOR not in domain_data:
+        domain_data[DATA_HISTORY_COMPACTOR] = HistoryCompactor(hass)
+    return domain_data[DATA_HISTORY_COMPACTOR]
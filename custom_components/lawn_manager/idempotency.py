@@ -0,0 +1,109 @@
+import logging
+import time
+from collections import OrderedDict
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, DATA_IDEMPOTENCY, IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_MAX_KEYS
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IdempotencyCache:
+    """Bounded, time-expiring set of recently used idempotency keys.
+
+    Keys are kept in insertion order. Because every key gets the same TTL,
+    the oldest key is always the next one to expire, so expiry and eviction
+    only ever pop from the front and every operation is O(1) amortized.
+
+    A key can be bound to the record its call created, so deleting that
+    record frees the key and the same call can log it again.
+    """
+
+    def __init__(self, ttl: float = IDEMPOTENCY_TTL_SECONDS, max_keys: int = IDEMPOTENCY_MAX_KEYS):
+        self._ttl = ttl
+        self._max_keys = max_keys
+        self._keys = OrderedDict()
+        self._record_keys = {}
+
+    def _pop_oldest(self) -> None:
+        _key, (_expires, record_id) = self._keys.popitem(last=False)
+        self._record_keys.pop(record_id, None)
+
+    def _expire(self, now: float) -> None:
+        while self._keys:
+            expires, _record_id = next(iter(self._keys.values()))
+            if expires > now:
+                break
+            self._pop_oldest()
+
+    def claim(self, key: str) -> bool:
+        """Claim a key. Returns False if it was already claimed and has not expired."""
+        now = time.monotonic()
+        self._expire(now)
+        if key in self._keys:
+            return False
+
+        self._keys[key] = (now + self._ttl, None)
+        if len(self._keys) > self._max_keys:
+            self._pop_oldest()
+        return True
+
+    def release(self, key: str) -> None:
+        """Release a claimed key so a failed call can be retried."""
+        _expires, record_id = self._keys.pop(key, (None, None))
+        self._record_keys.pop(record_id, None)
+
+    def bind(self, key: str, record_id: str) -> None:
+        """Tie a claimed key to the record its call created."""
+        if key in self._keys and record_id:
+            expires, _record_id = self._keys[key]
+            self._keys[key] = (expires, record_id)
+            self._record_keys[record_id] = key
+
+    def release_record(self, record_id: str) -> None:
+        """Release the key bound to a record that was deleted."""
+        key = self._record_keys.pop(record_id, None)
+        if key is not None:
+            self._keys.pop(key, None)
+
+
+def get_idempotency_cache(hass: HomeAssistant) -> IdempotencyCache:
+    """Get the integration-wide idempotency cache, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_IDEMPOTENCY not in domain_data:
+        domain_data[DATA_IDEMPOTENCY] = IdempotencyCache()
+    return domain_data[DATA_IDEMPOTENCY]
+
+
+def is_duplicate_call(hass: HomeAssistant, service: str, idempotency_key) -> bool:
+    """Claim a service call's idempotency key, returning True if it was already used.
+
+    Calls without a key are never duplicates.
+    """
+    if not idempotency_key:
+        return False
+    return not get_idempotency_cache(hass).claim(f"{service}:{idempotency_key}")
+
+
+def duplicate_call_response(service: str, idempotency_key) -> dict:
+    """Log an ignored duplicate call; every log service returns this for one."""
+    _LOGGER.warning("Ignoring duplicate %s call (idempotency_key=%s)", service, idempotency_key)
+    return {"error": "Duplicate request", "idempotency_key": idempotency_key}
+
+
+def release_idempotency_key(hass: HomeAssistant, service: str, idempotency_key) -> None:
+    """Release a claimed key so a call that failed can be retried."""
+    if idempotency_key:
+        get_idempotency_cache(hass).release(f"{service}:{idempotency_key}")
+
+
+def bind_idempotency_key(hass: HomeAssistant, service: str, idempotency_key, record_id: str) -> None:
+    """Tie a call's key to the record it created, see release_record_idempotency_key."""
+    if idempotency_key:
+        get_idempotency_cache(hass).bind(f"{service}:{idempotency_key}", record_id)
+
+
+def release_record_idempotency_key(hass: HomeAssistant, record_id: str) -> None:
+    """Release the key of the call that created a deleted record, so logging it again is not a duplicate."""
+    get_idempotency_cache(hass).release_record(record_id)
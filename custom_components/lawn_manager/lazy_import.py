@@ -0,0 +1,20 @@
+import importlib
+import sys
+from types import ModuleType
+
+from homeassistant.core import HomeAssistant
+
+
+async def async_import_helper(hass: HomeAssistant, name: str) -> ModuleType:
+    """Import one of the integration's helper modules the first time it is needed.
+
+    Home Assistant imports the integration and its platforms in an
+    executor. Modules imported from event loop code would block the loop
+    instead, so the first import runs in the executor and later calls
+    return the module that is already loaded.
+    """
+    module_name = f"{__package__}.{name}"
+    module = sys.modules.get(module_name)
+    if module is None:
+        module = await hass.async_add_executor_job(importlib.import_module, module_name)
+    return module
@@ -0,0 +1,51 @@
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import MAINTENANCE_LOG_STORAGE_KEY, MAINTENANCE_LOG_MAX_ENTRIES, STORAGE_VERSION
+from .records import date_to_ordinal
+from .zone_registry import get_sqlite_history
+
+
+class MaintenanceLog:
+    """The equipment maintenance log, wherever the history backend keeps it.
+
+    With the JSON backend the log is one Store document capped at the
+    newest MAINTENANCE_LOG_MAX_ENTRIES entries; with SQLite every entry is
+    its own row and filters run as indexed queries.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, MAINTENANCE_LOG_STORAGE_KEY)
+
+    async def async_entries(self, equipment=None, start_ordinal: int = 0, end_ordinal: int = 0) -> list:
+        """Entries in logged order, optionally for one piece of equipment (any case) and a date range."""
+        sqlite = get_sqlite_history(self.hass)
+        if sqlite:
+            return await sqlite.async_maintenance_entries(equipment, start_ordinal, end_ordinal)
+
+        maintenance_data = await self._store.async_load() or {"log": []}
+        log = maintenance_data.get("log", [])
+        if equipment:
+            log = [e for e in log if e.get("equipment", "").lower() == equipment.lower()]
+        if start_ordinal or end_ordinal:
+            log = [
+                e for e in log
+                if (not start_ordinal or date_to_ordinal(e.get("date")) >= start_ordinal)
+                and (not end_ordinal or date_to_ordinal(e.get("date")) <= end_ordinal)
+            ]
+        return log
+
+    async def async_add(self, entry: dict) -> None:
+        sqlite = get_sqlite_history(self.hass)
+        if sqlite:
+            await sqlite.async_add_maintenance(entry)
+            return
+
+        maintenance_data = await self._store.async_load() or {"log": []}
+        if "log" not in maintenance_data:
+            maintenance_data["log"] = []
+        maintenance_data["log"].append(entry)
+        if len(maintenance_data["log"]) > MAINTENANCE_LOG_MAX_ENTRIES:
+            maintenance_data["log"] = maintenance_data["log"][-MAINTENANCE_LOG_MAX_ENTRIES:]
+        await self._store.async_save(maintenance_data)
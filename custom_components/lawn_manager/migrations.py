@@ -0,0 +1,91 @@
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+from homeassistant.util.json import load_json
+
+from .const import ZONE_STORAGE_VERSION
+from .history_helper import HISTORY_KEYS, new_record_id
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def new_zone_data() -> dict:
+    """The data of a zone with nothing logged yet; every loaded zone has at least these keys."""
+    return {
+        "last_mow": None,
+        "mowing_history": [],
+        "applications": {},
+        "application_history": [],
+    }
+
+
+def _applications_as_dict(data: dict) -> dict:
+    """Very old zones kept applications as a list of per-chemical dicts."""
+    applications = data.get("applications")
+    if isinstance(applications, list):
+        data["applications"] = {
+            app.get("chemical_name", f"Chemical {i}"): app
+            for i, app in enumerate(applications) if isinstance(app, dict)
+        }
+    elif not isinstance(applications, dict):
+        data["applications"] = {}
+    data.setdefault("last_mow", None)
+    return data
+
+
+def _history_record_ids(data: dict) -> dict:
+    """Give every stored history record an ID (records logged before IDs existed have none)."""
+    for history_key in HISTORY_KEYS:
+        for record in data.get(history_key) or []:
+            if not record.get("id"):
+                record["id"] = new_record_id()
+    return data
+
+
+def _history_lists(data: dict) -> dict:
+    for history_key in HISTORY_KEYS:
+        if not isinstance(data.get(history_key), list):
+            data[history_key] = []
+    return data
+
+
+# Steps that bring a file from the version they are keyed by to the next.
+# The state file may still hold history if it predates the history file.
+STATE_MIGRATIONS = {
+    1: (_applications_as_dict, _history_record_ids),
+}
+HISTORY_MIGRATIONS = {
+    1: (_history_lists, _history_record_ids),
+}
+
+
+def migrate_zone_file(migrations: dict, from_version: int, data: dict) -> dict:
+    for version in range(from_version, ZONE_STORAGE_VERSION):
+        for step in migrations.get(version, ()):
+            data = step(data)
+    return data
+
+
+class ZoneFileStore(Store):
+    """Store for a zone file that brings older versions up to date on load.
+
+    Home Assistant calls the migration once when it reads a file written
+    with an older version and saves the result, so the code using the
+    data can rely on its current shape.
+    """
+
+    def __init__(self, hass: HomeAssistant, key: str, migrations: dict):
+        super().__init__(hass, ZONE_STORAGE_VERSION, key)
+        self._migrations = migrations
+
+    async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
+        _LOGGER.info("Migrating %s from version %s to %s", self.key, old_major_version, ZONE_STORAGE_VERSION)
+        return migrate_zone_file(self._migrations, old_major_version, old_data)
+
+    async def async_load_read_only(self) -> dict | None:
+        """Like async_load, but a file from an older version is migrated in memory only, not saved."""
+        stored = await self.hass.async_add_executor_job(load_json, self.path, None)
+        if not stored:
+            return None
+        return migrate_zone_file(self._migrations, stored["version"], stored["data"])
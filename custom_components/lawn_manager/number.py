@@ -3,26 +3,38 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 import logging
 
-from .const import DOMAIN
+from .control_panel import ControlScope, async_add_shared_entities, async_remove_zone_controls, uses_shared_controls
 
 _LOGGER = logging.getLogger(__name__)
 
+CONTROL_SUFFIXES = ("height_of_cut",)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up number entities for Lawn Manager."""
-    entities = [
-        HeightOfCutNumber(hass, entry),
-    ]
-    async_add_entities(entities)
+    if uses_shared_controls(entry):
+        async_remove_zone_controls(hass, entry, "number", CONTROL_SUFFIXES)
+        async_add_shared_entities(
+            hass, entry, "control_panel_number", async_add_entities,
+            lambda: _control_entities(hass, ControlScope.control_panel()),
+        )
+        return
+
+    async_add_entities(_control_entities(hass, ControlScope.for_zone(entry)))
+
+
+def _control_entities(hass, scope):
+    return [HeightOfCutNumber(hass, scope)]
 
 
 class HeightOfCutNumber(NumberEntity):
     """Number entity for height of cut."""
 
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Height of Cut"
-        self._attr_unique_id = f"{entry.entry_id}_height_of_cut"
+        self._attr_unique_id = scope.unique_id("height_of_cut")
         self._attr_native_min_value = 0.125
         self._attr_native_max_value = 6.0
         self._attr_native_step = 0.125
@@ -32,12 +44,7 @@ class HeightOfCutNumber(NumberEntity):
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Mowing",
-        }
+        return self._scope.device_info("Mowing")
 
     async def async_set_native_value(self, value: float) -> None:
         self._attr_native_value = value
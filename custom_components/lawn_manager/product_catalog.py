@@ -0,0 +1,149 @@
+import logging
+import uuid
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, CHEMICALS, CUSTOM_PRODUCTS_STORAGE_KEY, DATA_PRODUCT_CATALOG, STORAGE_VERSION
+
+_LOGGER = logging.getLogger(__name__)
+
+SIGNAL_PRODUCTS_UPDATE = "lawn_manager_products_update"
+
+APPLICATION_METHODS = ("sprayer", "spreader", "hand")
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.casefold().split())
+
+
+def _product_methods(product: dict) -> tuple:
+    """Application methods a product can be used with."""
+    method = product.get("application_method")
+    if method in APPLICATION_METHODS:
+        return (method,)
+    if method == "any":
+        return APPLICATION_METHODS
+    methods = []
+    if "liquid_oz_per_1000sqft" in product:
+        methods.append("sprayer")
+    if "amount_lb_per_1000sqft" in product:
+        methods.append("spreader")
+    return tuple(methods)
+
+
+def _product_aliases(name: str, product: dict) -> set:
+    """Names a product can be looked up by besides its own.
+
+    Built-in names like "T-Nex / PGR" also answer to each half; custom
+    products can list extra aliases of their own.
+    """
+    aliases = {_normalize(name)}
+    if "/" in name:
+        aliases.update(_normalize(part) for part in name.split("/") if part.strip())
+    aliases.update(_normalize(alias) for alias in product.get("aliases", []) if alias.strip())
+    return aliases
+
+
+class ProductCatalog:
+    """Every product Lawn Manager knows about, built-in and custom.
+
+    Built from CHEMICALS plus the custom products store when the
+    integration starts and kept in memory afterwards. Lookups go through
+    the name/alias index, so callers never load the products store.
+    Adding or deleting a custom product saves the store, rebuilds the
+    index and sends lawn_manager_products_update.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._store = Store(hass, STORAGE_VERSION, CUSTOM_PRODUCTS_STORAGE_KEY)
+        self._custom = {}
+        self._products = {}
+        self._aliases = {}
+        self._by_method = {}
+        self._rebuild()
+
+    async def async_load(self) -> None:
+        self._custom = await self._store.async_load() or {}
+        self._rebuild()
+
+    def _rebuild(self) -> None:
+        # Custom products are the user's own rates, so they win over a built-in of the same name
+        products = dict(CHEMICALS)
+        for product in self._custom.values():
+            products[product["name"]] = product
+
+        aliases = {}
+        by_method = {method: [] for method in APPLICATION_METHODS}
+        for name, product in products.items():
+            for alias in _product_aliases(name, product):
+                aliases.setdefault(alias, name)
+            for method in _product_methods(product):
+                by_method[method].append(name)
+        # Exact names always resolve to themselves, even if another product uses them as an alias
+        for name in products:
+            aliases[_normalize(name)] = name
+
+        self._products = products
+        self._aliases = aliases
+        self._by_method = by_method
+
+    def resolve(self, name) -> str | None:
+        """Canonical product name for a name or alias, or None if unknown."""
+        if not name:
+            return None
+        return self._aliases.get(_normalize(name))
+
+    def get(self, name) -> dict | None:
+        canonical = self.resolve(name)
+        return self._products[canonical] if canonical else None
+
+    def names(self) -> list:
+        return list(self._products)
+
+    def names_for_method(self, method: str) -> list:
+        return list(self._by_method.get(method, ()))
+
+    def custom_products(self) -> dict:
+        return dict(self._custom)
+
+    async def async_add_product(self, product: dict) -> str:
+        product_id = str(uuid.uuid4())[:8]
+        product = {**product, "created": dt_util.now().strftime("%Y-%m-%d %H:%M:%S")}
+        custom = {**self._custom, product_id: product}
+        await self._store.async_save(custom)
+        self._custom = custom
+        self._async_changed()
+        return product_id
+
+    async def async_delete_product(self, product_id: str) -> dict | None:
+        """Delete a custom product; returns it, or None if the ID is unknown."""
+        if product_id not in self._custom:
+            return None
+        custom = dict(self._custom)
+        product = custom.pop(product_id)
+        await self._store.async_save(custom)
+        self._custom = custom
+        self._async_changed()
+        return product
+
+    @callback
+    def _async_changed(self) -> None:
+        self._rebuild()
+        async_dispatcher_send(self.hass, SIGNAL_PRODUCTS_UPDATE)
+
+
+@callback
+def async_get_product_catalog(hass: HomeAssistant) -> ProductCatalog:
+    """Get the integration-wide product catalog, creating it on first use.
+
+    async_setup loads it before any zone is set up; a catalog created
+    here on its own only holds the built-in products until loaded.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_PRODUCT_CATALOG not in domain_data:
+        domain_data[DATA_PRODUCT_CATALOG] = ProductCatalog(hass)
+    return domain_data[DATA_PRODUCT_CATALOG]
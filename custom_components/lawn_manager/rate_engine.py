@@ -0,0 +1,303 @@
+import copy
+import logging
+from collections import OrderedDict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    DOMAIN, DATA_RATE_ENGINE, LITERS_PER_GALLON, POUNDS_PER_KG, RATE_CACHE_MAX_ENTRIES, RATE_OVERRIDE_MULTIPLIERS,
+)
+from .equipment_store import SIGNAL_EQUIPMENT_UPDATE, async_get_equipment_store
+from .product_catalog import SIGNAL_PRODUCTS_UPDATE, async_get_product_catalog
+from .signals import ZoneChangeSet, async_send_zone_update
+from .zone_storage import async_get_zone_store
+
+_LOGGER = logging.getLogger(__name__)
+
+# Row layout returned by calculate_rate_matrix; "zone" first, "instructions" last
+MATRIX_COLUMNS = (
+    "zone", "chemical", "equipment", "equipment_type", "lawn_size_sqft", "application_rate",
+    "total_chemical_needed_oz", "total_chemical_needed_lb", "total_water_needed_gal",
+    "tanks_needed", "chemical_per_tank_oz", "loads_needed", "instructions",
+)
+
+
+def convert_oz_to_kitchen_measurements(oz):
+    """Convert ounces to kitchen measurements for easier measuring."""
+    cups = oz / 8.0
+    tablespoons = oz * 2.0
+    teaspoons = oz * 6.0
+
+    conversions = {}
+
+    if cups >= 0.125:
+        if cups >= 1.0:
+            conversions["cups"] = f"{round(cups, 2)} cups"
+        elif cups >= 0.5:
+            conversions["cups"] = f"{round(cups, 3)} cups"
+        elif cups >= 0.25:
+            try:
+                conversions["cups"] = f"1/{int(1/cups)} cup"
+            except (ZeroDivisionError, ValueError):
+                conversions["cups"] = f"{round(cups, 3)} cups"
+        else:
+            conversions["cups"] = f"{round(cups, 3)} cups"
+
+    if tablespoons >= 0.5:
+        if tablespoons >= 1.0:
+            conversions["tablespoons"] = f"{round(tablespoons, 1)} tbsp"
+        else:
+            conversions["tablespoons"] = f"{round(tablespoons, 2)} tbsp"
+
+    if teaspoons >= 0.5 and tablespoons < 1.0:
+        conversions["teaspoons"] = f"{round(teaspoons, 1)} tsp"
+
+    return conversions
+
+
+def calculate_application_rate(chemical, chemical_data, equipment, lawn_size_sqft, rate_multiplier=1.0):
+    """Mixing/spreading math for one chemical, piece of equipment and lawn size.
+
+    Pure function; the result never includes the zone name so it can be
+    shared between zones of the same size.
+    """
+    equipment_type = equipment["type"]
+    calculation = {
+        "chemical": chemical,
+        "equipment": equipment["friendly_name"],
+        "equipment_type": equipment_type,
+        "lawn_size_sqft": lawn_size_sqft,
+        "chemical_notes": chemical_data.get("notes", ""),
+    }
+    if rate_multiplier != 1.0:
+        calculation["rate_multiplier"] = rate_multiplier
+
+    if equipment_type == "sprayer":
+        _calculate_sprayer(calculation, chemical, chemical_data, equipment, lawn_size_sqft, rate_multiplier)
+    elif equipment_type == "spreader":
+        _calculate_spreader(calculation, chemical, chemical_data, equipment, lawn_size_sqft, rate_multiplier)
+    else:
+        calculation["error"] = f"Unsupported equipment type '{equipment_type}'."
+    return calculation
+
+
+def _calculate_sprayer(calculation, chemical, chemical_data, equipment, lawn_size_sqft, rate_multiplier):
+    if "liquid_oz_per_1000sqft" in chemical_data:
+        liquid_rate_per_1000sqft = chemical_data["liquid_oz_per_1000sqft"] * rate_multiplier
+        total_chemical_needed_oz = (liquid_rate_per_1000sqft * lawn_size_sqft) / 1000
+        calculation.update({
+            "total_chemical_needed_oz": round(total_chemical_needed_oz, 3),
+            "total_chemical_kitchen_measurements": convert_oz_to_kitchen_measurements(total_chemical_needed_oz),
+            "application_rate": f"{round(liquid_rate_per_1000sqft, 3)} oz per 1,000 sq ft",
+        })
+    elif "amount_lb_per_1000sqft" in chemical_data:
+        rate_per_1000sqft = chemical_data["amount_lb_per_1000sqft"] * rate_multiplier
+        total_chemical_needed_lb = (rate_per_1000sqft * lawn_size_sqft) / 1000
+        total_chemical_needed_oz = total_chemical_needed_lb * 16
+        calculation.update({
+            "total_chemical_needed_lb": round(total_chemical_needed_lb, 2),
+            "total_chemical_needed_oz": round(total_chemical_needed_oz, 2),
+            "application_rate": f"{round(rate_per_1000sqft, 3)} lb per 1,000 sq ft (converted)",
+        })
+    else:
+        calculation["error"] = f"No rate available for {chemical}"
+        return
+
+    # Carrier water: the product's own rate, or 1 gal per 1,000 sq ft
+    water_per_1000sqft = chemical_data.get("water_gal_per_1000sqft", 1.0)
+    total_water_needed_gal = (water_per_1000sqft * lawn_size_sqft) / 1000
+    concentration_per_gallon = total_chemical_needed_oz / total_water_needed_gal if total_water_needed_gal else 0
+    if "water_gal_per_1000sqft" in chemical_data:
+        calculation.update({
+            "total_water_needed_gal": round(total_water_needed_gal, 1),
+            "concentration_per_gallon": round(concentration_per_gallon, 3),
+            "water_rate": f"{water_per_1000sqft} gal per 1,000 sq ft",
+        })
+
+    capacity_unit = equipment["capacity_unit"]
+    if capacity_unit not in ("gallons", "liters"):
+        return
+    tank_gallons = equipment["capacity"] / LITERS_PER_GALLON if capacity_unit == "liters" else equipment["capacity"]
+    if tank_gallons <= 0:
+        calculation["error"] = "Equipment capacity must be greater than zero."
+        return
+
+    tanks_needed = total_water_needed_gal / tank_gallons
+    chemical_per_tank_oz = concentration_per_gallon * tank_gallons
+    kitchen_measurements = convert_oz_to_kitchen_measurements(chemical_per_tank_oz)
+
+    mixing_instruction = f"Mix {round(chemical_per_tank_oz, 3)} oz of {chemical} per {equipment['capacity']} {capacity_unit} tank"
+    if kitchen_measurements:
+        mixing_instruction += f" ({' or '.join(kitchen_measurements.values())})"
+    if "water_gal_per_1000sqft" in chemical_data:
+        per_gallon_instruction = f"{round(concentration_per_gallon, 3)} oz per gallon"
+        concentration_kitchen = convert_oz_to_kitchen_measurements(concentration_per_gallon)
+        if concentration_kitchen:
+            per_gallon_instruction += f" ({' or '.join(concentration_kitchen.values())} per gallon)"
+        mixing_instruction = f"{mixing_instruction} - {per_gallon_instruction}"
+
+    calculation.update({
+        "tanks_needed": round(tanks_needed, 1),
+        "chemical_per_tank_oz": round(chemical_per_tank_oz, 3),
+        "kitchen_measurements_per_tank": kitchen_measurements,
+        "mixing_instructions": mixing_instruction,
+    })
+
+
+def _calculate_spreader(calculation, chemical, chemical_data, equipment, lawn_size_sqft, rate_multiplier):
+    if "amount_lb_per_1000sqft" not in chemical_data:
+        calculation["error"] = f"No granular rate available for {chemical} with spreader equipment"
+        return
+
+    rate_per_1000sqft = chemical_data["amount_lb_per_1000sqft"] * rate_multiplier
+    total_chemical_needed_lb = (rate_per_1000sqft * lawn_size_sqft) / 1000
+    calculation.update({
+        "total_chemical_needed_lb": round(total_chemical_needed_lb, 2),
+        "application_rate": f"{round(rate_per_1000sqft, 3)} lb per 1,000 sq ft",
+    })
+
+    capacity_unit = equipment["capacity_unit"]
+    if capacity_unit not in ("pounds", "kg"):
+        calculation["error"] = f"Unsupported capacity unit '{capacity_unit}' for spreader."
+        return
+    equipment_capacity = equipment["capacity"] * POUNDS_PER_KG if capacity_unit == "kg" else equipment["capacity"]
+
+    loads_needed = total_chemical_needed_lb / equipment_capacity if equipment_capacity > 0 else 0
+    calculation.update({
+        "loads_needed": round(loads_needed, 1),
+        "application_instructions": f"Apply {round(total_chemical_needed_lb, 2)} lb total using {round(loads_needed, 1)} spreader loads",
+    })
+
+
+class RateEngine:
+    """Single entry point for application-rate calculations.
+
+    Results are memoized per (chemical, equipment, lawn size, rate override)
+    and dropped whenever equipment or custom products change. Equipment
+    comes from the shared EquipmentStore, which keeps it in memory. Zone
+    settings need no invalidation because the lawn size is part of the key.
+    """
+
+    def __init__(self, hass: HomeAssistant):
+        self.hass = hass
+        self._results = OrderedDict()
+        self._unsub_equipment = async_dispatcher_connect(hass, SIGNAL_EQUIPMENT_UPDATE, self.invalidate)
+        self._unsub_products = async_dispatcher_connect(hass, SIGNAL_PRODUCTS_UPDATE, self.invalidate)
+
+    @callback
+    def invalidate(self) -> None:
+        self._results.clear()
+
+    async def async_get_equipment(self) -> dict:
+        """Equipment store contents, from the shared in-memory copy."""
+        return await async_get_equipment_store(self.hass).async_get()
+
+    async def async_calculate(self, chemical, equipment_name, zone_config, rate_override="Default") -> dict:
+        """Calculate rates for a zone; returns a dict with an "error" key on bad input."""
+        canonical = async_get_product_catalog(self.hass).resolve(chemical)
+        if not canonical:
+            return {"error": f"Chemical '{chemical}' not found"}
+        chemical = canonical
+
+        equipment_data = await self.async_get_equipment()
+        equipment = next(
+            (eq_info for eq_info in equipment_data.values() if eq_info.get("friendly_name") == equipment_name), None
+        )
+        if not equipment:
+            available_names = [eq_info.get("friendly_name", eq_id) for eq_id, eq_info in equipment_data.items()]
+            return {"error": f"Equipment '{equipment_name}' not found. Available: {available_names}"}
+
+        if rate_override not in RATE_OVERRIDE_MULTIPLIERS:
+            return {"error": f"Unknown rate override '{rate_override}'. Use one of: {list(RATE_OVERRIDE_MULTIPLIERS)}"}
+
+        result = self._cached_rate(chemical, equipment, zone_config.get("lawn_size_sqft", 1000), rate_override)
+        # Callers store and publish the result; hand out a deep copy so the cached one stays intact
+        return {**copy.deepcopy(result), "zone": zone_config.get("yard_zone", "Unknown")}
+
+    async def async_save_calculation(self, entry_id, result) -> bool:
+        """Store a calculation as the zone's last_rate_calculation; results with an "error" are not stored."""
+        if "error" in result:
+            return False
+        store, data = await async_get_zone_store(self.hass, entry_id)
+        data["last_rate_calculation"] = result
+        await store.async_save_state(data)
+        async_send_zone_update(self.hass, entry_id, ZoneChangeSet.rate_calculated())
+        return True
+
+    async def async_calculate_matrix(self, chemicals, equipment_names, zone_configs, rate_override="Default") -> dict:
+        """Rates for every chemical x equipment x zone combination as one table.
+
+        Equipment is resolved once for the whole batch and zones of the same
+        size share cached results. With no chemicals given, each piece of
+        equipment is paired with the catalog's products for its method.
+        Combinations the equipment cannot apply (e.g. a liquid-only product
+        in a spreader) are counted in "skipped" instead of being returned
+        as rows.
+        """
+        if rate_override not in RATE_OVERRIDE_MULTIPLIERS:
+            return {"error": f"Unknown rate override '{rate_override}'. Use one of: {list(RATE_OVERRIDE_MULTIPLIERS)}"}
+
+        catalog = async_get_product_catalog(self.hass)
+        if chemicals:
+            unknown = [chemical for chemical in chemicals if not catalog.resolve(chemical)]
+            if unknown:
+                return {"error": f"Chemicals not found: {unknown}"}
+            chemicals = [catalog.resolve(chemical) for chemical in chemicals]
+
+        equipment_data = await self.async_get_equipment()
+        equipment_by_name = {eq_info.get("friendly_name"): eq_info for eq_info in equipment_data.values()}
+        if equipment_names is None:
+            equipment_names = list(equipment_by_name)
+        missing = [name for name in equipment_names if name not in equipment_by_name]
+        if missing:
+            return {"error": f"Equipment not found: {missing}. Available: {list(equipment_by_name)}"}
+
+        rows = []
+        skipped = 0
+        for equipment_name in equipment_names:
+            equipment = equipment_by_name[equipment_name]
+            # Without an explicit list, only products meant for this kind of equipment
+            for chemical in chemicals or catalog.names_for_method(equipment["type"]):
+                for zone_config in zone_configs:
+                    result = self._cached_rate(chemical, equipment, zone_config.get("lawn_size_sqft", 1000), rate_override)
+                    if "error" in result:
+                        skipped += 1
+                        continue
+                    rows.append([
+                        zone_config.get("yard_zone", "Unknown"),
+                        *(result.get(column) for column in MATRIX_COLUMNS[1:-1]),
+                        result.get("mixing_instructions") or result.get("application_instructions"),
+                    ])
+
+        return {
+            "rate_override": rate_override,
+            "columns": list(MATRIX_COLUMNS),
+            "rows": rows,
+            "count": len(rows),
+            "skipped": skipped,
+        }
+
+    def _cached_rate(self, chemical, equipment, lawn_size_sqft, rate_override) -> dict:
+        key = (chemical, equipment["friendly_name"], lawn_size_sqft, rate_override)
+        result = self._results.get(key)
+        if result is None:
+            result = calculate_application_rate(
+                chemical, async_get_product_catalog(self.hass).get(chemical), equipment, lawn_size_sqft,
+                RATE_OVERRIDE_MULTIPLIERS[rate_override],
+            )
+            self._results[key] = result
+            if len(self._results) > RATE_CACHE_MAX_ENTRIES:
+                self._results.popitem(last=False)
+        else:
+            self._results.move_to_end(key)
+        return result
+
+
+@callback
+def async_get_rate_engine(hass: HomeAssistant) -> RateEngine:
+    """Get the integration-wide rate engine, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_RATE_ENGINE not in domain_data:
+        domain_data[DATA_RATE_ENGINE] = RateEngine(hass)
+    return domain_data[DATA_RATE_ENGINE]
@@ -0,0 +1,185 @@
+from datetime import date, datetime
+
+from homeassistant.util import dt as dt_util
+
+from .history_helper import MOWING_HISTORY, APPLICATION_HISTORY
+
+_MISSING = object()
+
+
+def date_to_ordinal(value) -> int:
+    """Date string -> proleptic ordinal; 0 for a missing or unparseable date.
+
+    Falls back to strptime, which also takes the unpadded "2026-5-1" form
+    older versions stored.
+    """
+    if not value:
+        return 0
+    value = str(value)
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value.split("T")[0].split(" ")[0], "%Y-%m-%d").toordinal()
+    except ValueError:
+        return 0
+
+
+def ordinal_to_date(ordinal: int) -> str:
+    return date.fromordinal(ordinal).isoformat() if ordinal else ""
+
+
+def timestamp_to_epoch(value) -> int | None:
+    """ISO timestamp -> epoch seconds; naive timestamps are taken as local time."""
+    if not value:
+        return None
+    parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+    return int(parsed.timestamp())
+
+
+def epoch_to_timestamp(epoch: int | None) -> str:
+    return dt_util.as_local(dt_util.utc_from_timestamp(epoch)).isoformat() if epoch is not None else ""
+
+
+class HistoryRecord:
+    """One logged activity, stored compactly.
+
+    Dates are kept as ordinals and timestamps as epoch seconds, so sorting
+    and date-range checks compare integers instead of re-parsing strings.
+    Optional fields that were never set are None and left out of the JSON
+    form; keys this version does not know about are kept in `extra` so
+    they survive a save, as are dates and timestamps that do not parse.
+
+    Records also answer the dict-style get()/[]/in lookups of the JSON
+    form, so code reading history does not care which form it holds.
+    """
+
+    __slots__ = ("id", "date_ordinal", "epoch", "extra")
+    _FIELDS = ()
+
+    def __init__(self, id=None, date_ordinal=0, epoch=None, extra=None, **fields):
+        self.id = id
+        self.date_ordinal = date_ordinal
+        self.epoch = epoch
+        self.extra = extra or None
+        for name in self._FIELDS:
+            setattr(self, name, fields.pop(name, None))
+        if fields:
+            raise TypeError(f"Unknown {type(self).__name__} fields: {sorted(fields)}")
+
+    @classmethod
+    def from_dict(cls, record: dict) -> "HistoryRecord":
+        known = {"id", "date", "timestamp", *cls._FIELDS}
+        extra = {key: value for key, value in record.items() if key not in known}
+        date_ordinal = date_to_ordinal(record.get("date"))
+        epoch = timestamp_to_epoch(record.get("timestamp"))
+        # Keep what does not parse as written rather than losing it on save
+        if record.get("date") and not date_ordinal:
+            extra["date"] = record["date"]
+        if record.get("timestamp") and epoch is None:
+            extra["timestamp"] = record["timestamp"]
+        return cls(
+            id=record.get("id"),
+            date_ordinal=date_ordinal,
+            epoch=epoch,
+            extra=extra,
+            **{name: record[name] for name in cls._FIELDS if name in record},
+        )
+
+    def as_dict(self) -> dict:
+        """The record in its stored JSON form."""
+        record = dict(self.extra) if self.extra else {}
+        if self.id is not None:
+            record["id"] = self.id
+        if self.date_ordinal:
+            record["date"] = self.date
+        for name in self._FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                record[name] = value
+        if self.epoch is not None:
+            record["timestamp"] = self.timestamp
+        return record
+
+    def with_changes(self, **changes) -> "HistoryRecord":
+        """A copy with some fields replaced, given in their JSON form."""
+        return type(self).from_dict({**self.as_dict(), **changes})
+
+    @property
+    def date(self) -> str:
+        return ordinal_to_date(self.date_ordinal)
+
+    @property
+    def timestamp(self) -> str:
+        return epoch_to_timestamp(self.epoch)
+
+    @property
+    def sort_key(self) -> tuple:
+        """Activity date, then time logged."""
+        return self.date_ordinal, self.epoch or 0
+
+    def get(self, key, default=None):
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        return self._lookup(key) is not _MISSING
+
+    def _lookup(self, key):
+        if key == "date" and self.date_ordinal:
+            return self.date
+        if key == "timestamp" and self.epoch is not None:
+            return self.timestamp
+        if key == "id" or key in self._FIELDS:
+            value = getattr(self, key)
+            return _MISSING if value is None else value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        return _MISSING
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+
+class MowRecord(HistoryRecord):
+    __slots__ = ("cut_type", "height_of_cut_inches")
+    _FIELDS = __slots__
+
+
+class ApplicationRecord(HistoryRecord):
+    __slots__ = (
+        "chemical", "method", "rate_description", "detail", "rate_multiplier", "application_type",
+        "applied_amount_lb_per_1000sqft", "applied_amount_oz_per_1000sqft",
+        "total_chemical_needed_oz", "total_chemical_needed_lb",
+    )
+    _FIELDS = __slots__
+
+
+RECORD_TYPES = {
+    MOWING_HISTORY: MowRecord,
+    APPLICATION_HISTORY: ApplicationRecord,
+}
+
+
+def records_from_json(history_key: str, records) -> list:
+    record_type = RECORD_TYPES[history_key]
+    return [record if isinstance(record, HistoryRecord) else record_type.from_dict(record) for record in records]
+
+
+def records_to_json(records) -> list:
+    return [record.as_dict() if isinstance(record, HistoryRecord) else record for record in records]
+
+
+def epoch_now() -> int:
+    return int(dt_util.utcnow().timestamp())
@@ -4,7 +4,7 @@ from typing import Dict, List, Optional, Tuple
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
-from .const import GRASS_TYPES
+from .const import grass_info_for
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -15,17 +15,7 @@ class SeasonalHelper:
         self.grass_type = grass_type
         self.location = location
         self.weather_entity = weather_entity
-
-        if grass_type.startswith("Custom:"):
-            if "warm" in grass_type.lower():
-                self.grass_info = {"season": "warm", "peak_months": [5, 6, 7, 8, 9], "dormant_months": [11, 12, 1, 2]}
-            elif "cool" in grass_type.lower():
-                self.grass_info = {"season": "cool", "peak_months": [3, 4, 5, 9, 10, 11], "dormant_months": [7, 8]}
-            else:
-                self.grass_info = {"season": "transition", "peak_months": [4, 5, 6, 9, 10], "dormant_months": [1, 2, 7, 8]}
-        else:
-            self.grass_info = GRASS_TYPES.get(grass_type, GRASS_TYPES["Bermuda"])
-
+        self.grass_info = grass_info_for(grass_type)
         self.season_type = self.grass_info["season"]
 
     def get_current_season(self) -> str:
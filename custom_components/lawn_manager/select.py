@@ -1,21 +1,50 @@
 from homeassistant.components.select import SelectEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 import logging
 
-from .const import DOMAIN, CHEMICALS, GRASS_TYPE_LIST
-from homeassistant.helpers.storage import Store
-from .const import STORAGE_VERSION, EQUIPMENT_STORAGE_KEY
+from .const import GRASS_TYPE_LIST, CONF_FEATURE_CHEMICALS
+from .control_panel import (
+    SIGNAL_CONTROL_PANEL_UPDATE, ControlScope, async_add_shared_entities, async_add_zone_controls, async_remove_zone_controls,
+    shared_control_zones, uses_shared_controls,
+)
+from .product_catalog import SIGNAL_PRODUCTS_UPDATE, async_get_product_catalog
+from .rate_engine import async_get_rate_engine
 
 _LOGGER = logging.getLogger(__name__)
 
+CONTROL_SUFFIXES = (
+    "activity_type_selection", "chemical_selection", "application_rate",
+    "equipment_select", "method_select", "custom_rate_unit",
+)
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up select entities for Lawn Manager."""
-    chemical_options = list(CHEMICALS.keys()) + ["Custom"]
-    method_options = ["Sprayer", "Spreader", "Hand Application", "Other"]
+    if uses_shared_controls(entry):
+        async_remove_zone_controls(hass, entry, "select", CONTROL_SUFFIXES)
+        equipment_data = await async_get_rate_engine(hass).async_get_equipment()
+
+        def _control_panel_entities():
+            scope = ControlScope.control_panel()
+            return [ControlPanelZoneSelect(hass, scope)] + _control_entities(hass, scope, equipment_data)
+
+        async_add_shared_entities(hass, entry, "control_panel_select", async_add_entities, _control_panel_entities)
+        return
+
+    # Loaded by one shared task, so N zones starting up read the equipment store once
+    equipment_data = await async_get_rate_engine(hass).async_get_equipment()
+    async_add_zone_controls(
+        hass, entry, "select", CONTROL_SUFFIXES, async_add_entities,
+        _control_entities(hass, ControlScope.for_zone(entry), equipment_data),
+    )
+
 
-    equipment_store = Store(hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
-    equipment_data = await equipment_store.async_load() or {}
+def _control_entities(hass, scope, equipment_data):
+    """The select controls for one zone or for the shared control panel."""
+    chemical_options = async_get_product_catalog(hass).names() + ["Custom"]
+    method_options = ["Sprayer", "Spreader", "Hand Application", "Other"]
 
     equipment_options = []
     for eq_id, eq_info in equipment_data.items():
@@ -28,47 +57,109 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_e
     entities = []
 
     # --- Mowing Controls ---
-    activity_type_select = LawnCutTypeSelect(hass, entry, cut_type_options)
+    activity_type_select = LawnCutTypeSelect(hass, scope, cut_type_options)
     entities.append(activity_type_select)
 
+    if not scope.uses_chemical_inputs:
+        return entities
+
     # --- Chemical Application Controls ---
     entities.extend([
-        LawnChemicalSelect(hass, entry, chemical_options),
-        LawnRateOverrideSelect(hass, entry, rate_options),
+        LawnChemicalSelect(hass, scope, chemical_options),
+        LawnRateOverrideSelect(hass, scope, rate_options),
     ])
 
     # Equipment or method selection
     has_actual_equipment = len(equipment_options) > 1 or (len(equipment_options) == 1 and equipment_options[0] != "None")
     if has_actual_equipment:
-        entities.append(LawnEquipmentSelect(hass, entry, equipment_options, equipment_data))
+        entities.append(LawnEquipmentSelect(hass, scope, equipment_options, equipment_data))
     else:
-        entities.append(LawnMethodSelect(hass, entry, method_options))
+        entities.append(LawnMethodSelect(hass, scope, method_options))
 
     # --- Chemical Application Rate Unit for Custom ---
-    entities.append(LawnCustomRateUnitSelect(hass, entry))
+    if scope.has_feature(CONF_FEATURE_CHEMICALS):
+        entities.append(LawnCustomRateUnitSelect(hass, scope))
+
+    return entities
+
+
+class ControlPanelZoneSelect(SelectEntity):
+    """Picks which zone the shared control panel's buttons act on."""
+
+    def __init__(self, hass, scope):
+        self._hass = hass
+        self._scope = scope
+        self._attr_name = "Control Panel Zone"
+        self._attr_unique_id = scope.unique_id("zone_select")
+        self._attr_icon = "mdi:map-marker-radius"
+        self._attr_current_option = None
+        self._unsub_dispatcher = None
+
+    async def async_added_to_hass(self):
+        self._unsub_dispatcher = async_dispatcher_connect(
+            self.hass, SIGNAL_CONTROL_PANEL_UPDATE, self._handle_zones_changed
+        )
+
+    async def async_will_remove_from_hass(self):
+        if self._unsub_dispatcher:
+            self._unsub_dispatcher()
+            self._unsub_dispatcher = None
+
+    async def _handle_zones_changed(self):
+        self.async_write_ha_state()
+
+    @property
+    def options(self):
+        return sorted(shared_control_zones(self._hass)) or ["None"]
+
+    @property
+    def current_option(self):
+        options = self.options
+        if self._attr_current_option in options:
+            return self._attr_current_option
+        return options[0]
 
-    async_add_entities(entities)
+    @property
+    def device_info(self):
+        return self._scope.device_info()
+
+    async def async_select_option(self, option: str) -> None:
+        self._attr_current_option = option
+        self.async_write_ha_state()
 
 
 class LawnChemicalSelect(SelectEntity):
-    def __init__(self, hass, entry, options):
+    def __init__(self, hass, scope, options):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Chemical Selection"
-        self._attr_unique_id = f"{entry.entry_id}_chemical_selection"
+        self._attr_unique_id = scope.unique_id("chemical_selection")
         self._attr_options = options
         self._attr_current_option = options[0]
         self._attr_icon = "mdi:flask-outline"
         self._attr_entity_category = None
+        self._unsub_products = None
+
+    async def async_added_to_hass(self):
+        self._unsub_products = async_dispatcher_connect(
+            self._hass, SIGNAL_PRODUCTS_UPDATE, self._handle_products_update
+        )
+
+    async def async_will_remove_from_hass(self):
+        if self._unsub_products:
+            self._unsub_products()
+            self._unsub_products = None
+
+    @callback
+    def _handle_products_update(self):
+        self._attr_options = async_get_product_catalog(self._hass).names() + ["Custom"]
+        if self._attr_current_option not in self._attr_options:
+            self._attr_current_option = self._attr_options[0]
+        self.async_write_ha_state()
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_select_option(self, option: str) -> None:
         self._attr_current_option = option
@@ -76,23 +167,18 @@ class LawnChemicalSelect(SelectEntity):
 
 
 class LawnRateOverrideSelect(SelectEntity):
-    def __init__(self, hass, entry, options):
+    def __init__(self, hass, scope, options):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Application Rate"
-        self._attr_unique_id = f"{entry.entry_id}_application_rate"
+        self._attr_unique_id = scope.unique_id("application_rate")
         self._attr_options = options
         self._attr_current_option = options[0]
         self._attr_icon = "mdi:gauge"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_select_option(self, option: str) -> None:
         self._attr_current_option = option
@@ -102,11 +188,11 @@ class LawnRateOverrideSelect(SelectEntity):
 class LawnCustomRateUnitSelect(SelectEntity):
     """Select entity for choosing custom rate units (oz or lb per 1000sqft)."""
 
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Custom Rate Unit"
-        self._attr_unique_id = f"{entry.entry_id}_custom_rate_unit"
+        self._attr_unique_id = scope.unique_id("custom_rate_unit")
         self._attr_options = [
             "Multiplier (1.0x = default rate)",
             "oz per 1,000 sq ft",
@@ -118,12 +204,7 @@ class LawnCustomRateUnitSelect(SelectEntity):
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_select_option(self, option: str) -> None:
         self._attr_current_option = option
@@ -131,23 +212,18 @@ class LawnCustomRateUnitSelect(SelectEntity):
 
 
 class LawnMethodSelect(SelectEntity):
-    def __init__(self, hass, entry, options):
+    def __init__(self, hass, scope, options):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Application Method"
-        self._attr_unique_id = f"{entry.entry_id}_method_select"
+        self._attr_unique_id = scope.unique_id("method_select")
         self._attr_options = options
         self._attr_current_option = options[0]
         self._attr_icon = "mdi:spray"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_select_option(self, option: str) -> None:
         self._attr_current_option = option
@@ -157,19 +233,18 @@ class LawnMethodSelect(SelectEntity):
 class LawnEquipmentSelect(SelectEntity):
     """Select entity for choosing equipment."""
 
-    def __init__(self, hass, entry, options, equipment_data):
+    def __init__(self, hass, scope, options, equipment_data):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._equipment_data = equipment_data
         self._attr_name = "Equipment Selection"
-        self._attr_unique_id = f"{entry.entry_id}_equipment_select"
+        self._attr_unique_id = scope.unique_id("equipment_select")
         self._attr_options = options
         self._attr_current_option = options[0] if options else "None"
         self._attr_icon = "mdi:tools"
         self._unsub_dispatcher = None
 
     async def async_added_to_hass(self):
-        from homeassistant.helpers.dispatcher import async_dispatcher_connect
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, "lawn_manager_equipment_update", self._handle_equipment_update
         )
@@ -180,8 +255,7 @@ class LawnEquipmentSelect(SelectEntity):
             self._unsub_dispatcher = None
 
     async def _handle_equipment_update(self):
-        equipment_store = Store(self._hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
-        equipment_data = await equipment_store.async_load() or {}
+        equipment_data = await async_get_rate_engine(self._hass).async_get_equipment()
         self._equipment_data = equipment_data
 
         new_options = []
@@ -197,12 +271,7 @@ class LawnEquipmentSelect(SelectEntity):
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     @property
     def extra_state_attributes(self):
@@ -230,11 +299,11 @@ class LawnEquipmentSelect(SelectEntity):
 class LawnCutTypeSelect(SelectEntity):
     """Select entity for choosing cut type."""
 
-    def __init__(self, hass, entry, options):
+    def __init__(self, hass, scope, options):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Activity Type Selection"
-        self._attr_unique_id = f"{entry.entry_id}_activity_type_selection"
+        self._attr_unique_id = scope.unique_id("activity_type_selection")
         self._attr_options = options
         self._attr_current_option = options[0]
         self._attr_icon = "mdi:content-cut"
@@ -242,12 +311,7 @@ class LawnCutTypeSelect(SelectEntity):
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Mowing",
-        }
+        return self._scope.device_info("Mowing")
 
     @property
     def extra_state_attributes(self):
@@ -1,29 +1,56 @@
 from datetime import datetime, timedelta
+import heapq
+import itertools
 import logging
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.storage import Store
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.util import dt as dt_util
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import DOMAIN, DEFAULT_MOW_INTERVAL, STORAGE_VERSION, get_storage_key
-from .weather_helper import WeatherHelper
+from .const import (
+    DOMAIN, DEFAULT_MOW_INTERVAL,
+    CONF_MAX_CHEMICAL_SENSORS, CONF_CHEMICAL_RETENTION_DAYS, DEFAULT_MAX_CHEMICAL_SENSORS,
+    DEFAULT_CHEMICAL_RETENTION_DAYS, CONF_FEATURE_CHEMICALS, CONF_FEATURE_RATE_CALCULATOR,
+)
+from .control_panel import async_add_shared_entities
+from .day_rollover import async_track_day_rollover
+from .equipment_store import SIGNAL_EQUIPMENT_UPDATE, async_get_equipment_store
+from .features import zone_has_feature
+from .lazy_import import async_import_helper
+from .records import MowRecord
+from .zone_registry import get_loaded_zone
+from .zone_storage import async_load_zone_data
+from .signals import (
+    APPLICATION_CHANGES, CHANGE_RATE_CALCULATED, HISTORY_CHANGES, MOWING_CHANGES, change_affects,
+    change_affects_chemical, zone_update_signal,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-try:
-    from .seasonal_helper import SeasonalHelper
-    SEASONAL_AVAILABLE = True
-except ImportError:
-    SEASONAL_AVAILABLE = False
-    _LOGGER.warning("Seasonal helper not available - seasonal features disabled")
+# Headline numbers of the last rate calculation; notes, instructions and
+# kitchen measurements are in the calculate_application_rate response
+RATE_SENSOR_ATTRIBUTES = (
+    "zone", "chemical", "equipment", "equipment_type", "lawn_size_sqft", "rate_multiplier", "application_rate",
+    "total_chemical_needed_oz", "total_chemical_needed_lb", "total_water_needed_gal", "tanks_needed",
+    "chemical_per_tank_oz", "loads_needed", "error",
+)
+
+
+async def _async_weather_helper(hass, weather_entity):
+    """Forecast parsing lives in weather_helper, imported only once a zone with a weather entity needs it."""
+    return (await async_import_helper(hass, "weather_helper")).WeatherHelper(hass, weather_entity)
+
+
+async def _async_seasonal_helper(hass, grass_type, location, weather_entity):
+    return (await async_import_helper(hass, "seasonal_helper")).SeasonalHelper(hass, grass_type, location, weather_entity)
 
 
 def _get_zone_data(hass, entry_id):
     """Read zone data from shared hass.data (in-memory, always fresh)."""
-    zone_info = hass.data.get(DOMAIN, {}).get(entry_id)
+    zone_info = get_loaded_zone(hass, entry_id)
     if zone_info:
         return zone_info.get("data", {})
     return None
@@ -34,17 +61,14 @@ class LawnManagerSensorManager:
         self.hass = hass
         self.entry = entry
         self.async_add_entities = async_add_entities
-        self.known_chemicals = set()
         self.chemical_sensors = {}
         self.mow_sensor = None
         self._unsub_dispatcher = None
+        self._max_chemical_sensors = entry.data.get(CONF_MAX_CHEMICAL_SENSORS, DEFAULT_MAX_CHEMICAL_SENSORS)
+        self._chemical_retention_days = entry.data.get(CONF_CHEMICAL_RETENTION_DAYS, DEFAULT_CHEMICAL_RETENTION_DAYS)
 
     async def async_setup(self):
-        data = _get_zone_data(self.hass, self.entry.entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self.entry.entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self.entry.entry_id)
         config = self.entry.data
         yard_zone = config.get("yard_zone", "Lawn")
         location = config.get("location", "Unknown")
@@ -62,29 +86,30 @@ class LawnManagerSensorManager:
             self.weather_sensor = LawnWeatherSensor(self.entry.entry_id, yard_zone, weather_entity, grass_type, location, rain_sensor)
             entities.append(self.weather_sensor)
 
-        if SEASONAL_AVAILABLE:
-            self.seasonal_sensor = LawnSeasonalSensor(self.entry.entry_id, yard_zone, grass_type, location, weather_entity)
-            entities.append(self.seasonal_sensor)
+        self.seasonal_sensor = LawnSeasonalSensor(self.entry.entry_id, yard_zone, grass_type, location, weather_entity)
+        entities.append(self.seasonal_sensor)
 
-        applications = data.get("applications", {})
-        if isinstance(applications, list):
-            applications = {app.get("chemical_name", f"Chemical {i}"): app
-                          for i, app in enumerate(applications) if isinstance(app, dict)}
-            data["applications"] = applications
-            await store.async_save(data)
+        applications = data["applications"]
 
-        for chem_name, chem_data in applications.items():
-            self.known_chemicals.add(chem_name)
-            sensor = ChemicalApplicationSensor(self.entry.entry_id, yard_zone, chem_name, chem_data, weather_entity)
+        for chem_name in self._chemicals_to_track(applications):
+            sensor = ChemicalApplicationSensor(self.entry.entry_id, yard_zone, chem_name, applications[chem_name], weather_entity)
             self.chemical_sensors[chem_name] = sensor
             entities.append(sensor)
+        self._async_remove_untracked_registry_entries(applications)
 
-        self.equipment_sensor = EquipmentInventorySensor(self.entry.entry_id, yard_zone, location)
-        entities.append(self.equipment_sensor)
+        _async_remove_legacy_equipment_sensor(self.hass, self.entry.entry_id, yard_zone)
+        # Equipment is global: one inventory sensor for the whole integration
+        async_add_shared_entities(
+            self.hass, self.entry, "equipment_inventory", self.async_add_entities,
+            lambda: [EquipmentInventorySensor()],
+        )
 
         # Rate calculation result sensor
-        self.rate_sensor = RateCalculationSensor(self.entry.entry_id, yard_zone)
-        entities.append(self.rate_sensor)
+        if zone_has_feature(self.entry, CONF_FEATURE_RATE_CALCULATOR):
+            self.rate_sensor = RateCalculationSensor(self.entry.entry_id, yard_zone)
+            entities.append(self.rate_sensor)
+        else:
+            _async_remove_sensor(self.hass, RateCalculationSensor.unique_id_for(self.entry.entry_id, yard_zone))
 
         # Unified activity history sensor
         self.history_sensor = ActivityHistorySensor(self.entry.entry_id, yard_zone)
@@ -92,50 +117,112 @@ class LawnManagerSensorManager:
 
         self.async_add_entities(entities, update_before_add=False)
 
-        signal_name = f"lawn_manager_update_{self.entry.entry_id}"
+        signal_name = zone_update_signal(self.entry.entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(self.hass, signal_name, self._handle_update_signal)
-        self._unsub_equipment_dispatcher = async_dispatcher_connect(self.hass, "lawn_manager_equipment_update", self._handle_equipment_update_signal)
+        self.entry.async_on_unload(self._unsub_dispatcher)
+        self.entry.async_on_unload(async_track_day_rollover(self.hass, self._handle_day_rollover))
+
+    def _chemicals_to_track(self, applications):
+        """Chemicals that get a sensor, most recently applied first.
+
+        Products not applied within the retention window are dropped, and
+        of the rest only the most recent max_chemical_sensors are kept, so
+        one-off entries (typos in the custom chemical field included) age
+        out instead of living forever. Zones without the chemicals feature
+        track none.
+        """
+        if not zone_has_feature(self.entry, CONF_FEATURE_CHEMICALS):
+            return []
+        cutoff = dt_util.now().date() - timedelta(days=self._chemical_retention_days)
+        recent = []
+        for chem_name, chem_data in applications.items():
+            try:
+                last_applied = datetime.strptime(chem_data.get("last_applied") or "", "%Y-%m-%d").date()
+            except ValueError:
+                continue
+            if last_applied >= cutoff:
+                recent.append((last_applied, chem_name))
+        recent.sort(reverse=True)
+        return [chem_name for _, chem_name in recent[:self._max_chemical_sensors]]
+
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, *APPLICATION_CHANGES):
+            return
+        data = await async_load_zone_data(self.hass, self.entry.entry_id)
+        self._async_sync_chemical_sensors(data["applications"])
 
-    async def _handle_update_signal(self):
+    @callback
+    def _handle_day_rollover(self):
         data = _get_zone_data(self.hass, self.entry.entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self.entry.entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
-
-        current_chems = set(data.get("applications", {}).keys())
-        new_chems = current_chems - self.known_chemicals
-
-        if new_chems:
-            new_entities = []
-            config = self.entry.data
-            yard_zone = config.get("yard_zone", "Lawn")
-
-            for chem_name in new_chems:
-                chem_data = data["applications"][chem_name]
-                sensor = ChemicalApplicationSensor(
-                    self.entry.entry_id,
-                    yard_zone,
-                    chem_name,
-                    chem_data,
-                    self.mow_sensor._weather_entity if hasattr(self.mow_sensor, '_weather_entity') else None
-                )
-                self.chemical_sensors[chem_name] = sensor
-                new_entities.append(sensor)
-
-            if new_entities:
-                self.async_add_entities(new_entities)
-
-            self.known_chemicals = current_chems
-
-        for sensor in self.chemical_sensors.values():
-            await sensor.async_update()
-            sensor.async_write_ha_state()
-
-    async def _handle_equipment_update_signal(self):
-        if hasattr(self, 'equipment_sensor') and self.equipment_sensor:
-            await self.equipment_sensor.async_update()
-            self.equipment_sensor.async_write_ha_state()
+        if data is not None:
+            self._async_sync_chemical_sensors(data["applications"])
+
+    @callback
+    def _async_sync_chemical_sensors(self, applications):
+        """Add sensors for newly tracked chemicals and evict the rest."""
+        tracked = self._chemicals_to_track(applications)
+
+        for chem_name in set(self.chemical_sensors) - set(tracked):
+            self._async_evict_chemical_sensor(chem_name)
+
+        new_entities = []
+        yard_zone = self.entry.data.get("yard_zone", "Lawn")
+        weather_entity = self.entry.data.get("weather_entity")
+        for chem_name in tracked:
+            if chem_name in self.chemical_sensors:
+                continue
+            sensor = ChemicalApplicationSensor(
+                self.entry.entry_id, yard_zone, chem_name, applications[chem_name], weather_entity
+            )
+            self.chemical_sensors[chem_name] = sensor
+            new_entities.append(sensor)
+
+        if new_entities:
+            self.async_add_entities(new_entities)
+
+    @callback
+    def _async_evict_chemical_sensor(self, chem_name):
+        sensor = self.chemical_sensors.pop(chem_name)
+        _LOGGER.info("Removing %s sensor for %s: not applied recently enough to keep",
+                     chem_name, self.entry.data.get("yard_zone", "Lawn"))
+        registry = er.async_get(self.hass)
+        if sensor.entity_id and registry.async_get(sensor.entity_id):
+            # Removing the registry entry also removes the entity
+            registry.async_remove(sensor.entity_id)
+        elif sensor.hass:
+            self.hass.async_create_task(sensor.async_remove())
+
+    @callback
+    def _async_remove_untracked_registry_entries(self, applications):
+        """Drop registry entries left by chemical sensors evicted in earlier runs."""
+        registry = er.async_get(self.hass)
+        for chem_name in applications:
+            if chem_name in self.chemical_sensors:
+                continue
+            unique_id = ChemicalApplicationSensor.unique_id_for(self.entry.entry_id, chem_name)
+            entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+            if entity_id:
+                registry.async_remove(entity_id)
+
+
+@callback
+def _async_remove_legacy_equipment_sensor(hass, entry_id, yard_zone):
+    """Drop the per-zone equipment sensor that older versions created."""
+    registry = er.async_get(hass)
+    legacy_unique_id = f"lawn_manager_{entry_id}_{yard_zone.lower().replace(' ', '_')}_equipment"
+    legacy_entity_id = registry.async_get_entity_id("sensor", DOMAIN, legacy_unique_id)
+    if legacy_entity_id:
+        _LOGGER.info("Removing per-zone equipment sensor %s, replaced by the shared inventory", legacy_entity_id)
+        registry.async_remove(legacy_entity_id)
+
+
+@callback
+def _async_remove_sensor(hass, unique_id):
+    """Drop the registry entry of a sensor the zone's features no longer create."""
+    registry = er.async_get(hass)
+    entity_id = registry.async_get_entity_id("sensor", DOMAIN, unique_id)
+    if entity_id:
+        registry.async_remove(entity_id)
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
@@ -155,7 +242,7 @@ class LawnMowSensor(SensorEntity):
         self._latest_activity = None
 
     async def async_added_to_hass(self):
-        signal_name = f"lawn_manager_update_{self._entry_id}"
+        signal_name = zone_update_signal(self._entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
@@ -164,29 +251,35 @@ class LawnMowSensor(SensorEntity):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, *MOWING_CHANGES):
+            return
+        before = self._state_inputs()
         await self.async_update()
-        self.async_write_ha_state()
+        if self._state_inputs() != before:
+            self.async_write_ha_state()
+
+    def _state_inputs(self):
+        # Everything state and attributes are built from; records are
+        # replaced, never modified, so comparing them by identity is enough
+        return self._last_mow, self._latest_activity
 
     async def async_update(self):
-        data = _get_zone_data(self.hass, self._entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self._entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self._entry_id)
         try:
-            if data.get("last_mow"):
+            if data["last_mow"]:
                 self._last_mow = dt_util.as_local(
-                    datetime.strptime(data.get("last_mow"), "%Y-%m-%d")
+                    datetime.strptime(data["last_mow"], "%Y-%m-%d")
                 )
             else:
                 self._last_mow = None
         except Exception:
             self._last_mow = dt_util.now() - timedelta(days=self._mow_interval + 1)
 
-        mowing_history = data.get("mowing_history", [])
+        mowing_history = data["mowing_history"]
         if mowing_history:
-            self._latest_activity = mowing_history[-1]
+            # Newest by activity date, like last_mow; on ties the one logged last
+            self._latest_activity = max(reversed(mowing_history), key=lambda record: record.sort_key)
         else:
             self._latest_activity = None
 
@@ -253,43 +346,64 @@ class LawnMowDueSensor(SensorEntity):
         self._grass_type = grass_type
         self._seasonal_helper = None
         self._unsub_dispatcher = None
+        self._unsub_rollover = None
+        self._days_until_due = None
+        # Day-based values are refreshed by the midnight rollover; only
+        # the weather attributes still need polling.
+        self._attr_should_poll = bool(weather_entity)
 
     async def async_added_to_hass(self):
-        signal_name = f"lawn_manager_update_{self._entry_id}"
+        signal_name = zone_update_signal(self._entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
+        self._unsub_rollover = async_track_day_rollover(self.hass, self._handle_day_rollover)
         if self._weather_entity:
-            self._weather_helper = WeatherHelper(self.hass, self._weather_entity)
+            self._weather_helper = await _async_weather_helper(self.hass, self._weather_entity)
 
-        if SEASONAL_AVAILABLE:
-            self._seasonal_helper = SeasonalHelper(self.hass, self._grass_type, self._location, self._weather_entity)
+        self._seasonal_helper = await _async_seasonal_helper(
+            self.hass, self._grass_type, self._location, self._weather_entity
+        )
 
     async def async_will_remove_from_hass(self):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
+        if self._unsub_rollover:
+            self._unsub_rollover()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, *HISTORY_CHANGES):
+            return
         await self.async_update()
         self.async_write_ha_state()
 
+    @callback
+    def _handle_day_rollover(self):
+        days_until_due = self._compute_days_until_due()
+        if days_until_due != self._days_until_due:
+            self._days_until_due = days_until_due
+            self.async_write_ha_state()
+
+    def _compute_days_until_due(self):
+        if not self._last_mow:
+            return None
+        due_date = (self._last_mow + timedelta(days=self._mow_interval)).date()
+        return (due_date - dt_util.now().date()).days
+
     async def async_update(self):
-        data = _get_zone_data(self.hass, self._entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self._entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self._entry_id)
         try:
-            if data.get("last_mow"):
+            if data["last_mow"]:
                 self._last_mow = dt_util.as_local(
-                    datetime.strptime(data.get("last_mow"), "%Y-%m-%d")
+                    datetime.strptime(data["last_mow"], "%Y-%m-%d")
                 )
             else:
                 self._last_mow = None
         except Exception:
             self._last_mow = None
 
-        self._application_history = data.get("applications", {})
+        self._days_until_due = self._compute_days_until_due()
+        self._application_history = data["applications"]
 
     @property
     def name(self):
@@ -317,8 +431,9 @@ class LawnMowDueSensor(SensorEntity):
                 "days_until_due": "Unknown"
             }
         else:
-            due_date = self._last_mow + timedelta(days=self._mow_interval)
-            days_until_due = (due_date - dt_util.now()).days
+            days_until_due = self._days_until_due
+            if days_until_due is None:
+                days_until_due = self._compute_days_until_due()
 
             base_attrs = {
                 "mow_interval_days": self._mow_interval,
@@ -382,38 +497,68 @@ class ChemicalApplicationSensor(SensorEntity):
         self._unsub_dispatcher = None
         self._weather_entity = weather_entity
         self._weather_helper = None
+        self._unsub_rollover = None
+        # Days since applied is refreshed by the midnight rollover; only
+        # the weather attributes still need polling.
+        self._attr_should_poll = bool(weather_entity)
 
         if self._last_applied:
             try:
-                last_dt = dt_util.as_local(datetime.strptime(self._last_applied, "%Y-%m-%d"))
-                self._state = (dt_util.now() - last_dt).days
+                self._state = self._compute_days_since_applied()
             except Exception:
                 self._state = None
 
     async def async_added_to_hass(self):
-        signal_name = f"lawn_manager_update_{self._entry_id}"
+        signal_name = zone_update_signal(self._entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
+        self._unsub_rollover = async_track_day_rollover(self.hass, self._handle_day_rollover)
         if self._weather_entity:
-            self._weather_helper = WeatherHelper(self.hass, self._weather_entity)
+            self._weather_helper = await _async_weather_helper(self.hass, self._weather_entity)
 
     async def async_will_remove_from_hass(self):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
+        if self._unsub_rollover:
+            self._unsub_rollover()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects_chemical(change, self._chemical_name):
+            return
+        before = self._state_inputs()
         await self.async_update()
-        self.async_write_ha_state()
+        if self._state_inputs() != before:
+            self.async_write_ha_state()
+
+    def _state_inputs(self):
+        # Everything state, name and attributes are built from
+        return (
+            self._state, self._last_applied, self._interval_days, self._default_amount_lb, self._default_amount_oz,
+            self._applied_amount_lb, self._applied_amount_oz, self._rate_multiplier, self._rate_description,
+            self._method,
+        )
+
+    @callback
+    def _handle_day_rollover(self):
+        if not self._last_applied:
+            return
+        try:
+            days_since = self._compute_days_since_applied()
+        except ValueError:
+            return
+        if days_since != self._state:
+            self._state = days_since
+            self.async_write_ha_state()
+
+    def _compute_days_since_applied(self):
+        last_date = datetime.strptime(self._last_applied, "%Y-%m-%d").date()
+        return (dt_util.now().date() - last_date).days
 
     async def async_update(self):
-        data = _get_zone_data(self.hass, self._entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self._entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self._entry_id)
 
-        chem_data = data.get("applications", {}).get(self._chemical_name, {})
+        chem_data = data["applications"].get(self._chemical_name, {})
         if chem_data:
             self._last_applied = chem_data.get("last_applied")
             self._interval_days = chem_data.get("interval_days", 30)
@@ -430,8 +575,7 @@ class ChemicalApplicationSensor(SensorEntity):
             return
 
         try:
-            last_dt = dt_util.as_local(datetime.strptime(self._last_applied, "%Y-%m-%d"))
-            self._state = (dt_util.now() - last_dt).days
+            self._state = self._compute_days_since_applied()
         except Exception as e:
             _LOGGER.error("Error parsing last_applied for %s: %s", self._chemical_name, e)
             self._state = None
@@ -490,9 +634,13 @@ class ChemicalApplicationSensor(SensorEntity):
             _LOGGER.error("Error generating attributes for %s: %s", self._chemical_name, e)
             return {}
 
+    @staticmethod
+    def unique_id_for(entry_id, chemical_name):
+        return f"lawn_manager_{entry_id}_{chemical_name.lower().replace(' ', '_')}_application"
+
     @property
     def unique_id(self):
-        return f"lawn_manager_{self._entry_id}_{self._chemical_name.lower().replace(' ', '_')}_application"
+        return self.unique_id_for(self._entry_id, self._chemical_name)
 
     @property
     def icon(self):
@@ -508,7 +656,17 @@ class ChemicalApplicationSensor(SensorEntity):
 
 
 class LawnSeasonalSensor(SensorEntity):
-    """Dedicated sensor for seasonal lawn care intelligence."""
+    """Dedicated sensor for seasonal lawn care intelligence.
+
+    Long how-to text and per-task details are served by the
+    get_seasonal_details service instead of state attributes.
+    """
+
+    # Explanatory text, kept for dashboards but not written to the recorder
+    _unrecorded_attributes = frozenset({
+        "mow_frequency_reason", "temperature_warnings", "pre_emergent_reason", "pre_emergent_timing",
+        "pre_emergent_product", "scalping_reason", "dethatching_reason", "aeration_reason",
+    })
 
     def __init__(self, entry_id, yard_zone, grass_type, location, weather_entity=None):
         self._entry_id = entry_id
@@ -518,13 +676,16 @@ class LawnSeasonalSensor(SensorEntity):
         self._weather_entity = weather_entity
         self._seasonal_helper = None
         self._application_history = {}
+        self._seasonal_info = None
         self._unsub_dispatcher = None
 
     async def async_added_to_hass(self):
-        if SEASONAL_AVAILABLE:
-            self._seasonal_helper = SeasonalHelper(self.hass, self._grass_type, self._location, self._weather_entity)
+        self._seasonal_helper = await _async_seasonal_helper(
+            self.hass, self._grass_type, self._location, self._weather_entity
+        )
+        await self.async_update()
 
-        signal_name = f"lawn_manager_update_{self._entry_id}"
+        signal_name = zone_update_signal(self._entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
@@ -533,17 +694,23 @@ class LawnSeasonalSensor(SensorEntity):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, *APPLICATION_CHANGES):
+            return
         await self.async_update()
         self.async_write_ha_state()
 
     async def async_update(self):
-        data = _get_zone_data(self.hass, self._entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self._entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
-        self._application_history = data.get("applications", {})
+        data = await async_load_zone_data(self.hass, self._entry_id)
+        self._application_history = data["applications"]
+
+        # State, icon and attributes all read this one summary per update
+        self._seasonal_info = None
+        if self._seasonal_helper:
+            try:
+                self._seasonal_info = self._seasonal_helper.get_seasonal_summary(self._application_history)
+            except Exception as e:
+                _LOGGER.warning("Error getting seasonal information: %s", e)
 
     @property
     def name(self):
@@ -555,7 +722,7 @@ class LawnSeasonalSensor(SensorEntity):
             return "unavailable"
 
         try:
-            seasonal_info = self._seasonal_helper.get_seasonal_summary(self._application_history)
+            seasonal_info = self._seasonal_info
             season = seasonal_info["season"]
             growing = seasonal_info["growing_season"]
 
@@ -572,8 +739,7 @@ class LawnSeasonalSensor(SensorEntity):
             return "mdi:calendar-question"
 
         try:
-            seasonal_info = self._seasonal_helper.get_seasonal_summary(self._application_history)
-            season = seasonal_info["season"]
+            season = self._seasonal_info["season"]
             icons = {"spring": "mdi:flower-tulip", "summer": "mdi:white-balance-sunny",
                      "fall": "mdi:leaf-maple", "winter": "mdi:snowflake"}
             return icons.get(season, "mdi:calendar-clock")
@@ -589,9 +755,15 @@ class LawnSeasonalSensor(SensorEntity):
                 "status": "Seasonal intelligence unavailable"
             }
 
-        try:
-            seasonal_info = self._seasonal_helper.get_seasonal_summary(self._application_history)
+        seasonal_info = self._seasonal_info
+        if seasonal_info is None:
+            return {
+                "grass_type": self._grass_type,
+                "location": self._location,
+                "status": "Error loading seasonal data"
+            }
 
+        try:
             attrs = {
                 "grass_type": self._grass_type,
                 "location": self._location,
@@ -607,15 +779,6 @@ class LawnSeasonalSensor(SensorEntity):
                 "high_priority_tasks": [task["task"] for task in seasonal_info["task_reminders"] if task["priority"].upper() == "HIGH"],
                 "medium_priority_tasks": [task["task"] for task in seasonal_info["task_reminders"] if task["priority"].upper() == "MEDIUM"],
                 "low_priority_tasks": [task["task"] for task in seasonal_info["task_reminders"] if task["priority"].upper() == "LOW"],
-                "chemical_details": [
-                    {"task": chem_name, "priority": chem_info["priority"], "reason": chem_info["reason"]}
-                    for chem_name, chem_info in seasonal_info["chemical_recommendations"].items()
-                ],
-                "task_details": [
-                    {"task": task["task"], "priority": task["priority"],
-                     "reason": task.get("reason", task.get("deadline", ""))}
-                    for task in seasonal_info["task_reminders"]
-                ],
             }
 
             # Add detailed lawn care recommendations
@@ -632,24 +795,16 @@ class LawnSeasonalSensor(SensorEntity):
                 scalp = seasonal_info["scalping"]
                 attrs["scalping_recommended"] = scalp.get("recommended", False)
                 attrs["scalping_reason"] = scalp.get("reason", "")
-                if scalp.get("how_to"):
-                    attrs["scalping_instructions"] = scalp["how_to"]
 
             if "dethatching" in seasonal_info:
                 dethatch = seasonal_info["dethatching"]
                 attrs["dethatching_recommended"] = dethatch.get("recommended", False)
                 attrs["dethatching_reason"] = dethatch.get("reason", "")
-                if dethatch.get("how_to"):
-                    attrs["dethatching_instructions"] = dethatch["how_to"]
-                if dethatch.get("alternatives"):
-                    attrs["dethatching_alternatives"] = dethatch["alternatives"]
 
             if "aeration" in seasonal_info:
                 aerate = seasonal_info["aeration"]
                 attrs["aeration_recommended"] = aerate.get("recommended", False)
                 attrs["aeration_reason"] = aerate.get("reason", "")
-                if aerate.get("how_to"):
-                    attrs["aeration_instructions"] = aerate["how_to"]
 
             if seasonal_info.get("estimated_soil_temp") is not None:
                 attrs["estimated_soil_temp_f"] = round(seasonal_info["estimated_soil_temp"], 1)
@@ -689,7 +844,7 @@ class LawnWeatherSensor(SensorEntity):
 
     async def async_added_to_hass(self):
         if self._weather_entity:
-            self._weather_helper = WeatherHelper(self.hass, self._weather_entity)
+            self._weather_helper = await _async_weather_helper(self.hass, self._weather_entity)
 
     async def async_update(self):
         if not self._weather_entity:
@@ -787,16 +942,17 @@ class LawnWeatherSensor(SensorEntity):
 
 
 class EquipmentInventorySensor(SensorEntity):
-    def __init__(self, entry_id, yard_zone, location):
-        self._entry_id = entry_id
-        self._yard_zone = yard_zone
-        self._location = location
+    """Integration-wide equipment inventory, on its own "Lawn Equipment" device."""
+
+    _unrecorded_attributes = frozenset({"equipment_list"})
+
+    def __init__(self):
         self._equipment_list = []
         self._unsub_dispatcher = None
 
     async def async_added_to_hass(self):
         self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass, "lawn_manager_equipment_update", self._handle_equipment_update_signal
+            self.hass, SIGNAL_EQUIPMENT_UPDATE, self._handle_equipment_update_signal
         )
 
     async def async_will_remove_from_hass(self):
@@ -808,8 +964,7 @@ class EquipmentInventorySensor(SensorEntity):
         self.async_write_ha_state()
 
     async def async_update(self):
-        equipment_store = Store(self.hass, 1, "lawn_manager_equipment")
-        equipment_data = await equipment_store.async_load() or {}
+        equipment_data = await async_get_equipment_store(self.hass).async_get()
 
         self._equipment_list = []
         for eq_id, eq_info in equipment_data.items():
@@ -823,7 +978,7 @@ class EquipmentInventorySensor(SensorEntity):
 
     @property
     def name(self):
-        return f"{self._yard_zone} Equipment Inventory"
+        return "Equipment Inventory"
 
     @property
     def state(self):
@@ -841,30 +996,22 @@ class EquipmentInventorySensor(SensorEntity):
         if not self._equipment_list:
             return {"equipment_count": 0, "status": "No equipment. Add via service or config flow."}
 
-        attrs = {
+        return {
             "equipment_count": len(self._equipment_list),
+            "equipment_list": self._equipment_list,
         }
-        for i, item in enumerate(self._equipment_list):
-            prefix = f"equipment_{i+1}"
-            attrs[f"{prefix}_name"] = item["name"]
-            attrs[f"{prefix}_type"] = item["type"]
-            attrs[f"{prefix}_brand"] = item["brand"]
-            attrs[f"{prefix}_capacity"] = item["capacity"]
-            attrs[f"{prefix}_id"] = item["id"]
-
-        attrs["equipment_list"] = self._equipment_list
-        return attrs
 
     @property
     def unique_id(self):
-        return f"lawn_manager_{self._entry_id}_{self._yard_zone.lower().replace(' ', '_')}_equipment"
+        return "lawn_manager_equipment_inventory"
 
     @property
     def device_info(self):
         return {
-            "identifiers": {(DOMAIN, self._entry_id)},
-            "name": self._yard_zone,
+            "identifiers": {(DOMAIN, "equipment")},
+            "name": "Lawn Equipment",
             "manufacturer": "Lawn Manager",
+            "model": "Equipment Inventory",
         }
 
 
@@ -878,8 +1025,12 @@ class RateCalculationSensor(SensorEntity):
         self._calculation_result = None
         self._unsub_dispatcher = None
 
+    @staticmethod
+    def unique_id_for(entry_id, yard_zone):
+        return f"lawn_manager_{entry_id}_{yard_zone.lower().replace(' ', '_')}_rate_calc"
+
     async def async_added_to_hass(self):
-        signal_name = f"lawn_manager_update_{self._entry_id}"
+        signal_name = zone_update_signal(self._entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
@@ -889,16 +1040,14 @@ class RateCalculationSensor(SensorEntity):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, CHANGE_RATE_CALCULATED):
+            return
         await self.async_update()
         self.async_write_ha_state()
 
     async def async_update(self):
-        data = _get_zone_data(self.hass, self._entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self._entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self._entry_id)
         self._calculation_result = data.get("last_rate_calculation")
 
     @property
@@ -923,11 +1072,11 @@ class RateCalculationSensor(SensorEntity):
     def extra_state_attributes(self):
         if not self._calculation_result:
             return {"status": "Press 'Calculate Application Rate' button to see results here"}
-        return self._calculation_result
+        return {key: self._calculation_result[key] for key in RATE_SENSOR_ATTRIBUTES if key in self._calculation_result}
 
     @property
     def unique_id(self):
-        return f"lawn_manager_{self._entry_id}_{self._yard_zone.lower().replace(' ', '_')}_rate_calc"
+        return self.unique_id_for(self._entry_id, self._yard_zone)
 
     @property
     def device_info(self):
@@ -951,7 +1100,7 @@ class ActivityHistorySensor(SensorEntity):
         self._total_chemical = 0
 
     async def async_added_to_hass(self):
-        signal_name = f"lawn_manager_update_{self._entry_id}"
+        signal_name = zone_update_signal(self._entry_id)
         self._unsub_dispatcher = async_dispatcher_connect(
             self.hass, signal_name, self._handle_update_signal
         )
@@ -961,57 +1110,61 @@ class ActivityHistorySensor(SensorEntity):
         if self._unsub_dispatcher:
             self._unsub_dispatcher()
 
-    async def _handle_update_signal(self):
+    async def _handle_update_signal(self, change=None):
+        if not change_affects(change, *HISTORY_CHANGES):
+            return
         await self.async_update()
         self.async_write_ha_state()
 
     async def async_update(self):
-        data = _get_zone_data(self.hass, self._entry_id)
-        if data is None:
-            zone_storage_key = get_storage_key(self._entry_id)
-            store = Store(self.hass, STORAGE_VERSION, zone_storage_key)
-            data = await store.async_load() or {}
+        data = await async_load_zone_data(self.hass, self._entry_id)
 
-        activities = []
+        mowing_history = data["mowing_history"]
+        application_history = data["application_history"]
+        # Records compare by integer sort keys, so only the shown ones become dicts
+        recent = heapq.nlargest(
+            30, itertools.chain(mowing_history, application_history), key=lambda record: record.sort_key
+        )
 
-        for mow in data.get("mowing_history", []):
-            activity = {
-                "type": "mowing",
-                "activity": mow.get("cut_type", "Mow"),
-                "date": mow.get("date", ""),
-                "timestamp": mow.get("timestamp", mow.get("date", "")),
-            }
-            if "height_of_cut_inches" in mow:
-                activity["detail"] = f"HOC: {mow['height_of_cut_inches']} in"
+        activities = []
+        for record in recent:
+            if isinstance(record, MowRecord):
+                activity = {
+                    "id": record.id,
+                    "type": "mowing",
+                    "activity": record.cut_type or "Mow",
+                    "date": record.date,
+                    "timestamp": record.timestamp or record.date,
+                }
+                if record.height_of_cut_inches is not None:
+                    activity["detail"] = f"HOC: {record.height_of_cut_inches} in"
+            else:
+                activity = {
+                    "id": record.id,
+                    "type": "chemical",
+                    "activity": record.chemical or "Unknown",
+                    "date": record.date,
+                    "timestamp": record.timestamp or record.date,
+                    "detail": record.detail or "",
+                }
             activities.append(activity)
 
-        application_history = data.get("application_history", [])
-        if application_history:
-            for app in application_history:
-                activities.append({
-                    "type": "chemical",
-                    "activity": app.get("chemical", "Unknown"),
-                    "date": app.get("date", ""),
-                    "timestamp": app.get("timestamp", app.get("date", "")),
-                    "detail": app.get("detail", ""),
-                })
-        else:
-            applications = data.get("applications", {})
-            if isinstance(applications, dict):
-                for chem_name, chem_data in applications.items():
-                    if isinstance(chem_data, dict) and chem_data.get("last_applied"):
-                        activities.append({
-                            "type": "chemical",
-                            "activity": chem_name,
-                            "date": chem_data.get("last_applied", ""),
-                            "timestamp": chem_data.get("last_applied", ""),
-                            "detail": f"{chem_data.get('rate_description', 'Default')} via {chem_data.get('method', '?')}",
-                        })
-
-        activities.sort(key=lambda x: x.get("timestamp", x.get("date", "")), reverse=True)
-
-        self._total_mowing = len([a for a in activities if a["type"] == "mowing"])
-        self._total_chemical = len([a for a in activities if a["type"] == "chemical"])
+        legacy_chemical = 0
+        if not application_history:
+            for chem_name, chem_data in data["applications"].items():
+                if chem_data.get("last_applied"):
+                    legacy_chemical += 1
+                    activities.append({
+                        "type": "chemical",
+                        "activity": chem_name,
+                        "date": chem_data.get("last_applied", ""),
+                        "timestamp": chem_data.get("last_applied", ""),
+                        "detail": f"{chem_data.get('rate_description', 'Default')} via {chem_data.get('method', '?')}",
+                    })
+            activities.sort(key=lambda x: x["date"], reverse=True)
+
+        self._total_mowing = len(mowing_history)
+        self._total_chemical = len(application_history) + legacy_chemical
         self._activities = activities[:30]
 
     @property
@@ -1,119 +1,115 @@
+import copy
+import csv
+import json
 import logging
-from datetime import datetime
-from homeassistant.core import HomeAssistant, ServiceCall
-from homeassistant.helpers.storage import Store
+import os
+from collections import Counter
+from datetime import date, datetime
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.util import dt as dt_util
 import uuid
 
-from .const import DOMAIN, STORAGE_VERSION, CHEMICALS, EQUIPMENT_STORAGE_KEY, EQUIPMENT_TYPES, CUSTOM_PRODUCTS_STORAGE_KEY, MAINTENANCE_LOG_STORAGE_KEY
+from .const import DOMAIN, EQUIPMENT_TYPES, GROUP_BY_PERIODS
+from .equipment_store import async_get_equipment_store
+from .history_helper import MOWING_HISTORY, APPLICATION_HISTORY, MONTHLY_ROLLUPS
+from .idempotency import duplicate_call_response, is_duplicate_call, release_idempotency_key
+from .lazy_import import async_import_helper
+from .maintenance_log import MaintenanceLog
+from .product_catalog import async_get_product_catalog
+from .rate_engine import async_get_rate_engine
+from .records import RECORD_TYPES, date_to_ordinal
+from .zone_registry import async_get_zone_entry, async_zone_names, get_loaded_zone
+from .zone_storage import async_get_zone_store, async_load_zone_data
 
 _LOGGER = logging.getLogger(__name__)
 
 
-async def _calculate_rate_direct(hass, chemical, equipment_name, zone):
-    """Direct calculation helper callable from button without going through service call.
-    Returns the calculation dict or None.
-    """
-    equipment_store = Store(hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
-    equipment_data = await equipment_store.async_load() or {}
-
-    entries = hass.config_entries.async_entries(DOMAIN)
-    zone_config = None
-    for entry in entries:
-        if entry.data.get("yard_zone") == zone:
-            zone_config = entry.data
-            break
-
-    if not zone_config or not chemical or chemical not in CHEMICALS:
-        return None
-
-    lawn_size_sqft = zone_config.get("lawn_size_sqft", 1000)
-
-    equipment = None
-    for eq_id, eq_info in equipment_data.items():
-        if eq_info.get("friendly_name") == equipment_name:
-            equipment = eq_info
-            break
-
-    if not equipment:
-        return None
-
-    chemical_data = CHEMICALS[chemical]
-    equipment_type = equipment["type"]
-
-    calculation = {
-        "chemical": chemical,
-        "equipment": equipment["friendly_name"],
-        "equipment_type": equipment_type,
-        "zone": zone,
-        "lawn_size_sqft": lawn_size_sqft,
-        "chemical_notes": chemical_data.get("notes", "")
-    }
-
-    if equipment_type == "sprayer" and "liquid_oz_per_1000sqft" in chemical_data:
-        rate = chemical_data["liquid_oz_per_1000sqft"]
-        total_oz = (rate * lawn_size_sqft) / 1000
-        calculation["total_chemical_needed_oz"] = round(total_oz, 3)
-        calculation["application_rate"] = f"{rate} oz per 1,000 sq ft"
-        calculation["total_chemical_kitchen_measurements"] = _convert_oz_to_kitchen_measurements(total_oz)
-
-        eq_cap = equipment["capacity"]
-        cap_unit = equipment["capacity_unit"]
-        if cap_unit in ["gallons", "liters"]:
-            water = chemical_data.get("water_gal_per_1000sqft", 1.0) * lawn_size_sqft / 1000
-            tanks = water / eq_cap
-            chem_per_tank = total_oz / tanks if tanks > 0 else 0
-            calculation["tanks_needed"] = round(tanks, 1)
-            calculation["chemical_per_tank_oz"] = round(chem_per_tank, 3)
-            calculation["kitchen_measurements_per_tank"] = _convert_oz_to_kitchen_measurements(chem_per_tank)
-            calculation["mixing_instructions"] = f"Mix {round(chem_per_tank, 3)} oz of {chemical} per {eq_cap} {cap_unit} tank"
-
-    elif equipment_type == "spreader" and "amount_lb_per_1000sqft" in chemical_data:
-        rate = chemical_data["amount_lb_per_1000sqft"]
-        total_lb = (rate * lawn_size_sqft) / 1000
-        calculation["total_chemical_needed_lb"] = round(total_lb, 2)
-        calculation["application_rate"] = f"{rate} lb per 1,000 sq ft"
-
-    return calculation
-
-
-def _convert_oz_to_kitchen_measurements(oz):
-    """Convert ounces to kitchen measurements for easier measuring."""
-    cups = oz / 8.0
-    tablespoons = oz * 2.0
-    teaspoons = oz * 6.0
-
-    conversions = {}
-
-    if cups >= 0.125:
-        if cups >= 1.0:
-            conversions["cups"] = f"{round(cups, 2)} cups"
-        elif cups >= 0.5:
-            conversions["cups"] = f"{round(cups, 3)} cups"
-        elif cups >= 0.25:
-            try:
-                conversions["cups"] = f"1/{int(1/cups)} cup"
-            except (ZeroDivisionError, ValueError):
-                conversions["cups"] = f"{round(cups, 3)} cups"
-        else:
-            conversions["cups"] = f"{round(cups, 3)} cups"
+EXPORT_DIRECTORY = "lawn_manager_exports"
+EXPORT_FORMATS = ["csv", "ndjson"]
+
+EXPORT_COLUMNS = {
+    "mowing": ["zone", "date", "cut_type", "height_of_cut_inches", "timestamp", "archived"],
+    "applications": ["zone", "date", "chemical", "method", "rate_description", "detail", "timestamp", "archived"],
+    "maintenance": ["id", "date", "equipment", "type", "notes", "cost", "timestamp"],
+    "monthly_rollups": [
+        "zone", "month", "category", "chemical", "count", "mean_height_of_cut_inches",
+        "total_chemical_needed_oz", "total_chemical_needed_lb",
+    ],
+}
 
-    if tablespoons >= 0.5:
-        if tablespoons >= 1.0:
-            conversions["tablespoons"] = f"{round(tablespoons, 1)} tbsp"
-        else:
-            conversions["tablespoons"] = f"{round(tablespoons, 2)} tbsp"
 
-    if teaspoons >= 0.5 and tablespoons < 1.0:
-        conversions["teaspoons"] = f"{round(teaspoons, 1)} tsp"
+def _iter_rollup_rows(zone, rollups):
+    for month, rollup in sorted(rollups.items()):
+        if "mows" in rollup:
+            mows = rollup["mows"]
+            yield {
+                "zone": zone, "month": month, "category": "mowing", "count": mows["count"],
+                "mean_height_of_cut_inches": mows.get("mean_height_of_cut_inches"),
+            }
+        for chemical, totals in sorted(rollup.get("applications", {}).items()):
+            yield {"zone": zone, "month": month, "category": "application", "chemical": chemical, **totals}
+
+
+def _iter_export_records(category, zones, maintenance_log):
+    """Yield flat export rows for a category one at a time.
+
+    History rows cover the archived seasons (marked archived) as well as
+    live history, and records past the retention window are exported as
+    their monthly rollups.
+    """
+    if category == "maintenance":
+        yield from maintenance_log
+        return
+
+    if category == "monthly_rollups":
+        for zone, zone_data, _ in zones:
+            yield from _iter_rollup_rows(zone, zone_data[MONTHLY_ROLLUPS])
+        return
+
+    history_key = MOWING_HISTORY if category == "mowing" else APPLICATION_HISTORY
+    record_type = RECORD_TYPES[history_key]
+    for zone, zone_data, archive in zones:
+        for record in archive.iter_records():
+            if isinstance(record, record_type):
+                yield {"zone": zone, **record.as_dict(), "archived": True}
+        for record in zone_data[history_key]:
+            yield {"zone": zone, **record.as_dict()}
+
+
+def _write_history_export(directory, prefix, export_format, zones, maintenance_log):
+    """Stream history records to one file per category.
+
+    Runs in the executor. Rows are written as they are produced so the export
+    never builds a full in-memory copy of the history.
+    """
+    os.makedirs(directory, exist_ok=True)
+    results = {}
+
+    for category, columns in EXPORT_COLUMNS.items():
+        path = os.path.join(directory, f"{prefix}_{category}.{export_format}")
+        count = 0
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            if export_format == "csv":
+                writer = csv.DictWriter(file, fieldnames=columns, extrasaction="ignore")
+                writer.writeheader()
+                for row in _iter_export_records(category, zones, maintenance_log):
+                    writer.writerow(row)
+                    count += 1
+            else:
+                for row in _iter_export_records(category, zones, maintenance_log):
+                    file.write(json.dumps(row, default=str))
+                    file.write("\n")
+                    count += 1
+        results[category] = {"path": path, "records": count}
 
-    return conversions
+    return results
 
 
-async def async_register_services(hass: HomeAssistant) -> None:
-    """Register Lawn Manager services."""
-    equipment_store = Store(hass, STORAGE_VERSION, EQUIPMENT_STORAGE_KEY)
+@callback
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration-wide Lawn Manager services; called once from async_setup."""
+    equipment_store = async_get_equipment_store(hass)
 
     async def handle_add_equipment(call: ServiceCall):
         equipment_type = call.data.get("equipment_type", "sprayer")
@@ -122,10 +118,7 @@ async def async_register_services(hass: HomeAssistant) -> None:
         capacity_unit = call.data.get("capacity_unit", "gallons")
 
         equipment_id = str(uuid.uuid4())[:8]
-
-        equipment_data = await equipment_store.async_load() or {}
-
-        equipment_data[equipment_id] = {
+        equipment = {
             "type": equipment_type,
             "brand": brand,
             "capacity": float(capacity),
@@ -134,11 +127,8 @@ async def async_register_services(hass: HomeAssistant) -> None:
             "friendly_name": f"{brand} {capacity} {capacity_unit.rstrip('s')} {equipment_type.title()}"
         }
 
-        await equipment_store.async_save(equipment_data)
-        _LOGGER.info("Equipment added: %s", equipment_data[equipment_id]["friendly_name"])
-
-        from homeassistant.helpers.dispatcher import async_dispatcher_send
-        async_dispatcher_send(hass, "lawn_manager_equipment_update")
+        await equipment_store.async_add({equipment_id: equipment})
+        _LOGGER.info("Equipment added: %s", equipment["friendly_name"])
 
     async def handle_delete_equipment(call: ServiceCall):
         equipment_id = call.data.get("equipment_id")
@@ -146,16 +136,10 @@ async def async_register_services(hass: HomeAssistant) -> None:
             _LOGGER.error("Equipment ID required")
             return
 
-        equipment_data = await equipment_store.async_load() or {}
-
-        if equipment_id in equipment_data:
-            equipment_name = equipment_data[equipment_id].get("friendly_name", f"Equipment {equipment_id}")
-            del equipment_data[equipment_id]
-            await equipment_store.async_save(equipment_data)
+        deleted = await equipment_store.async_delete([equipment_id])
+        if deleted:
+            equipment_name = deleted[equipment_id].get("friendly_name", f"Equipment {equipment_id}")
             _LOGGER.info("Deleted equipment: %s (ID: %s)", equipment_name, equipment_id)
-
-            from homeassistant.helpers.dispatcher import async_dispatcher_send
-            async_dispatcher_send(hass, "lawn_manager_equipment_update")
         else:
             _LOGGER.error("Equipment ID '%s' not found", equipment_id)
 
@@ -165,200 +149,64 @@ async def async_register_services(hass: HomeAssistant) -> None:
         equipment_name = call.data.get("equipment_name")
         zone_input = call.data.get("zone")
 
-        entries = hass.config_entries.async_entries(DOMAIN)
-        if not entries:
+        if not hass.config_entries.async_entries(DOMAIN):
             _LOGGER.error("No Lawn Manager config entries found")
             return {"error": "No Lawn Manager config entries found"}
 
-        zone_config = None
-        zone_entry = None
-        for entry in entries:
-            if entry.entry_id == zone_input or entry.data.get("yard_zone") == zone_input:
-                zone_config = entry.data
-                zone_entry = entry
-                break
-
-        if not zone_config:
+        zone_entry = async_get_zone_entry(hass, zone_input)
+        if not zone_entry:
             _LOGGER.error("Zone '%s' not found in config entries", zone_input)
-            available_zones = [e.data.get("yard_zone", "?") for e in entries]
-            return {"error": f"Zone '{zone_input}' not found. Available: {available_zones}"}
-
-        lawn_size_sqft = zone_config.get("lawn_size_sqft", 1000)
+            return {"error": f"Zone '{zone_input}' not found. Available: {async_zone_names(hass)}"}
+        zone_config = zone_entry.data
 
         if not equipment_name:
             _LOGGER.error("Equipment name required")
             return {"error": "Equipment name required"}
 
-        # Always load from storage for latest data
-        equipment_data = await equipment_store.async_load() or {}
-        equipment_id = None
-        equipment = None
-
-        for eq_id, eq_info in equipment_data.items():
-            if eq_info.get("friendly_name") == equipment_name:
-                equipment_id = eq_id
-                equipment = eq_info
-                break
-
-        if not equipment:
-            available_names = [eq_info.get("friendly_name", eq_id) for eq_id, eq_info in equipment_data.items()]
-            _LOGGER.error("Equipment '%s' not found. Available: %s", equipment_name, available_names)
-            return {"error": f"Equipment '{equipment_name}' not found. Available: {available_names}"}
-
         if not chemical:
             _LOGGER.error("Chemical required")
             return {"error": "Chemical required"}
 
-        if chemical not in CHEMICALS:
-            _LOGGER.error("Chemical '%s' not found", chemical)
-            return {"error": f"Chemical '{chemical}' not found"}
-
-        chemical_data = CHEMICALS[chemical]
-        equipment_type = equipment["type"]
-        chemical_notes = chemical_data.get("notes", "")
-
-        zone = zone_config.get("yard_zone", "Unknown")
-        calculation = {
-            "chemical": chemical,
-            "equipment": equipment["friendly_name"],
-            "equipment_type": equipment_type,
-            "zone": zone,
-            "lawn_size_sqft": lawn_size_sqft,
-            "chemical_notes": chemical_notes
-        }
-
-        if equipment_type == "sprayer":
-            if "liquid_oz_per_1000sqft" in chemical_data:
-                liquid_rate_per_1000sqft = chemical_data["liquid_oz_per_1000sqft"]
-                total_chemical_needed_oz = (liquid_rate_per_1000sqft * lawn_size_sqft) / 1000
-
-                if "water_gal_per_1000sqft" in chemical_data:
-                    water_per_1000sqft = chemical_data["water_gal_per_1000sqft"]
-                    total_water_needed_gal = (water_per_1000sqft * lawn_size_sqft) / 1000
-                    concentration_per_gallon = liquid_rate_per_1000sqft / water_per_1000sqft
-                    total_kitchen_measurements = _convert_oz_to_kitchen_measurements(total_chemical_needed_oz)
-
-                    calculation.update({
-                        "total_chemical_needed_oz": round(total_chemical_needed_oz, 3),
-                        "total_chemical_kitchen_measurements": total_kitchen_measurements,
-                        "total_water_needed_gal": round(total_water_needed_gal, 1),
-                        "concentration_per_gallon": round(concentration_per_gallon, 3),
-                        "application_rate": f"{liquid_rate_per_1000sqft} oz per 1,000 sq ft",
-                        "water_rate": f"{water_per_1000sqft} gal per 1,000 sq ft"
-                    })
-                else:
-                    total_kitchen_measurements = _convert_oz_to_kitchen_measurements(total_chemical_needed_oz)
-                    calculation.update({
-                        "total_chemical_needed_oz": round(total_chemical_needed_oz, 2),
-                        "total_chemical_kitchen_measurements": total_kitchen_measurements,
-                        "application_rate": f"{liquid_rate_per_1000sqft} oz per 1,000 sq ft"
-                    })
-
-            elif "amount_lb_per_1000sqft" in chemical_data:
-                rate_per_1000sqft = chemical_data["amount_lb_per_1000sqft"]
-                total_chemical_needed_lb = (rate_per_1000sqft * lawn_size_sqft) / 1000
-                total_chemical_needed_oz = total_chemical_needed_lb * 16
-
-                calculation.update({
-                    "total_chemical_needed_lb": round(total_chemical_needed_lb, 2),
-                    "total_chemical_needed_oz": round(total_chemical_needed_oz, 2),
-                    "application_rate": f"{rate_per_1000sqft} lb per 1,000 sq ft (converted)"
-                })
-
-            equipment_capacity = equipment["capacity"]
-            capacity_unit = equipment["capacity_unit"]
-
-            if capacity_unit in ["gallons", "liters"]:
-                if "total_water_needed_gal" in calculation:
-                    water_needed = calculation["total_water_needed_gal"]
-                else:
-                    water_needed = lawn_size_sqft / 1000
-
-                tanks_needed = water_needed / equipment_capacity
-
-                if "total_chemical_needed_oz" in calculation:
-                    if "concentration_per_gallon" in calculation:
-                        chemical_per_tank_oz = calculation["concentration_per_gallon"] * equipment_capacity
-                        kitchen_measurements = _convert_oz_to_kitchen_measurements(chemical_per_tank_oz)
-                        concentration_kitchen = _convert_oz_to_kitchen_measurements(calculation["concentration_per_gallon"])
-
-                        mixing_instruction = f"Mix {round(chemical_per_tank_oz, 3)} oz of {chemical} per {equipment_capacity} {capacity_unit} tank"
-                        if kitchen_measurements:
-                            kitchen_amounts = " or ".join(kitchen_measurements.values())
-                            mixing_instruction += f" ({kitchen_amounts})"
-
-                        per_gallon_instruction = f"{round(calculation['concentration_per_gallon'], 3)} oz per gallon"
-                        if concentration_kitchen:
-                            concentration_amounts = " or ".join(concentration_kitchen.values())
-                            per_gallon_instruction += f" ({concentration_amounts} per gallon)"
-
-                        calculation.update({
-                            "tanks_needed": round(tanks_needed, 1),
-                            "chemical_per_tank_oz": round(chemical_per_tank_oz, 3),
-                            "kitchen_measurements_per_tank": kitchen_measurements,
-                            "mixing_instructions": f"{mixing_instruction} - {per_gallon_instruction}"
-                        })
-                    else:
-                        chemical_per_tank_oz = calculation["total_chemical_needed_oz"] / tanks_needed if tanks_needed > 0 else 0
-                        kitchen_measurements = _convert_oz_to_kitchen_measurements(chemical_per_tank_oz)
-
-                        mixing_instruction = f"Mix {round(chemical_per_tank_oz, 3)} oz of {chemical} per {equipment_capacity} {capacity_unit} tank"
-                        if kitchen_measurements:
-                            kitchen_amounts = " or ".join(kitchen_measurements.values())
-                            mixing_instruction += f" ({kitchen_amounts})"
-
-                        calculation.update({
-                            "tanks_needed": round(tanks_needed, 1),
-                            "chemical_per_tank_oz": round(chemical_per_tank_oz, 3),
-                            "kitchen_measurements_per_tank": kitchen_measurements,
-                            "mixing_instructions": mixing_instruction
-                        })
-
-        elif equipment_type == "spreader":
-            if "amount_lb_per_1000sqft" in chemical_data:
-                rate_per_1000sqft = chemical_data["amount_lb_per_1000sqft"]
-                total_chemical_needed_lb = (rate_per_1000sqft * lawn_size_sqft) / 1000
-
-                calculation.update({
-                    "total_chemical_needed_lb": round(total_chemical_needed_lb, 2),
-                    "application_rate": f"{rate_per_1000sqft} lb per 1,000 sq ft"
-                })
-
-                equipment_capacity = equipment["capacity"]
-                capacity_unit = equipment["capacity_unit"]
-
-                if capacity_unit in ["pounds", "kg"]:
-                    loads_needed = total_chemical_needed_lb / equipment_capacity if equipment_capacity > 0 else 0
-                    calculation.update({
-                        "loads_needed": round(loads_needed, 1),
-                        "application_instructions": f"Apply {round(total_chemical_needed_lb, 2)} lb total using {round(loads_needed, 1)} spreader loads"
-                    })
-                else:
-                    calculation["error"] = f"Unsupported capacity unit '{capacity_unit}' for spreader."
-            else:
-                calculation["error"] = f"No granular rate available for {chemical} with spreader equipment"
-        else:
-            calculation["error"] = f"Unsupported equipment type '{equipment_type}'."
+        rate_engine = async_get_rate_engine(hass)
+        calculation = await rate_engine.async_calculate(
+            chemical, equipment_name, zone_config, call.data.get("rate_override", "Default")
+        )
+        if "error" in calculation:
+            _LOGGER.error("Application rate calculation failed: %s", calculation["error"])
+            return calculation
 
         _LOGGER.info("Application rate calculated: %s", calculation)
         hass.bus.async_fire(f"{DOMAIN}_rate_calculated", calculation)
-
-        if zone_entry:
-            from . import get_zone_store_and_data
-            from .const import get_storage_key as _get_storage_key
-            store, data = get_zone_store_and_data(hass, zone_entry.entry_id)
-            if not store:
-                zone_storage_key = _get_storage_key(zone_entry.entry_id)
-                store = Store(hass, STORAGE_VERSION, zone_storage_key)
-                data = await store.async_load() or {}
-            data["last_rate_calculation"] = calculation
-            await store.async_save(data)
-            async_dispatcher_send(hass, f"lawn_manager_update_{zone_entry.entry_id}")
+        await rate_engine.async_save_calculation(zone_entry.entry_id, calculation)
 
         return calculation
 
+    async def handle_calculate_rate_matrix(call: ServiceCall):
+        """Rates for many chemical/equipment/zone combinations in one call.
+
+        Read-only: unlike calculate_application_rate nothing is stored on the
+        zones and no rate_calculated event is fired.
+        """
+        zone_inputs = call.data.get("zones")
+        if zone_inputs:
+            zone_configs = []
+            for zone_input in zone_inputs:
+                entry = async_get_zone_entry(hass, zone_input)
+                if not entry:
+                    return {"error": f"Zone '{zone_input}' not found. Available: {async_zone_names(hass)}"}
+                zone_configs.append(entry.data)
+        else:
+            zone_configs = [entry.data for entry in hass.config_entries.async_entries(DOMAIN)]
+
+        return await async_get_rate_engine(hass).async_calculate_matrix(
+            call.data.get("chemicals") or None,
+            call.data.get("equipment_names") or None,
+            zone_configs,
+            call.data.get("rate_override", "Default"),
+        )
+
     async def handle_get_equipment_options(call: ServiceCall):
-        equipment_data = await equipment_store.async_load() or {}
+        equipment_data = await equipment_store.async_get()
 
         options = []
         for eq_id, eq_info in equipment_data.items():
@@ -384,7 +232,7 @@ async def async_register_services(hass: HomeAssistant) -> None:
         return {"zone_options": zones}
 
     async def handle_list_calculation_options(call: ServiceCall):
-        equipment_data = await equipment_store.async_load() or {}
+        equipment_data = await equipment_store.async_get()
         equipment_names = []
         for eq_id, eq_info in equipment_data.items():
             friendly_name = eq_info.get("friendly_name", f"Equipment {eq_id}")
@@ -409,16 +257,14 @@ async def async_register_services(hass: HomeAssistant) -> None:
         return response_data
 
     async def handle_refresh_equipment_entity(call: ServiceCall):
-        from homeassistant.helpers.dispatcher import async_dispatcher_send
         async_dispatcher_send(hass, "lawn_manager_equipment_update")
 
     async def handle_clear_equipment_storage(call: ServiceCall):
-        equipment_data = await equipment_store.async_load() or {}
-        _LOGGER.info("Clearing %d equipment entries", len(equipment_data))
-        await equipment_store.async_remove()
+        count = await equipment_store.async_clear()
+        _LOGGER.info("Cleared %d equipment entries", count)
 
     # --- Custom Products Inventory ---
-    products_store = Store(hass, STORAGE_VERSION, CUSTOM_PRODUCTS_STORAGE_KEY)
+    catalog = async_get_product_catalog(hass)
 
     async def handle_add_custom_product(call: ServiceCall):
         """Add a custom product to the shared inventory."""
@@ -429,40 +275,35 @@ async def async_register_services(hass: HomeAssistant) -> None:
         interval_days = call.data.get("interval_days", 30)
         notes = call.data.get("notes", "")
         application_method = call.data.get("application_method", "any")
+        aliases = [alias.strip() for alias in call.data.get("aliases", "").split(",") if alias.strip()]
 
         if not product_name:
             _LOGGER.error("Product name required")
             return {"error": "Product name is required"}
 
-        products_data = await products_store.async_load() or {}
-        product_id = str(uuid.uuid4())[:8]
-
         product_entry = {
             "name": product_name,
             "type": product_type,
             "interval_days": int(interval_days),
             "notes": notes,
             "application_method": application_method,
-            "created": dt_util.now().strftime("%Y-%m-%d %H:%M:%S"),
         }
 
         if rate_oz_per_1000sqft is not None:
             product_entry["liquid_oz_per_1000sqft"] = float(rate_oz_per_1000sqft)
         if rate_lb_per_1000sqft is not None:
             product_entry["amount_lb_per_1000sqft"] = float(rate_lb_per_1000sqft)
+        if aliases:
+            product_entry["aliases"] = aliases
 
-        products_data[product_id] = product_entry
-        await products_store.async_save(products_data)
+        product_id = await catalog.async_add_product(product_entry)
 
         _LOGGER.info("Custom product added: %s (ID: %s)", product_name, product_id)
-        return {"product_id": product_id, "product": product_entry}
+        return {"product_id": product_id, "product": catalog.custom_products()[product_id]}
 
     async def handle_list_custom_products(call: ServiceCall):
         """List all custom products."""
-        products_data = await products_store.async_load() or {}
-        products_list = []
-        for pid, pdata in products_data.items():
-            products_list.append({"id": pid, **pdata})
+        products_list = [{"id": pid, **pdata} for pid, pdata in catalog.custom_products().items()]
         return {"products": products_list, "count": len(products_list)}
 
     async def handle_delete_custom_product(call: ServiceCall):
@@ -471,18 +312,15 @@ async def async_register_services(hass: HomeAssistant) -> None:
         if not product_id:
             return {"error": "Product ID required"}
 
-        products_data = await products_store.async_load() or {}
-        if product_id in products_data:
-            name = products_data[product_id].get("name", product_id)
-            del products_data[product_id]
-            await products_store.async_save(products_data)
-            _LOGGER.info("Deleted custom product: %s", name)
-            return {"deleted": name}
-        else:
+        product = await catalog.async_delete_product(product_id)
+        if product is None:
             return {"error": f"Product ID '{product_id}' not found"}
+        name = product.get("name", product_id)
+        _LOGGER.info("Deleted custom product: %s", name)
+        return {"deleted": name}
 
     # --- Equipment Maintenance Log ---
-    maintenance_store = Store(hass, STORAGE_VERSION, MAINTENANCE_LOG_STORAGE_KEY)
+    maintenance_log = MaintenanceLog(hass)
 
     async def handle_log_maintenance(call: ServiceCall):
         """Log an equipment maintenance activity."""
@@ -500,9 +338,9 @@ async def async_register_services(hass: HomeAssistant) -> None:
         else:
             date_str = dt_util.now().strftime("%Y-%m-%d")
 
-        maintenance_data = await maintenance_store.async_load() or {"log": []}
-        if "log" not in maintenance_data:
-            maintenance_data["log"] = []
+        idempotency_key = call.data.get("idempotency_key")
+        if is_duplicate_call(hass, "log_maintenance", idempotency_key):
+            return duplicate_call_response("log_maintenance", idempotency_key)
 
         entry = {
             "id": str(uuid.uuid4())[:8],
@@ -515,42 +353,66 @@ async def async_register_services(hass: HomeAssistant) -> None:
         if cost is not None:
             entry["cost"] = float(cost)
 
-        maintenance_data["log"].append(entry)
-
-        if len(maintenance_data["log"]) > 200:
-            maintenance_data["log"] = maintenance_data["log"][-200:]
-
-        await maintenance_store.async_save(maintenance_data)
+        try:
+            await maintenance_log.async_add(entry)
+        except Exception:
+            release_idempotency_key(hass, "log_maintenance", idempotency_key)
+            raise
         _LOGGER.info("Maintenance logged: %s - %s on %s", equipment_name, maintenance_type, date_str)
 
-        from homeassistant.helpers.dispatcher import async_dispatcher_send
         async_dispatcher_send(hass, "lawn_manager_maintenance_update")
 
         return entry
 
     async def handle_get_maintenance_log(call: ServiceCall):
         """Get the full maintenance log."""
-        maintenance_data = await maintenance_store.async_load() or {"log": []}
-        log = maintenance_data.get("log", [])
-        equipment_filter = call.data.get("equipment_name", "").strip()
-        if equipment_filter:
-            log = [e for e in log if e.get("equipment", "").lower() == equipment_filter.lower()]
+        log = await maintenance_log.async_entries(call.data.get("equipment_name", "").strip() or None)
         return {"log": log, "count": len(log)}
 
     async def handle_get_activity_history(call: ServiceCall):
-        """Get unified activity history across all zones."""
-        from .const import get_storage_key
+        """Get unified activity history across all zones.
+
+        start_date/end_date limit the result to a date range. Queries with
+        a range or a group_by also read the archived seasons they reach;
+        an unbounded, ungrouped listing stays on live history. group_by
+        adds mow and per-chemical application counts per week or month
+        over everything in range; month counts also include the monthly
+        rollups of records past the retention window. Rolled-up records
+        are no longer listed one by one, so the months in range that only
+        survive as rollups are always returned in rolled_up_months,
+        grouped or not.
+        """
+        start_ordinal = date_to_ordinal(call.data.get("start_date"))
+        end_ordinal = date_to_ordinal(call.data.get("end_date"))
+        if (call.data.get("start_date") and not start_ordinal) or (call.data.get("end_date") and not end_ordinal):
+            return {"error": "Dates must be in YYYY-MM-DD format"}
+        group_by = call.data.get("group_by")
+        if group_by and group_by not in GROUP_BY_PERIODS:
+            return {"error": f"Unsupported group_by '{group_by}'. Use one of: {list(GROUP_BY_PERIODS)}"}
+        reads_archive = bool(start_ordinal or end_ordinal or group_by)
+        history_archive = await async_import_helper(hass, "history_archive") if reads_archive else None
+        rollup_overlaps = (await async_import_helper(hass, "history_rollup")).rollup_overlaps
+
+        def in_range(ordinal):
+            return (not start_ordinal or ordinal >= start_ordinal) and (not end_ordinal or ordinal <= end_ordinal)
+
         entries = hass.config_entries.async_entries(DOMAIN)
         all_activities = []
+        mows_by_period = Counter()
+        applications_by_period = {}
+        rolled_up_months = []
 
         for config_entry in entries:
             zone = config_entry.data.get("yard_zone", "Unknown")
-            zone_key = get_storage_key(config_entry.entry_id)
-            zone_store = Store(hass, STORAGE_VERSION, zone_key)
-            zone_data = await zone_store.async_load() or {}
+            zone_data = await async_load_zone_data(hass, config_entry.entry_id)
+            mowing_history = [mow for mow in zone_data["mowing_history"] if in_range(mow.date_ordinal)]
+            application_history = [
+                app for app in zone_data["application_history"] if in_range(app.date_ordinal)
+            ]
 
-            for mow in zone_data.get("mowing_history", []):
+            for mow in mowing_history:
                 all_activities.append({
+                    "id": mow.get("id"),
                     "zone": zone,
                     "category": "mowing",
                     "activity": mow.get("cut_type", "Mow"),
@@ -559,18 +421,62 @@ async def async_register_services(hass: HomeAssistant) -> None:
                     "timestamp": mow.get("timestamp", ""),
                 })
 
-            for chem_name, chem_data in zone_data.get("applications", {}).items():
+            for app in application_history:
                 all_activities.append({
+                    "id": app.get("id"),
                     "zone": zone,
                     "category": "chemical",
-                    "activity": chem_name,
-                    "date": chem_data.get("last_applied", ""),
-                    "details": f"{chem_data.get('rate_description', 'Default')} via {chem_data.get('method', '?')}",
-                    "timestamp": chem_data.get("last_applied", ""),
+                    "activity": app.get("chemical", "Unknown"),
+                    "date": app.get("date", ""),
+                    "details": app.get("detail", ""),
+                    "timestamp": app.get("timestamp", app.get("date", "")),
+                })
+
+            if not zone_data["application_history"] and not (start_ordinal or end_ordinal):
+                for chem_name, chem_data in zone_data["applications"].items():
+                    all_activities.append({
+                        "zone": zone,
+                        "category": "chemical",
+                        "activity": chem_name,
+                        "date": chem_data.get("last_applied", ""),
+                        "details": f"{chem_data.get('rate_description', 'Default')} via {chem_data.get('method', '?')}",
+                        "timestamp": chem_data.get("last_applied", ""),
+                    })
+
+            blocks = []
+            if reads_archive:
+                archive = history_archive.HistoryArchive(hass, config_entry.entry_id)
+                blocks = await archive.async_load_range(start_ordinal, end_ordinal)
+                for block in blocks:
+                    all_activities.extend(block.activities(zone, block.row_range(start_ordinal, end_ordinal)))
+
+            if group_by:
+                live = history_archive.ColumnarHistory.from_records([*mowing_history, *application_history])
+                for block in (live, *blocks):
+                    block.count_by_period(
+                        block.row_range(start_ordinal, end_ordinal),
+                        group_by, mows_by_period, applications_by_period,
+                    )
+
+            # Records past the retention window only survive as monthly rollups
+            for month, rollup in sorted(zone_data.get(MONTHLY_ROLLUPS, {}).items()):
+                if not rollup_overlaps(month, start_ordinal, end_ordinal):
+                    continue
+                rolled_up_months.append({
+                    "zone": zone,
+                    "month": month,
+                    "mows": rollup.get("mows", {}).get("count", 0),
+                    "applications": {
+                        chemical: totals["count"] for chemical, totals in rollup.get("applications", {}).items()
+                    },
                 })
+                if group_by == "month":
+                    if "mows" in rollup:
+                        mows_by_period[month] += rollup["mows"]["count"]
+                    for chemical, totals in rollup.get("applications", {}).items():
+                        applications_by_period.setdefault(chemical, Counter())[month] += totals["count"]
 
-        maintenance_data = await maintenance_store.async_load() or {"log": []}
-        for m in maintenance_data.get("log", []):
+        for m in await maintenance_log.async_entries(start_ordinal=start_ordinal, end_ordinal=end_ordinal):
             all_activities.append({
                 "zone": "Equipment",
                 "category": "maintenance",
@@ -582,34 +488,147 @@ async def async_register_services(hass: HomeAssistant) -> None:
 
         all_activities.sort(key=lambda x: x.get("timestamp", ""), reverse=True)
 
-        return {"activities": all_activities[:100], "total_count": len(all_activities)}
+        result = {"activities": all_activities[:100], "total_count": len(all_activities)}
+        if rolled_up_months:
+            result["rolled_up_months"] = rolled_up_months
+        if group_by:
+            result["group_by"] = group_by
+            result["mows"] = dict(sorted(mows_by_period.items()))
+            result["applications"] = {
+                chemical: dict(sorted(counts.items())) for chemical, counts in sorted(applications_by_period.items())
+            }
+        return result
+
+    async def handle_archive_history(call: ServiceCall):
+        """Move mow and application records from before a year into the zones' columnar archives."""
+        before_year = int(call.data.get("before_year", dt_util.now().year))
+        before_ordinal = date(before_year, 1, 1).toordinal()
+
+        entries = hass.config_entries.async_entries(DOMAIN)
+        zone_input = call.data.get("zone")
+        if zone_input:
+            zone_entry = async_get_zone_entry(hass, zone_input)
+            if not zone_entry:
+                return {"error": f"Zone '{zone_input}' not found"}
+            entries = [zone_entry]
+
+        history_archive = await async_import_helper(hass, "history_archive")
+        archived = {}
+        errors = {}
+        for config_entry in entries:
+            zone = config_entry.data.get("yard_zone", "Unknown")
+            store, data = await async_get_zone_store(hass, config_entry.entry_id)
+            # A failed write still leaves the years moved before it archived; save those and go on
+            moved, error = await history_archive.async_archive_zone_history(
+                hass, config_entry.entry_id, data, before_ordinal
+            )
+            if moved:
+                zone_info = get_loaded_zone(hass, config_entry.entry_id)
+                if zone_info:
+                    zone_info["index"].rebuild()
+                    zone_info["materializer"].rebuild()
+                await store.async_save(data)
+            archived[zone] = moved
+            if error:
+                _LOGGER.error("Archiving history for %s failed: %s", zone, error)
+                errors[zone] = str(error)
+
+        _LOGGER.info("Archived history before %d: %s", before_year, archived)
+        result = {"before_year": before_year, "archived": archived, "record_count": sum(archived.values())}
+        if errors:
+            result["errors"] = errors
+        return result
+
+    async def handle_export_history(call: ServiceCall):
+        """Export every zone's history and the maintenance log to files under /config."""
+        export_format = call.data.get("format", "csv").lower()
+        if export_format not in EXPORT_FORMATS:
+            return {"error": f"Unsupported export format '{export_format}'. Use one of: {EXPORT_FORMATS}"}
+
+        history_archive = await async_import_helper(hass, "history_archive")
+        zones = []
+        for config_entry in hass.config_entries.async_entries(DOMAIN):
+            zone = config_entry.data.get("yard_zone", "Unknown")
+            zone_data = await async_load_zone_data(hass, config_entry.entry_id)
+            # Shallow-copy the lists so the executor sees a stable snapshot
+            # while new records keep being appended on the event loop.
+            zones.append((zone, {
+                MOWING_HISTORY: list(zone_data[MOWING_HISTORY]),
+                APPLICATION_HISTORY: list(zone_data[APPLICATION_HISTORY]),
+                MONTHLY_ROLLUPS: copy.deepcopy(zone_data.get(MONTHLY_ROLLUPS, {})),
+            }, history_archive.HistoryArchive(hass, config_entry.entry_id)))
+
+        maintenance_entries = await maintenance_log.async_entries()
+
+        directory = hass.config.path(EXPORT_DIRECTORY)
+        prefix = f"lawn_manager_{dt_util.now().strftime('%Y%m%d_%H%M%S')}"
+
+        try:
+            files = await hass.async_add_executor_job(
+                _write_history_export, directory, prefix, export_format, zones, maintenance_entries
+            )
+        except OSError as err:
+            _LOGGER.error("History export failed: %s", err)
+            return {"error": f"History export failed: {err}"}
+
+        record_count = sum(f["records"] for f in files.values())
+        _LOGGER.info("Exported %d history records to %s", record_count, directory)
+        return {"format": export_format, "files": files, "record_count": record_count}
+
+    async def handle_get_seasonal_details(call: ServiceCall):
+        """Return the long-form seasonal guidance for a zone.
+
+        Kept out of the seasonal sensor's attributes so the recorder does not
+        store the same instruction text on every state change.
+        """
+        zone_entry = async_get_zone_entry(hass, call.data.get("zone"))
+        if not zone_entry:
+            return {"error": f"Zone '{call.data.get('zone')}' not found"}
+
+        zone_data = await async_load_zone_data(hass, zone_entry.entry_id)
+
+        config = zone_entry.data
+        seasonal_helper = await async_import_helper(hass, "seasonal_helper")
+        helper = seasonal_helper.SeasonalHelper(
+            hass, config.get("grass_type", "Bermuda"), config.get("location", "Unknown"), config.get("weather_entity")
+        )
+        seasonal_info = helper.get_seasonal_summary(zone_data["applications"])
+
+        return {
+            "zone": config.get("yard_zone", "Unknown"),
+            "grass_type": seasonal_info["grass_type"],
+            "season": seasonal_info["season"],
+            "chemical_details": [
+                {"task": chem_name, "priority": chem_info["priority"], "reason": chem_info["reason"]}
+                for chem_name, chem_info in seasonal_info["chemical_recommendations"].items()
+            ],
+            "task_details": [
+                {"task": task["task"], "priority": task["priority"],
+                 "reason": task.get("reason", task.get("deadline", ""))}
+                for task in seasonal_info["task_reminders"]
+            ],
+            "pre_emergent": seasonal_info["pre_emergent"],
+            "scalping": seasonal_info["scalping"],
+            "dethatching": seasonal_info["dethatching"],
+            "aeration": seasonal_info["aeration"],
+        }
 
     # Register all services
-    if not hass.services.has_service(DOMAIN, "add_equipment"):
-        hass.services.async_register(DOMAIN, "add_equipment", handle_add_equipment)
-    if not hass.services.has_service(DOMAIN, "delete_equipment"):
-        hass.services.async_register(DOMAIN, "delete_equipment", handle_delete_equipment)
-    if not hass.services.has_service(DOMAIN, "get_equipment_options"):
-        hass.services.async_register(DOMAIN, "get_equipment_options", handle_get_equipment_options, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "get_zone_options"):
-        hass.services.async_register(DOMAIN, "get_zone_options", handle_get_zone_options, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "list_calculation_options"):
-        hass.services.async_register(DOMAIN, "list_calculation_options", handle_list_calculation_options, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "refresh_equipment_entity"):
-        hass.services.async_register(DOMAIN, "refresh_equipment_entity", handle_refresh_equipment_entity)
-    if not hass.services.has_service(DOMAIN, "calculate_application_rate"):
-        hass.services.async_register(DOMAIN, "calculate_application_rate", handle_calculate_application_rate, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "clear_equipment_storage"):
-        hass.services.async_register(DOMAIN, "clear_equipment_storage", handle_clear_equipment_storage)
-    if not hass.services.has_service(DOMAIN, "add_custom_product"):
-        hass.services.async_register(DOMAIN, "add_custom_product", handle_add_custom_product, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "list_custom_products"):
-        hass.services.async_register(DOMAIN, "list_custom_products", handle_list_custom_products, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "delete_custom_product"):
-        hass.services.async_register(DOMAIN, "delete_custom_product", handle_delete_custom_product, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "log_maintenance"):
-        hass.services.async_register(DOMAIN, "log_maintenance", handle_log_maintenance, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "get_maintenance_log"):
-        hass.services.async_register(DOMAIN, "get_maintenance_log", handle_get_maintenance_log, supports_response=True)
-    if not hass.services.has_service(DOMAIN, "get_activity_history"):
-        hass.services.async_register(DOMAIN, "get_activity_history", handle_get_activity_history, supports_response=True)
+    hass.services.async_register(DOMAIN, "add_equipment", handle_add_equipment)
+    hass.services.async_register(DOMAIN, "delete_equipment", handle_delete_equipment)
+    hass.services.async_register(DOMAIN, "get_equipment_options", handle_get_equipment_options, supports_response=True)
+    hass.services.async_register(DOMAIN, "get_zone_options", handle_get_zone_options, supports_response=True)
+    hass.services.async_register(DOMAIN, "list_calculation_options", handle_list_calculation_options, supports_response=True)
+    hass.services.async_register(DOMAIN, "refresh_equipment_entity", handle_refresh_equipment_entity)
+    hass.services.async_register(DOMAIN, "calculate_application_rate", handle_calculate_application_rate, supports_response=True)
+    hass.services.async_register(DOMAIN, "calculate_rate_matrix", handle_calculate_rate_matrix, supports_response=True)
+    hass.services.async_register(DOMAIN, "clear_equipment_storage", handle_clear_equipment_storage)
+    hass.services.async_register(DOMAIN, "add_custom_product", handle_add_custom_product, supports_response=True)
+    hass.services.async_register(DOMAIN, "list_custom_products", handle_list_custom_products, supports_response=True)
+    hass.services.async_register(DOMAIN, "delete_custom_product", handle_delete_custom_product, supports_response=True)
+    hass.services.async_register(DOMAIN, "log_maintenance", handle_log_maintenance, supports_response=True)
+    hass.services.async_register(DOMAIN, "get_maintenance_log", handle_get_maintenance_log, supports_response=True)
+    hass.services.async_register(DOMAIN, "get_activity_history", handle_get_activity_history, supports_response=True)
+    hass.services.async_register(DOMAIN, "archive_history", handle_archive_history, supports_response=True)
+    hass.services.async_register(DOMAIN, "export_history", handle_export_history, supports_response=True)
+    hass.services.async_register(DOMAIN, "get_seasonal_details", handle_get_seasonal_details, supports_response=True)
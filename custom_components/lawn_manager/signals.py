@@ -0,0 +1,75 @@
+from dataclasses import dataclass, field
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+# Change kinds carried by the zone update signal
+CHANGE_MOW_LOGGED = "mow_logged"
+CHANGE_MOWING_EDITED = "mowing_edited"
+CHANGE_APPLICATION_LOGGED = "application_logged"
+CHANGE_APPLICATION_EDITED = "application_edited"
+CHANGE_RATE_CALCULATED = "rate_calculated"
+
+MOWING_CHANGES = (CHANGE_MOW_LOGGED, CHANGE_MOWING_EDITED)
+APPLICATION_CHANGES = (CHANGE_APPLICATION_LOGGED, CHANGE_APPLICATION_EDITED)
+HISTORY_CHANGES = MOWING_CHANGES + APPLICATION_CHANGES
+
+
+@dataclass(frozen=True)
+class ZoneChangeSet:
+    """What changed in a zone, sent with lawn_manager_update_{entry_id}.
+
+    Subscribers check affects()/affects_chemical() and skip reloading when
+    the change is not theirs. A signal sent without a change-set means
+    "anything may have changed" and every subscriber refreshes.
+    """
+
+    kinds: frozenset = field(default_factory=frozenset)
+    chemicals: frozenset = field(default_factory=frozenset)
+
+    @classmethod
+    def mow_logged(cls) -> "ZoneChangeSet":
+        return cls(frozenset({CHANGE_MOW_LOGGED}))
+
+    @classmethod
+    def application_logged(cls, chemical: str) -> "ZoneChangeSet":
+        return cls(frozenset({CHANGE_APPLICATION_LOGGED}), frozenset({chemical}))
+
+    @classmethod
+    def rate_calculated(cls) -> "ZoneChangeSet":
+        return cls(frozenset({CHANGE_RATE_CALCULATED}))
+
+    @classmethod
+    def history_edited(cls, is_mowing: bool, chemicals=()) -> "ZoneChangeSet":
+        if is_mowing:
+            return cls(frozenset({CHANGE_MOWING_EDITED}))
+        return cls(frozenset({CHANGE_APPLICATION_EDITED}), frozenset(chemicals))
+
+    @classmethod
+    def history_compacted(cls, chemicals=()) -> "ZoneChangeSet":
+        return cls(frozenset({CHANGE_MOWING_EDITED, CHANGE_APPLICATION_EDITED}), frozenset(chemicals))
+
+    def affects(self, *kinds: str) -> bool:
+        return not self.kinds.isdisjoint(kinds)
+
+    def affects_chemical(self, chemical: str) -> bool:
+        return self.affects(*APPLICATION_CHANGES) and chemical in self.chemicals
+
+
+def zone_update_signal(entry_id: str) -> str:
+    return f"lawn_manager_update_{entry_id}"
+
+
+def change_affects(change, *kinds: str) -> bool:
+    """True if a (possibly missing) change-set touches any of the given kinds."""
+    return change is None or change.affects(*kinds)
+
+
+def change_affects_chemical(change, chemical: str) -> bool:
+    return change is None or change.affects_chemical(chemical)
+
+
+@callback
+def async_send_zone_update(hass: HomeAssistant, entry_id: str, change: ZoneChangeSet | None = None) -> None:
+    """Notify a zone's entities; omit the change-set to force a full refresh."""
+    async_dispatcher_send(hass, zone_update_signal(entry_id), change)
@@ -0,0 +1,218 @@
+import json
+import logging
+import sqlite3
+import threading
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, DATA_SQLITE_HISTORY, MAINTENANCE_LOG_STORAGE_KEY, SQLITE_HISTORY_FILENAME, STORAGE_VERSION
+from .history_helper import APPLICATION_HISTORY, HISTORY_KEYS, MONTHLY_ROLLUPS
+from .records import date_to_ordinal
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS zones (
+    zone TEXT PRIMARY KEY,
+    monthly_rollups TEXT
+);
+CREATE TABLE IF NOT EXISTS mowing_history (
+    zone TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date_ordinal INTEGER NOT NULL,
+    record TEXT NOT NULL,
+    PRIMARY KEY (zone, id)
+);
+CREATE INDEX IF NOT EXISTS mowing_history_zone_date ON mowing_history (zone, date_ordinal);
+CREATE TABLE IF NOT EXISTS application_history (
+    zone TEXT NOT NULL,
+    id TEXT NOT NULL,
+    date_ordinal INTEGER NOT NULL,
+    chemical TEXT,
+    record TEXT NOT NULL,
+    PRIMARY KEY (zone, id)
+);
+CREATE INDEX IF NOT EXISTS application_history_zone_date ON application_history (zone, date_ordinal);
+CREATE INDEX IF NOT EXISTS application_history_chemical_date ON application_history (chemical, date_ordinal);
+CREATE TABLE IF NOT EXISTS maintenance_log (
+    id TEXT PRIMARY KEY,
+    date_ordinal INTEGER NOT NULL,
+    equipment TEXT COLLATE NOCASE,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS maintenance_log_date ON maintenance_log (date_ordinal);
+CREATE INDEX IF NOT EXISTS maintenance_log_equipment ON maintenance_log (equipment);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Table names match the zone data keys
+_HISTORY_TABLES = HISTORY_KEYS
+
+
+def _history_row(table: str, zone: str, record: dict) -> tuple:
+    row = (zone, record["id"], date_to_ordinal(record.get("date")))
+    if table == APPLICATION_HISTORY:
+        row += (record.get("chemical"),)
+    return row + (json.dumps(record),)
+
+
+class SqliteHistory:
+    """Zone history and the maintenance log in one SQLite file.
+
+    The optional backend for large installations (history_backend: sqlite
+    in configuration.yaml). Zones are still worked on in memory; what
+    changes is that saving writes only the records that were added,
+    replaced or removed since the last save instead of the zone's whole
+    history document, and the maintenance log is queried instead of
+    loaded. Every call runs in the executor; one connection is shared
+    behind a lock.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str):
+        self.hass = hass
+        self.path = path
+        self._connection = None
+        self._lock = threading.Lock()
+
+    def _open(self) -> None:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        connection.commit()
+        self._connection = connection
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _meta(self, key: str):
+        row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _load_zone(self, zone: str) -> dict | None:
+        with self._lock:
+            row = self._connection.execute("SELECT monthly_rollups FROM zones WHERE zone = ?", (zone,)).fetchone()
+            if row is None:
+                return None
+            history = {
+                table: [
+                    json.loads(record)
+                    for (record,) in self._connection.execute(
+                        f"SELECT record FROM {table} WHERE zone = ? ORDER BY rowid", (zone,)
+                    )
+                ]
+                for table in _HISTORY_TABLES
+            }
+        if row[0]:
+            history[MONTHLY_ROLLUPS] = json.loads(row[0])
+        return history
+
+    def _write_zone(self, zone: str, upserts: dict, deletes: dict, rollups) -> None:
+        with self._lock, self._connection:
+            connection = self._connection
+            connection.execute(
+                "INSERT INTO zones (zone, monthly_rollups) VALUES (?, ?) "
+                "ON CONFLICT (zone) DO UPDATE SET monthly_rollups = excluded.monthly_rollups",
+                (zone, json.dumps(rollups) if rollups else None),
+            )
+            for table in _HISTORY_TABLES:
+                if deletes.get(table):
+                    connection.executemany(
+                        f"DELETE FROM {table} WHERE zone = ? AND id = ?",
+                        [(zone, record_id) for record_id in deletes[table]],
+                    )
+                if not upserts.get(table):
+                    continue
+                if table == APPLICATION_HISTORY:
+                    statement = (
+                        "INSERT INTO application_history (zone, id, date_ordinal, chemical, record) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT (zone, id) DO UPDATE SET date_ordinal = excluded.date_ordinal, "
+                        "chemical = excluded.chemical, record = excluded.record"
+                    )
+                else:
+                    statement = (
+                        "INSERT INTO mowing_history (zone, id, date_ordinal, record) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT (zone, id) DO UPDATE SET date_ordinal = excluded.date_ordinal, record = excluded.record"
+                    )
+                connection.executemany(statement, [_history_row(table, zone, record) for record in upserts[table]])
+
+    def _remove_zone(self, zone: str) -> None:
+        with self._lock, self._connection:
+            for table in (*_HISTORY_TABLES, "zones"):
+                self._connection.execute(f"DELETE FROM {table} WHERE zone = ?", (zone,))
+
+    def _maintenance_entries(self, equipment: str | None, start_ordinal: int, end_ordinal: int) -> list:
+        clauses, parameters = [], []
+        if equipment:
+            clauses.append("equipment = ?")
+            parameters.append(equipment)
+        if start_ordinal:
+            clauses.append("date_ordinal >= ?")
+            parameters.append(start_ordinal)
+        if end_ordinal:
+            clauses.append("date_ordinal <= ?")
+            parameters.append(end_ordinal)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return [
+                json.loads(entry)
+                for (entry,) in self._connection.execute(f"SELECT entry FROM maintenance_log{where} ORDER BY rowid", parameters)
+            ]
+
+    def _add_maintenance(self, entries: list) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO maintenance_log (id, date_ordinal, equipment, entry) VALUES (?, ?, ?, ?)",
+                [(entry["id"], date_to_ordinal(entry.get("date")), entry.get("equipment"), json.dumps(entry)) for entry in entries],
+            )
+
+    def _import_maintenance(self, log: list) -> bool:
+        """Copy the JSON maintenance log in once; False if that already happened."""
+        with self._lock:
+            if self._meta("maintenance_imported"):
+                return False
+        self._add_maintenance([entry for entry in log if entry.get("id")])
+        with self._lock, self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('maintenance_imported', '1')")
+        return True
+
+    async def async_load_zone(self, zone: str) -> dict | None:
+        """A zone's history in its JSON form, or None if the zone was never written here."""
+        return await self.hass.async_add_executor_job(self._load_zone, zone)
+
+    async def async_write_zone(self, zone: str, upserts: dict, deletes: dict, rollups=None) -> None:
+        """Insert or replace some records, delete others by ID and store the zone's rollups, in one transaction."""
+        await self.hass.async_add_executor_job(self._write_zone, zone, upserts, deletes, rollups)
+
+    async def async_remove_zone(self, zone: str) -> None:
+        await self.hass.async_add_executor_job(self._remove_zone, zone)
+
+    async def async_maintenance_entries(self, equipment=None, start_ordinal: int = 0, end_ordinal: int = 0) -> list:
+        return await self.hass.async_add_executor_job(self._maintenance_entries, equipment, start_ordinal, end_ordinal)
+
+    async def async_add_maintenance(self, entry: dict) -> None:
+        await self.hass.async_add_executor_job(self._add_maintenance, [entry])
+
+
+async def async_setup_sqlite_history(hass: HomeAssistant) -> SqliteHistory:
+    """Open the history database and make it the backend for every zone."""
+    history = SqliteHistory(hass, hass.config.path(".storage", SQLITE_HISTORY_FILENAME))
+    await hass.async_add_executor_job(history._open)
+
+    maintenance_data = await Store(hass, STORAGE_VERSION, MAINTENANCE_LOG_STORAGE_KEY).async_load() or {}
+    if await hass.async_add_executor_job(history._import_maintenance, maintenance_data.get("log", [])):
+        _LOGGER.info("Copied the maintenance log into %s", history.path)
+
+    async def _async_close(_event) -> None:
+        await hass.async_add_executor_job(history._close)
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close)
+    hass.data.setdefault(DOMAIN, {})[DATA_SQLITE_HISTORY] = history
+    return history
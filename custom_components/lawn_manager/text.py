@@ -3,38 +3,53 @@ from homeassistant.core import HomeAssistant
 from homeassistant.config_entries import ConfigEntry
 import logging
 
-from .const import DOMAIN
+from .const import CONF_FEATURE_CHEMICALS
+from .control_panel import (
+    ControlScope, async_add_shared_entities, async_add_zone_controls, async_remove_zone_controls, uses_shared_controls,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+CONTROL_SUFFIXES = ("custom_chemical_name", "custom_rate_multiplier")
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up text entities for Lawn Manager."""
-    entities = [
-        CustomChemicalTextEntity(hass, entry),
-        CustomRateTextEntity(hass, entry),
-    ]
-    async_add_entities(entities)
+    if uses_shared_controls(entry):
+        async_remove_zone_controls(hass, entry, "text", CONTROL_SUFFIXES)
+        async_add_shared_entities(
+            hass, entry, "control_panel_text", async_add_entities,
+            lambda: _control_entities(hass, ControlScope.control_panel()),
+        )
+        return
+
+    async_add_zone_controls(
+        hass, entry, "text", CONTROL_SUFFIXES, async_add_entities, _control_entities(hass, ControlScope.for_zone(entry))
+    )
+
+
+def _control_entities(hass, scope):
+    entities = [CustomChemicalTextEntity(hass, scope)]
+    # Custom rates only apply when logging; the rate calculator plans with label rates
+    if scope.has_feature(CONF_FEATURE_CHEMICALS):
+        entities.append(CustomRateTextEntity(hass, scope))
+    return entities
 
 
 class CustomChemicalTextEntity(TextEntity):
     """Text entity for custom chemical name."""
 
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Custom Chemical Name"
-        self._attr_unique_id = f"{entry.entry_id}_custom_chemical_name"
+        self._attr_unique_id = scope.unique_id("custom_chemical_name")
         self._attr_native_value = ""
         self._attr_icon = "mdi:flask-empty-outline"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     async def async_set_value(self, value: str) -> None:
         self._attr_native_value = value
@@ -49,22 +64,17 @@ class CustomRateTextEntity(TextEntity):
     When Custom Rate Unit is 'lb per 1,000 sq ft', this is a lb amount.
     """
 
-    def __init__(self, hass, entry):
+    def __init__(self, hass, scope):
         self._hass = hass
-        self._entry = entry
+        self._scope = scope
         self._attr_name = "Custom Rate Value"
-        self._attr_unique_id = f"{entry.entry_id}_custom_rate_multiplier"
+        self._attr_unique_id = scope.unique_id("custom_rate_multiplier")
         self._attr_native_value = "1.0"
         self._attr_icon = "mdi:calculator"
 
     @property
     def device_info(self):
-        return {
-            "identifiers": {(DOMAIN, self._entry.entry_id)},
-            "name": self._entry.data.get("yard_zone", "Lawn Manager"),
-            "manufacturer": "Lawn Manager",
-            "model": "Chemical Application",
-        }
+        return self._scope.device_info("Chemical Application")
 
     @property
     def extra_state_attributes(self):
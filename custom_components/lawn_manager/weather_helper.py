@@ -1,5 +1,7 @@
 import logging
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +24,6 @@ class WeatherHelper:
             return
 
         try:
-            from homeassistant.helpers import entity_registry as er
             ent_reg = er.async_get(self.hass)
         except Exception:
             return
@@ -328,17 +329,11 @@ class WeatherHelper:
         for i, item in enumerate(forecast[:8]):
             condition = item.get('condition', '').lower()
             if condition in ['rainy', 'pouring', 'thunderstorm']:
-                datetime_str = item.get('datetime', '')
-                if datetime_str:
-                    try:
-                        from datetime import datetime
-                        import dateutil.parser
-                        forecast_time = dateutil.parser.parse(datetime_str)
-                        current_time = datetime.now(forecast_time.tzinfo)
-                        hours_until = (forecast_time - current_time).total_seconds() / 3600
-                        return max(0, hours_until)
-                    except Exception:
-                        pass
+                # Forecast times are ISO 8601; naive ones are in HA's time zone
+                forecast_time = dt_util.parse_datetime(str(item.get('datetime') or ''))
+                if forecast_time:
+                    hours_until = (dt_util.as_utc(forecast_time) - dt_util.utcnow()).total_seconds() / 3600
+                    return max(0, hours_until)
                 return i * 3
 
         return 24.0
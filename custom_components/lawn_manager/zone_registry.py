@@ -0,0 +1,46 @@
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, DATA_SQLITE_HISTORY
+
+
+@callback
+def get_loaded_zone(hass: HomeAssistant, entry_id: str) -> dict | None:
+    """The in-memory state of a set-up zone (store, data, index, materializer), or None."""
+    if not entry_id:
+        return None
+    return hass.data.get(DOMAIN, {}).get(entry_id)
+
+
+@callback
+def get_sqlite_history(hass: HomeAssistant):
+    """The SqliteHistory backend, or None when history is kept in JSON stores.
+
+    Looked up here so the JSON backend never imports sqlite_history (and
+    sqlite3); async_setup only imports it when the backend is configured.
+    """
+    return hass.data.get(DOMAIN, {}).get(DATA_SQLITE_HISTORY)
+
+
+@callback
+def async_get_zone_entry(hass: HomeAssistant, zone: str) -> ConfigEntry | None:
+    """The config entry of a zone given as its entry ID or its yard_zone name.
+
+    Services are registered once for the whole integration, so every
+    handler resolves the zone it was called for here instead of relying
+    on the entry that was being set up when it was registered.
+    """
+    if not zone:
+        return None
+    entry = hass.config_entries.async_get_entry(zone)
+    if entry is not None and entry.domain == DOMAIN:
+        return entry
+    return next(
+        (entry for entry in hass.config_entries.async_entries(DOMAIN) if entry.data.get("yard_zone") == zone), None
+    )
+
+
+@callback
+def async_zone_names(hass: HomeAssistant) -> list:
+    """yard_zone names of every configured zone, for error messages."""
+    return [entry.data.get("yard_zone", "?") for entry in hass.config_entries.async_entries(DOMAIN)]
@@ -0,0 +1,182 @@
+import asyncio
+import logging
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from .const import LEGACY_STORAGE_KEY, STORAGE_VERSION, get_history_storage_key, get_storage_key
+from .history_helper import HISTORY_KEYS, MONTHLY_ROLLUPS
+from .migrations import HISTORY_MIGRATIONS, STATE_MIGRATIONS, ZoneFileStore, migrate_zone_file, new_zone_data
+from .records import records_from_json, records_to_json
+from .zone_registry import get_loaded_zone, get_sqlite_history
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keys kept in the history file rather than the state file
+HISTORY_FILE_KEYS = (*HISTORY_KEYS, MONTHLY_ROLLUPS)
+
+
+class ZoneStore:
+    """A zone's data, split over a small state file and a history file.
+
+    The state file (last_mow, applications, last_rate_calculation, ...) is
+    what changes often; the history lists only change when activities are
+    logged or edited. In memory the zone is still one dict, and this class
+    decides which file each key is written to, so saving a rate
+    calculation no longer rewrites the zone's whole history. History
+    lists hold MowRecord/ApplicationRecord objects in memory and their
+    JSON form on disk.
+
+    With the SQLite history backend the history lives in the database
+    instead of the history file. The store then remembers which record
+    objects it last wrote and saves only the difference.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str):
+        self.entry_id = entry_id
+        self.hass = hass
+        self._state_store = ZoneFileStore(hass, get_storage_key(entry_id), STATE_MIGRATIONS)
+        self._history_store = ZoneFileStore(hass, get_history_storage_key(entry_id), HISTORY_MIGRATIONS)
+        self._sqlite = get_sqlite_history(hass)
+        # history key -> {record ID: record object} as last written to SQLite
+        self._written_records = {}
+        self._write_lock = asyncio.Lock()
+
+    async def async_load(self, read_only: bool = False) -> dict | None:
+        """Load both files as one dict, or None if the zone has no data yet.
+
+        Both files are migrated to ZONE_STORAGE_VERSION as they are read,
+        so the result always has the keys of new_zone_data(). With
+        read_only, older layouts and history not yet in the database are
+        read where they are instead of being moved, and nothing is written.
+        """
+        state = await (self._state_store.async_load_read_only() if read_only else self._state_store.async_load())
+        history = await self._sqlite.async_load_zone(self.entry_id) if self._sqlite else None
+        import_history = self._sqlite is not None and history is None and not read_only
+        if history is None:
+            history = await self._async_load_history_file(state, read_only)
+        if state is None and not history:
+            state, history = await self._async_adopt_shared_file(read_only)
+            if state is None:
+                return None
+
+        data = new_zone_data()
+        data.update((key, value) for key, value in (state or {}).items() if key not in HISTORY_FILE_KEYS)
+        for key, records in (history or {}).items():
+            data[key] = records_from_json(key, records) if key in HISTORY_KEYS else records
+
+        if import_history:
+            # First load with the SQLite backend: copy the JSON history in.
+            # The history file is left as it was.
+            _LOGGER.info("Copying zone %s history into the history database", self.entry_id)
+            await self._async_write_history(data)
+        elif self._sqlite and not read_only:
+            self._remember_written(data)
+        return data
+
+    async def _async_load_history_file(self, state: dict | None, read_only: bool) -> dict | None:
+        history = await (self._history_store.async_load_read_only() if read_only else self._history_store.async_load())
+        if history is None and state:
+            # Written before the split: everything is still in the state file
+            history = {key: state[key] for key in HISTORY_KEYS if key in state}
+            if history and not read_only:
+                await self._async_split_legacy_file(state, history)
+        return history
+
+    async def _async_adopt_shared_file(self, read_only: bool):
+        """Take over the lawn_manager_data file from before data was kept per zone.
+
+        The first zone loaded without data of its own gets it; the shared
+        file is removed afterwards. Returns (state, history), both None if
+        there is no such file. A read_only load only reads it.
+        """
+        shared_store = Store(self.hass, STORAGE_VERSION, LEGACY_STORAGE_KEY)
+        shared = await shared_store.async_load()
+        if not shared:
+            return None, None
+
+        shared = migrate_zone_file(STATE_MIGRATIONS, STORAGE_VERSION, shared)
+        history = {key: shared[key] for key in HISTORY_KEYS if key in shared}
+        if read_only:
+            return shared, history
+
+        _LOGGER.info("Moving the shared %s file into zone %s", LEGACY_STORAGE_KEY, self.entry_id)
+        await self._history_store.async_save(history)
+        await self._state_store.async_save(_state_payload(shared))
+        await shared_store.async_remove()
+        return shared, history
+
+    async def _async_split_legacy_file(self, state: dict, history: dict) -> None:
+        _LOGGER.info("Moving zone %s history into its own storage file", self.entry_id)
+        # History first: if interrupted, the next load still finds it in the state file
+        await self._history_store.async_save(history)
+        await self._state_store.async_save(_state_payload(state))
+
+    async def async_save(self, data: dict) -> None:
+        """Save a change to the history lists and the state derived from them."""
+        if self._sqlite:
+            await self._async_write_history(data)
+        else:
+            await self._history_store.async_save(_history_payload(data))
+        await self._state_store.async_save(_state_payload(data))
+
+    async def async_save_state(self, data: dict) -> None:
+        """Save a change that touches no history, e.g. a rate calculation."""
+        await self._state_store.async_save(_state_payload(data))
+
+    async def async_remove(self) -> None:
+        await self._state_store.async_remove()
+        await self._history_store.async_remove()
+        if self._sqlite:
+            await self._sqlite.async_remove_zone(self.entry_id)
+
+    def _remember_written(self, data: dict) -> None:
+        self._written_records = {key: {record.id: record for record in data[key]} for key in HISTORY_KEYS}
+
+    async def _async_write_history(self, data: dict) -> None:
+        """Write the records added, replaced or removed since the last write to SQLite.
+
+        Records are never changed in place (edits swap in a new object),
+        so a record whose object is not the one last written is new or
+        edited. Writes are serialized so two saves cannot reorder.
+        """
+        async with self._write_lock:
+            upserts, deletes, written = {}, {}, {}
+            for key in HISTORY_KEYS:
+                previous = self._written_records.get(key, {})
+                current = {}
+                for record in data[key]:
+                    current[record.id] = record
+                upserts[key] = [record.as_dict() for record_id, record in current.items() if previous.get(record_id) is not record]
+                deletes[key] = [record_id for record_id in previous if record_id not in current]
+                written[key] = current
+            await self._sqlite.async_write_zone(self.entry_id, upserts, deletes, data.get(MONTHLY_ROLLUPS))
+            self._written_records = written
+
+
+def _state_payload(data: dict) -> dict:
+    return {key: value for key, value in data.items() if key not in HISTORY_FILE_KEYS}
+
+
+def _history_payload(data: dict) -> dict:
+    payload = {key: records_to_json(data[key]) for key in HISTORY_KEYS}
+    if MONTHLY_ROLLUPS in data:
+        payload[MONTHLY_ROLLUPS] = data[MONTHLY_ROLLUPS]
+    return payload
+
+
+async def async_get_zone_store(hass: HomeAssistant, entry_id: str):
+    """(store, data) for a zone: the loaded copy, or read from disk if the zone is not loaded."""
+    zone_info = get_loaded_zone(hass, entry_id)
+    if zone_info:
+        return zone_info["store"], zone_info["data"]
+    store = ZoneStore(hass, entry_id)
+    return store, await store.async_load() or new_zone_data()
+
+
+async def async_load_zone_data(hass: HomeAssistant, entry_id: str) -> dict:
+    """A zone's data for reading: the loaded copy, or read from disk without writing anything."""
+    zone_info = get_loaded_zone(hass, entry_id)
+    if zone_info:
+        return zone_info["data"]
+    return await ZoneStore(hass, entry_id).async_load(read_only=True) or new_zone_data()